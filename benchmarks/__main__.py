@@ -0,0 +1,129 @@
+"""
+Runs the benchmark suite of typemock's hot paths, and optionally compares the results against a saved baseline.
+
+Run with:
+
+    python -m benchmarks
+
+Options:
+
+    --quick                Skip the slowest benchmarks.
+    --only TEXT            Only run the benchmarks whose name contains the text.
+    --json PATH            Write the results to a JSON file.
+    --save-baseline PATH   Write the results to a baseline, to compare later runs against.
+    --baseline PATH        Compare against a baseline, exiting with status 1 if any benchmark regressed.
+    --tolerance RATIO      How much slower than the baseline a benchmark may be before it counts as a regression.
+                           Defaults to 0.25, that is, 25% slower.
+
+Timings depend on the machine, so a baseline is only compared against on the same Python and machine as it was
+saved on. Otherwise, the run exits with status 2.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Any
+
+from benchmarks import hot_paths
+
+
+def _environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+    }
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], tolerance: float
+) -> list[dict[str, Any]]:
+    """
+    Each result, with the ratio of its time to that of the baseline, and whether it regressed beyond the tolerance.
+    Results with no baseline have a ratio of None.
+    """
+    baseline_ns = {result["name"]: result["ns_per_op"] for result in baseline}
+    compared: list[dict[str, Any]] = []
+    for result in results:
+        before = baseline_ns.get(result["name"])
+        ratio = result["ns_per_op"] / before if before else None
+        compared.append(
+            {
+                **result,
+                "baseline_ns_per_op": before,
+                "ratio": ratio,
+                "regressed": ratio is not None and ratio > 1 + tolerance,
+            }
+        )
+    return compared
+
+
+def _print(results: list[dict[str, Any]]) -> None:
+    print(
+        "{:>44} {:>8} {:>14} {:>14} {:>8}".format("benchmark", "ops", "ns/op", "baseline", "ratio")
+    )
+    for result in results:
+        baseline = result.get("baseline_ns_per_op")
+        ratio = result.get("ratio")
+        print(
+            "{:>44} {:>8} {:>14,.0f} {:>14} {:>8}{}".format(
+                result["name"],
+                result["ops"],
+                result["ns_per_op"],
+                "-" if baseline is None else "{:,.0f}".format(baseline),
+                "-" if ratio is None else "{:.2f}x".format(ratio),
+                "  REGRESSED" if result.get("regressed") else "",
+            )
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("--quick", action="store_true")
+    parser.add_argument("--only")
+    parser.add_argument("--json", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = hot_paths.run(quick=args.quick, only=args.only)
+    environment = _environment()
+    report = {"environment": environment, "results": results}
+
+    if args.save_baseline is not None:
+        args.save_baseline.write_text(json.dumps(report, indent=2) + "\n")
+        _print(results)
+        print("Saved baseline to {}".format(args.save_baseline))
+        return 0
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("environment") != environment:
+            _print(results)
+            print(
+                "Not comparing against {}, which was saved on {}, rather than {}.".format(
+                    args.baseline, baseline.get("environment"), environment
+                )
+            )
+            return 2
+        results = compare(results, baseline["results"], args.tolerance)
+        report["results"] = results
+    _print(results)
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2) + "\n")
+
+    regressed = [result["name"] for result in results if result.get("regressed")]
+    if regressed:
+        print("{} benchmark(s) regressed: {}".format(len(regressed), ", ".join(regressed)))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""
+Cost of typemock's own hot paths:
+
+- making a mock of a class with 10, 100 and 1000 members,
+- calling a method with 1, 100 and 10k stubs of concrete args, and with stubs of matchers,
+- checking a value against common shapes of type hint, with each type check backend,
+- getting and setting an attribute,
+- calling an async method, compared with a sync one, and with a profiled one,
+- verifying, and counting calls, against logs of 10, 10k and 1M calls.
+
+Each result is the best of a few rounds, in nanoseconds per operation. The suite is run, and compared against a
+stored baseline, by `python -m benchmarks`. It can also be run on its own with:
+
+    python -m benchmarks.hot_paths
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.type_check import HINTS
+from typemock import calls, match, profile, setup_mock, tmock, verify, when
+from typemock._typecheck import checker_for
+from typemock.api import TypeCheckBackend
+
+ROUNDS = 5
+
+type Benchmark = tuple[str, int, Callable[[int], Any]]
+
+
+class Service:
+    name: str = "service"
+
+    def get(self, key: int) -> int:
+        return key
+
+    async def fetch(self, key: int) -> int:
+        return key
+
+
+def _wide_class(members: int) -> type:
+    """
+    A class with half of the given number of members as methods, and half as attributes.
+    """
+    lines = ["class Wide{}:".format(members)]
+    for i in range(members // 2):
+        lines.append("    attribute_{}: int = 0".format(i))
+    for i in range(members - members // 2):
+        lines.append("    def method_{}(self, key: int) -> int:".format(i))
+        lines.append("        return key")
+    namespace: dict[str, Any] = {"__name__": __name__}
+    exec("\n".join(lines), namespace)
+    return namespace["Wide{}".format(members)]
+
+
+def _time(ops: int, operation: Callable[[int], Any]) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter_ns()
+        for i in range(ops):
+            operation(i)
+        best = min(best, (time.perf_counter_ns() - start) / ops)
+    return best
+
+
+def _construction() -> list[Benchmark]:
+    benchmarks: list[Benchmark] = []
+    for members in (10, 100, 1000):
+        cls = _wide_class(members)
+        benchmarks.append(
+            (
+                "construct/{}_members".format(members),
+                max(1, 2000 // members),
+                lambda _, c=cls: tmock(c),
+            )
+        )
+    return benchmarks
+
+
+def _stubbed(stubs: int, matcher: Callable[[int], Any] | None = None) -> Service:
+    mock = tmock(Service, thread_safe=False)
+    with setup_mock(mock):
+        for i in range(stubs):
+            when(mock.get(matcher(i) if matcher else i)).then_return(i)
+    return mock
+
+
+def _lookup() -> list[Benchmark]:
+    benchmarks: list[Benchmark] = []
+    for stubs in (1, 100, 10_000):
+        mock = _stubbed(stubs)
+        key = stubs - 1
+        benchmarks.append(
+            ("response_for/{}_stubs".format(stubs), 20_000, lambda _, m=mock, k=key: m.get(k))
+        )
+    indexed = _stubbed(100, lambda i: match.one_of([i * 10, i * 10 + 1]))
+    benchmarks.append(("response_for/100_indexed_matchers", 20_000, lambda _: indexed.get(990)))
+    scanned = _stubbed(100, lambda i: match.between(i * 10, i * 10 + 9))
+    benchmarks.append(("response_for/100_scanned_matchers", 2_000, lambda _: scanned.get(995)))
+    return benchmarks
+
+
+def _type_checks() -> list[Benchmark]:
+    benchmarks: list[Benchmark] = []
+    for backend in (TypeCheckBackend.TYPEGUARD, TypeCheckBackend.COMPILED):
+        for name, hint, value in HINTS:
+            check = checker_for(hint, backend)
+            benchmarks.append(
+                (
+                    "type_check/{}/{}".format(backend.name.lower(), name),
+                    20_000,
+                    lambda _, c=check, v=value: c(v),
+                )
+            )
+    return benchmarks
+
+
+def _attributes() -> list[Benchmark]:
+    mock = tmock(Service, thread_safe=False)
+
+    def set_name(_: int) -> None:
+        mock.name = "a"
+
+    return [
+        ("attribute/get", 50_000, lambda _: mock.name),
+        ("attribute/set", 50_000, set_name),
+    ]
+
+
+def _async_calls() -> list[Benchmark]:
+    mock = tmock(Service, thread_safe=False)
+    calls_per_run = 1000
+
+    async def stub() -> None:
+        with setup_mock(mock):
+            when(mock.get(1)).then_return(1)
+            when(await mock.fetch(1)).then_return(1)
+
+    async def fetch_many() -> None:
+        for _ in range(calls_per_run):
+            await mock.fetch(1)
+
+    def sync_many(_: int) -> None:
+        for _ in range(calls_per_run):
+            mock.get(1)
+
+    def profiled_many(_: int) -> None:
+        with profile():
+            sync_many(0)
+
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(stub())
+    return [
+        ("call/sync_x1000", 20, sync_many),
+        ("call/sync_x1000_profiled", 20, profiled_many),
+        ("call/async_x1000", 20, lambda _: loop.run_until_complete(fetch_many())),
+    ]
+
+
+def _verification(call_logs: tuple[int, ...]) -> list[Benchmark]:
+    benchmarks: list[Benchmark] = []
+    for logged in call_logs:
+        mock = tmock(Service, thread_safe=False)
+        with setup_mock(mock):
+            when(mock.get(match.anything())).then_return(0)
+        for i in range(logged):
+            mock.get(i % 100)
+        ops = max(1, 100_000 // logged)
+        benchmarks.extend(
+            [
+                (
+                    "verify/{}_calls/exact_arg".format(logged),
+                    ops,
+                    lambda _, m=mock: verify(m).get(1),
+                ),
+                (
+                    "verify/{}_calls/matcher".format(logged),
+                    ops,
+                    lambda _, m=mock, n=logged: verify(m, exactly=n).get(match.anything()),
+                ),
+                (
+                    "calls/{}_calls/call_count".format(logged),
+                    ops,
+                    lambda _, m=mock: calls(m).get.call_count,
+                ),
+            ]
+        )
+    return benchmarks
+
+
+def benchmarks(quick: bool = False) -> list[Benchmark]:
+    """
+    Every benchmark of the suite, as (name, operations per round, operation). Quick runs skip the 1M call log.
+    """
+    return (
+        _construction()
+        + _lookup()
+        + _type_checks()
+        + _attributes()
+        + _async_calls()
+        + _verification((10, 10_000) if quick else (10, 10_000, 1_000_000))
+    )
+
+
+def run(quick: bool = False, only: str | None = None) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for name, ops, operation in benchmarks(quick):
+        if only is not None and only not in name:
+            continue
+        results.append({"name": name, "ops": ops, "ns_per_op": _time(ops, operation)})
+    return results
+
+
+def main() -> None:
+    print("{:>44} {:>8} {:>14}".format("benchmark", "ops", "ns/op"))
+    for result in run():
+        print("{name:>44} {ops:>8} {ns_per_op:>14,.0f}".format(**result))
+
+
+if __name__ == "__main__":
+    main()
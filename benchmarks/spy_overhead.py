@@ -0,0 +1,82 @@
+"""
+Overhead of calling through a spy, compared with calling the real object directly.
+
+Spies delegate through a function generated for each method of the spied class, which takes the same parameters as
+the method, so the key of a call is built without binding its args to the signature. This compares the cost per
+call of:
+
+- calling the real object directly,
+- a spied call forwarded to the real object,
+- a spied call with stubbed behaviour,
+- a call to a plain mock, for reference.
+
+Run with:
+
+    python -m benchmarks.spy_overhead
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from typemock import setup_mock, tmock, tspy, when
+
+CALLS = 100_000
+
+
+class Service:
+    def lookup(self, key: int, default: str = "") -> str:
+        return default
+
+
+def _time(call: Callable[[int], Any]) -> float:
+    start = time.perf_counter_ns()
+    for i in range(CALLS):
+        call(i)
+    return (time.perf_counter_ns() - start) / CALLS
+
+
+def run() -> list[dict[str, Any]]:
+    real = Service()
+
+    forwarding_spy = tspy(Service(), thread_safe=False)
+
+    stubbed_spy = tspy(Service(), thread_safe=False)
+    with setup_mock(stubbed_spy):
+        when(stubbed_spy.lookup(1)).then_return("one")
+
+    mock = tmock(Service, thread_safe=False)
+    with setup_mock(mock):
+        when(mock.lookup(1)).then_return("one")
+
+    cases: list[tuple[str, Callable[[int], Any]]] = [
+        ("direct", lambda i: real.lookup(i)),
+        ("spy forwarded", lambda i: forwarding_spy.lookup(i)),
+        ("spy stubbed", lambda _: stubbed_spy.lookup(1)),
+        ("mock", lambda _: mock.lookup(1)),
+    ]
+    direct_ns = None
+    results: list[dict[str, Any]] = []
+    for name, call in cases:
+        ns_per_call = _time(call)
+        if direct_ns is None:
+            direct_ns = ns_per_call
+        results.append(
+            {
+                "case": name,
+                "calls": CALLS,
+                "ns_per_call": ns_per_call,
+                "relative": ns_per_call / direct_ns,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    print("{:>14} {:>10} {:>12} {:>9}".format("case", "calls", "ns/call", "relative"))
+    for result in run():
+        print("{case:>14} {calls:>10} {ns_per_call:>12,.0f} {relative:>8.1f}x".format(**result))
+
+
+if __name__ == "__main__":
+    main()
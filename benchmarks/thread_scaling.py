@@ -0,0 +1,89 @@
+"""
+Throughput of a single thread safe mock hammered by an increasing number of threads.
+
+On a free-threaded build of Python (3.13t, 3.14t) the lookup of specified behaviour is lock free and calls are
+recorded into per thread logs, so throughput should scale close to linearly with the number of threads. With the
+GIL, throughput stays roughly flat.
+
+Run with:
+
+    python -m benchmarks.thread_scaling
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from typemock import match, setup_mock, tmock, when
+from typemock._utils import gil_enabled
+
+CALLS_PER_THREAD = 20_000
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+class Service:
+    def lookup(self, key: int) -> int:
+        pass
+
+
+def _mock(thread_safe: bool) -> Service:
+    mock = tmock(Service, thread_safe=thread_safe)
+    with setup_mock(mock):
+        when(mock.lookup(match.anything())).then_return(1)
+    return mock
+
+
+def _hammer(mock: Service, threads: int) -> float:
+    def work(_: int) -> None:
+        for i in range(CALLS_PER_THREAD):
+            mock.lookup(i)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(work, range(threads)))
+    return time.perf_counter() - start
+
+
+def run() -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for thread_safe in (False, True):
+        if not thread_safe:
+            counts: tuple[int, ...] = (1,)
+        else:
+            counts = THREAD_COUNTS
+        single_thread_rate = None
+        for threads in counts:
+            elapsed = _hammer(_mock(thread_safe), threads)
+            calls = threads * CALLS_PER_THREAD
+            rate = calls / elapsed
+            if single_thread_rate is None:
+                single_thread_rate = rate
+            results.append(
+                {
+                    "thread_safe": thread_safe,
+                    "threads": threads,
+                    "calls": calls,
+                    "seconds": elapsed,
+                    "calls_per_second": rate,
+                    "scaling": rate / single_thread_rate,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    print("GIL enabled: {}".format(gil_enabled()))
+    print(
+        "{:>12} {:>8} {:>10} {:>16} {:>8}".format(
+            "thread_safe", "threads", "calls", "calls/second", "scaling"
+        )
+    )
+    for result in run():
+        print(
+            "{thread_safe!s:>12} {threads:>8} {calls:>10} {calls_per_second:>16,.0f} "
+            "{scaling:>7.2f}x".format(**result)
+        )
+
+
+if __name__ == "__main__":
+    main()
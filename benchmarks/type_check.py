@@ -0,0 +1,73 @@
+"""
+Cost of checking a value against common shapes of type hint, with each type check backend.
+
+Run with:
+
+    python -m benchmarks.type_check
+"""
+
+import time
+from typing import Any, Literal, Optional
+
+from typemock._typecheck import checker_for
+from typemock.api import TypeCheckBackend
+
+CHECKS = 20_000
+
+
+class Entity:
+    pass
+
+
+HINTS: list[tuple[str, Any, Any]] = [
+    ("Any", Any, 1),
+    ("int", int, 1),
+    ("class", Entity, Entity()),
+    ("Optional[str]", Optional[str], None),
+    ("int | str | None", int | str | None, "a"),
+    ("Literal", Literal["GET", "POST"], "POST"),
+    ("list[str]", list[str], ["a", "b"]),
+    ("dict[str, int]", dict[str, int], {"a": 1}),
+]
+
+
+def _time(hint: Any, value: Any, backend: TypeCheckBackend) -> float:
+    check = checker_for(hint, backend)
+    start = time.perf_counter_ns()
+    for _ in range(CHECKS):
+        check(value)
+    return (time.perf_counter_ns() - start) / CHECKS
+
+
+def run() -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for name, hint, value in HINTS:
+        typeguard_ns = _time(hint, value, TypeCheckBackend.TYPEGUARD)
+        compiled_ns = _time(hint, value, TypeCheckBackend.COMPILED)
+        results.append(
+            {
+                "hint": name,
+                "checks": CHECKS,
+                "typeguard_ns": typeguard_ns,
+                "compiled_ns": compiled_ns,
+                "speedup": typeguard_ns / compiled_ns,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    print(
+        "{:>18} {:>10} {:>14} {:>14} {:>8}".format(
+            "hint", "checks", "typeguard ns", "compiled ns", "speedup"
+        )
+    )
+    for result in run():
+        print(
+            "{hint:>18} {checks:>10} {typeguard_ns:>14,.0f} {compiled_ns:>14,.0f} "
+            "{speedup:>7.1f}x".format(**result)
+        )
+
+
+if __name__ == "__main__":
+    main()
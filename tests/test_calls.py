@@ -212,3 +212,11 @@ class TestAssertCalledOnceWith(TestCase):
 
         with self.assertRaises(VerifyError):
             calls(mock).with_args.assert_called_once_with("wrong", 99)
+
+
+class TestCallsWrapper(TestCase):
+    def test_calls__wrapper_and_call_info_reused(self):
+        mock = tmock(MyThing)
+
+        self.assertIs(calls(mock), calls(mock))
+        self.assertIs(calls(mock).no_args, calls(mock).no_args)
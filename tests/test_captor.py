@@ -0,0 +1,114 @@
+from unittest import TestCase
+
+from typemock import expect, expect_all, match, tmock, tspy, verify, when
+from typemock.api import MockingError
+
+
+class Database:
+    def execute(self, sql: str, timeout: int = 10) -> int:
+        return len(sql)
+
+
+class TestCaptor(TestCase):
+    def test_captor__in_when(self):
+        sql = match.captor[str]()
+        with tmock(Database) as db:
+            when(db.execute(sql, 10)).then_return(1)
+            when(db.execute(match.anything(), 20)).then_return(2)
+
+        db.execute("SELECT 1")
+        db.execute("SELECT 2", timeout=20)
+        db.execute("SELECT 3", 10)
+
+        self.assertEqual(["SELECT 1", "SELECT 3"], sql.values)
+        self.assertEqual("SELECT 3", sql.value)
+
+    def test_captor__respecified(self):
+        sql = match.captor[str]()
+        db = tmock(Database)
+        for result in range(3):
+            with db:
+                when(db.execute(sql, 10)).then_return(result)
+
+        self.assertEqual(2, db.execute("SELECT 1"))
+        self.assertEqual(["SELECT 1"], sql.values)
+        self.assertEqual(1, len(db._mock_method_states_by_name["execute"]._captor_stubs))  # type: ignore[attr-defined]
+
+    def test_captor__only_captures_whole_matches(self):
+        sql = match.captor[str]()
+        with tmock(Database) as db:
+            when(db.execute(match.anything(), match.anything())).then_return(1)
+
+        db.execute("SELECT 1", timeout=5)
+        db.execute("SELECT 2")
+
+        verify(db).execute(sql, 10)
+
+        self.assertEqual(["SELECT 2"], sql.values)
+
+    def test_captor__in_verify(self):
+        sql = match.captor[str]()
+        with tmock(Database) as db:
+            when(db.execute(match.anything())).then_return(1)
+
+        db.execute("SELECT 1")
+        db.execute("SELECT 2")
+
+        verify(db, exactly=2).execute(sql)
+
+        self.assertEqual(["SELECT 1", "SELECT 2"], sql.values)
+
+    def test_captor__in_expect(self):
+        sql = match.captor[str]()
+        with tmock(Database) as db:
+            when(db.execute(match.anything())).then_return(1)
+
+        db.execute("SELECT 1")
+
+        expect_all(db, [expect(db).execute(sql)])
+
+        self.assertEqual(["SELECT 1"], sql.values)
+
+    def test_captor__matching(self):
+        inserts = match.captor[str](matching=match.has_prefix("INSERT"))
+        with tmock(Database) as db:
+            when(db.execute(match.anything())).then_return(2)
+            when(db.execute(inserts)).then_return(1)
+
+        self.assertEqual(2, db.execute("SELECT 1"))
+        self.assertEqual(1, db.execute("INSERT 1"))
+        self.assertEqual(["INSERT 1"], inserts.values)
+
+    def test_captor__bounded(self):
+        first = match.captor[str](first=2)
+        last = match.captor[str](last=2)
+        with tmock(Database) as db:
+            when(db.execute(match.anything())).then_return(1)
+
+        for i in range(5):
+            db.execute(str(i))
+
+        verify(db, exactly=5).execute(first)
+        verify(db, exactly=5).execute(last)
+
+        self.assertEqual(["0", "1"], first.values)
+        self.assertEqual(["3", "4"], last.values)
+        self.assertEqual(2, len(last))
+
+    def test_captor__spy(self):
+        sql = match.captor[str]()
+        with tspy(Database()) as db:
+            when(db.execute(sql)).then_return(0)
+
+        self.assertEqual(0, db.execute("SELECT 1"))
+        self.assertEqual(["SELECT 1"], sql.values)
+
+    def test_captor__nothing_captured(self):
+        with self.assertRaises(MockingError):
+            match.captor[str]().value
+
+    def test_captor__invalid_capacity(self):
+        with self.assertRaises(MockingError):
+            match.captor(first=1, last=1)
+        with self.assertRaises(MockingError):
+            match.captor(last=0)
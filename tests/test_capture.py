@@ -0,0 +1,174 @@
+import threading
+from unittest import TestCase
+
+from typemock import (
+    calls,
+    match,
+    setup_mock,
+    tmock,
+    verify,
+    verify_no_more_interactions,
+    when,
+)
+from typemock._mock.capture import ArgDigest
+from typemock.api import CapturePolicy, VerifyError
+
+
+class MyThing:
+    def send(self, payload: bytes) -> None:
+        pass
+
+    def store(self, items: list[list[str]]) -> None:
+        pass
+
+    def put(self, value: object) -> None:
+        pass
+
+
+def _mock(**kwargs) -> MyThing:
+    mock = tmock(MyThing, **kwargs)
+    with setup_mock(mock):
+        when(mock.send(match.anything())).then_return(None)
+        when(mock.store(match.anything())).then_return(None)
+        when(mock.put(match.anything())).then_return(None)
+    return mock
+
+
+class TestCapturePolicy(TestCase):
+    def test_ref__sees_later_mutation(self):
+        mock = _mock()
+        items = [["a"]]
+
+        mock.store(items)
+        items.append(["b"])
+
+        verify(mock).store([["a"], ["b"]])
+
+    def test_shallow_copy__snapshot_of_top_level(self):
+        mock = _mock(capture=CapturePolicy.SHALLOW_COPY)
+        items = [["a"]]
+
+        mock.store(items)
+        items.append(["b"])
+        items[0].append("c")
+
+        verify(mock).store([["a", "c"]])
+
+    def test_deep_copy__snapshot_of_everything(self):
+        mock = _mock(capture=CapturePolicy.DEEP_COPY)
+        items = [["a"]]
+
+        mock.store(items)
+        items[0].append("c")
+
+        verify(mock).store([["a"]])
+        with self.assertRaises(VerifyError):
+            verify(mock).store([["a", "c"]])
+
+    def test_digest__verifies_by_content_without_keeping_args(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+        payload = bytes(range(256)) * 4096
+
+        mock.send(payload)
+
+        recorded = calls(mock).send.call_args
+        assert recorded is not None
+        self.assertIsInstance(recorded[0][1], ArgDigest)
+        self.assertEqual(len(payload), recorded[0][1].size)
+        verify(mock, exactly=1).send(bytes(range(256)) * 4096)
+        verify(mock, exactly=0).send(b"other")
+        verify(mock).send(match.anything())
+        calls(mock).send.assert_called_once_with(payload)
+
+    def test_digest__equal_only_to_digests_of_the_same_content(self):
+        digest = ArgDigest.of(b"payload")
+
+        self.assertNotEqual(b"payload", digest)
+        self.assertEqual(ArgDigest.of(bytearray(b"payload")), digest)
+        self.assertEqual(hash(ArgDigest.of(b"payload")), hash(digest))
+        self.assertIn(ArgDigest.of(b"payload"), {digest})
+
+    def test_digest__non_contiguous_memoryview(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+        view = memoryview(b"abcdef")[::2]
+
+        mock.put(view)
+
+        verify(mock).put(b"ace")
+
+    def test_digest__verify_no_more_interactions(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+
+        mock.send(b"payload")
+        verify(mock).send(b"payload")
+
+        verify_no_more_interactions(mock)
+
+    def test_digest__str_is_not_bytes(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+
+        mock.put("payload")
+
+        verify(mock).put("payload")
+        with self.assertRaises(VerifyError):
+            verify(mock).put(b"payload")
+
+    def test_digest__dicts_in_another_order(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+
+        mock.put({"a": 1, "b": 2})
+
+        verify(mock).put({"b": 2, "a": 1})
+
+    def test_digest__sets(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+
+        mock.put({"b", "a", "c"})
+
+        verify(mock).put({"c", "a", "b"})
+        verify(mock).put(frozenset({"a", "b", "c"}))
+
+    def test_digest__equal_numbers_of_other_types(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+
+        mock.put([1])
+        mock.put((2.0, True))
+
+        verify(mock).put([1.0])
+        verify(mock).put([True])
+        verify(mock).put((2, 1))
+
+    def test_digest__other_values_recorded_by_reference(self):
+        mock = _mock(capture=CapturePolicy.DIGEST)
+        items = [["a"]]
+
+        mock.store(items)
+
+        recorded = calls(mock).store.call_args
+        assert recorded is not None
+        self.assertIs(items, recorded[0][1])
+
+    def test_digest__unpicklable_values_compared_by_equality(self):
+        class Point:
+            def __init__(self, x: int) -> None:
+                self.x = x
+                self.lock = threading.Lock()
+
+            def __eq__(self, other: object) -> bool:
+                return isinstance(other, Point) and other.x == self.x
+
+        mock = _mock(capture=CapturePolicy.DIGEST)
+
+        mock.put(Point(1))
+
+        verify(mock).put(Point(1))
+        verify(mock, exactly=0).put(Point(2))
+
+    def test_capture_overrides__per_method(self):
+        mock = _mock(capture_overrides={"send": CapturePolicy.DIGEST})
+
+        mock.send(b"payload")
+        mock.store([["a"]])
+
+        self.assertIsInstance(calls(mock).send.call_args_list[0][0][1], ArgDigest)
+        self.assertEqual([["a"]], calls(mock).store.call_args_list[0][0][1])
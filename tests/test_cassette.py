@@ -0,0 +1,162 @@
+import asyncio
+import os
+import tempfile
+from unittest import TestCase
+
+from typemock import calls, stub_usage, tmock_from_cassette, trecord, verify
+from typemock.api import MockingError, MockTypeSafetyError, NoBehaviourSpecifiedError
+
+
+class Service:
+    name: str = "service"
+
+    def __init__(self) -> None:
+        self._count = 0
+
+    def lookup(self, key: str, default: int = 0) -> int:
+        if key == "missing":
+            raise KeyError(key)
+        self._count += 1
+        return len(key) * 10 + self._count
+
+    async def fetch(self, key: str) -> str:
+        return key.upper()
+
+
+class Unpicklable(Exception):
+    def __reduce__(self):
+        raise TypeError("cannot pickle")
+
+
+class FailingService:
+    def lookup(self, key: str, default: int = 0) -> int:
+        raise Unpicklable(key)
+
+
+class OtherService:
+    def lookup(self, key: str, default: int = 0) -> int:
+        pass
+
+
+class TestCassette(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "service.cassette")
+
+    def test_replay__outcomes_in_recorded_order(self):
+        with trecord(Service(), self.path) as service:
+            first = service.lookup("a")
+            second = service.lookup(key="a", default=0)
+            other = service.lookup("abc", 1)
+            with self.assertRaises(KeyError):
+                service.lookup("missing")
+
+        mock = tmock_from_cassette(Service, self.path)
+
+        self.assertEqual(first, mock.lookup("a"))
+        self.assertEqual(second, mock.lookup("a"))
+        self.assertEqual(other, mock.lookup(key="abc", default=1))
+        with self.assertRaises(KeyError):
+            mock.lookup("missing")
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            mock.lookup("a")
+        verify(mock, exactly=3).lookup("a")
+
+    def test_replay__loop(self):
+        with trecord(Service(), self.path) as service:
+            recorded = [service.lookup("a"), service.lookup("a")]
+
+        mock = tmock_from_cassette(Service, self.path, loop=True)
+
+        self.assertEqual(recorded + recorded, [mock.lookup("a") for _ in range(4)])
+
+    def test_replay__async(self):
+        async def record():
+            with trecord(Service(), self.path) as service:
+                return await service.fetch("abc")
+
+        recorded = asyncio.run(record())
+        mock = tmock_from_cassette(Service, self.path)
+
+        self.assertEqual(recorded, asyncio.run(mock.fetch("abc")))
+
+    def test_record__attributes_pass_through(self):
+        real = Service()
+        with trecord(real, self.path) as service:
+            service.name = "renamed"
+
+            self.assertEqual("renamed", service.name)
+            self.assertIsInstance(service, Service)
+        self.assertEqual("renamed", real.name)
+
+    def test_replay__returns_type_checked(self):
+        class Untyped:
+            def lookup(self, key: str, default: int = 0) -> int:
+                return "not an int"  # type: ignore[return-value]
+
+        Untyped.__qualname__ = Service.__qualname__
+        Untyped.__module__ = Service.__module__
+        with trecord(Untyped(), self.path) as service:
+            service.lookup("a")
+
+        mock = tmock_from_cassette(Service, self.path)
+
+        with self.assertRaises(MockTypeSafetyError):
+            mock.lookup("a")
+
+    def test_replay__many_interactions(self):
+        with trecord(Service(), self.path) as service:
+            for i in range(20_000):
+                service.lookup("key {}".format(i % 1000))
+
+        mock = tmock_from_cassette(Service, self.path)
+
+        self.assertEqual(1000, len(mock._mock_method_states_by_name["lookup"]._stubs))
+
+    def test_replay__other_class__mocking_error(self):
+        with trecord(Service(), self.path) as service:
+            service.lookup("a")
+
+        with self.assertRaises(MockingError):
+            tmock_from_cassette(OtherService, self.path)
+
+    def test_replay__not_a_cassette__mocking_error(self):
+        with open(self.path, "wb") as f:
+            f.write(b"")
+
+        with self.assertRaises(MockingError):
+            tmock_from_cassette(Service, self.path)
+
+    def test_record__without_context__complete_when_collected(self):
+        service = trecord(Service(), self.path)
+        recorded = service.lookup("a")
+        del service
+
+        mock = tmock_from_cassette(Service, self.path)
+
+        self.assertEqual(recorded, mock.lookup("a"))
+
+    def test_record__unpicklable_error__original_raised(self):
+        with trecord(FailingService(), self.path) as service:
+            with self.assertLogs("typemock", level="WARNING"):
+                with self.assertRaises(Unpicklable):
+                    service.lookup("a")
+
+    def test_record__not_in_stub_usage(self):
+        with stub_usage() as usage:
+            with trecord(Service(), self.path) as service:
+                service.lookup("a")
+
+        self.assertEqual([], usage.as_dict()["methods"])
+
+    def test_replay__settings_as_for_tmock(self):
+        with trecord(Service(), self.path) as service:
+            service.lookup("a")
+
+        mock = tmock_from_cassette(Service, self.path, instrument=True)
+        mock.lookup("a")
+
+        stats = calls(mock).lookup.stats
+        assert stats is not None
+        self.assertEqual(1, stats.calls)
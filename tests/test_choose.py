@@ -0,0 +1,139 @@
+import asyncio
+from collections import Counter
+from unittest import TestCase
+
+from typemock import match, outcome, tmock, virtual_time_loop, when
+from typemock.api import MockingError, MockTypeSafetyError
+from typemock.outcome import Fault
+
+
+class Backend:
+    name: str = "backend"
+
+    def fetch(self, key: int) -> str:
+        pass
+
+    async def fetch_async(self, key: int) -> str:
+        pass
+
+
+def _outcomes(mock: Backend, calls: int) -> list[str]:
+    results = []
+    for _ in range(calls):
+        try:
+            results.append(mock.fetch(1))
+        except Exception as e:
+            results.append(type(e).__name__)
+    return results
+
+
+class TestChoose(TestCase):
+    def _mock(self, seed: int, faults: list[Fault] | None = None) -> Backend:
+        with tmock(Backend) as mock:
+            when(mock.fetch(match.anything())).then_choose(
+                [(0.9, "ok"), (0.1, outcome.raises(TimeoutError))],
+                seed=seed,
+                faults=faults or [],
+            )
+        return mock
+
+    def test_then_choose__seeded_replays_exactly(self):
+        first = _outcomes(self._mock(seed=7), 1000)
+        second = _outcomes(self._mock(seed=7), 1000)
+
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, _outcomes(self._mock(seed=8), 1000))
+
+    def test_then_choose__weights(self):
+        counts = Counter(_outcomes(self._mock(seed=1), 10_000))
+
+        self.assertAlmostEqual(0.9, counts["ok"] / 10_000, delta=0.02)
+        self.assertAlmostEqual(0.1, counts["TimeoutError"] / 10_000, delta=0.02)
+
+    def test_then_choose__new_error_each_time(self):
+        with tmock(Backend) as mock:
+            when(mock.fetch(1)).then_choose([(1, outcome.raises(TimeoutError))])
+
+        errors = []
+        for _ in range(2):
+            try:
+                mock.fetch(1)
+            except TimeoutError as e:
+                errors.append(e)
+
+        self.assertIsNot(errors[0], errors[1])
+
+    def test_then_choose__fault_after(self):
+        with tmock(Backend) as mock:
+            when(mock.fetch(1)).then_choose(
+                [(1, "ok")],
+                seed=3,
+                faults=[Fault(outcome.raises(ConnectionError), probability=0.5, after=100)],
+            )
+
+        results = _outcomes(mock, 1100)
+
+        self.assertEqual(["ok"] * 100, results[:100])
+        self.assertAlmostEqual(0.5, results[100:].count("ConnectionError") / 1000, delta=0.05)
+
+    def test_then_choose__fault_bursts(self):
+        with tmock(Backend) as mock:
+            when(mock.fetch(1)).then_choose(
+                [(1, "ok")],
+                faults=[Fault(outcome.raises(ConnectionError), after=10, every=100, length=20)],
+            )
+
+        results = _outcomes(mock, 300)
+        failed = [i for i, result in enumerate(results) if result == "ConnectionError"]
+
+        self.assertEqual(
+            list(range(10, 30)) + list(range(110, 130)) + list(range(210, 230)), failed
+        )
+
+    def test_then_choose__returns_type_checked(self):
+        with self.assertRaises(MockTypeSafetyError):
+            with tmock(Backend) as mock:
+                when(mock.fetch(1)).then_choose([(1, "ok"), (1, 2)])
+
+    def test_then_choose__invalid_weights(self):
+        for outcomes in ([], [(0, "ok")], [(-1, "ok"), (2, "ok")]):
+            with self.subTest(outcomes=outcomes):
+                with self.assertRaises(MockingError):
+                    with tmock(Backend) as mock:
+                        when(mock.fetch(1)).then_choose(outcomes)
+
+    def test_then_choose__invalid_fault(self):
+        with self.assertRaises(MockingError):
+            Fault("ok", probability=2)
+        with self.assertRaises(MockingError):
+            Fault("ok", every=10, length=11)
+
+    def test_then_choose__delayed_async(self):
+        with tmock(Backend) as mock:
+            when(asyncio.run(mock.fetch_async(1))).then_choose(
+                [(1, outcome.delayed(2.0, "slow"))],
+            )
+
+        async def scenario() -> tuple[str, float]:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            result = await mock.fetch_async(1)
+            return result, loop.time() - start
+
+        result, elapsed = asyncio.run(scenario(), loop_factory=virtual_time_loop)
+
+        self.assertEqual("slow", result)
+        self.assertAlmostEqual(2.0, elapsed)
+
+    def test_then_choose__delayed_sync_raises(self):
+        with self.assertRaises(MockingError):
+            with tmock(Backend) as mock:
+                when(mock.fetch(1)).then_choose([(1, outcome.delayed(1.0, "slow"))])
+
+    def test_then_choose__attribute(self):
+        with tmock(Backend) as mock:
+            when(mock.name).then_choose([(1, "a"), (1, "b")], seed=5)
+
+        names = {mock.name for _ in range(100)}
+
+        self.assertEqual({"a", "b"}, names)
@@ -0,0 +1,197 @@
+import asyncio
+import contextvars
+import threading
+from unittest import TestCase
+
+from typemock import default_config, tmock, when
+from typemock.api import (
+    CapturePolicy,
+    MissingTypeHintsError,
+    MockingError,
+    MockTypeSafetyError,
+    TypeCheckBackend,
+    TypeSafety,
+)
+from typemock.config import PROFILES, MemberConfig, MockConfig
+
+
+class Repository:
+    name: str = "users"
+
+    def get(self, key: str) -> int:
+        return 1
+
+    def save(self, key: str, value: int) -> None:
+        pass
+
+
+class Unhinted:
+    def get(self, key):
+        return 1
+
+
+def _method_state(mock, name):
+    return mock._mock_method_states_by_name[name]
+
+
+def _attribute_state(mock, name):
+    return mock._mock_attribute_states[name]
+
+
+class TestMockConfig(TestCase):
+    def test_config__member_override(self):
+        config = MockConfig(
+            type_check=TypeCheckBackend.TYPEGUARD,
+            members={"get": MemberConfig(type_check=TypeCheckBackend.NONE)},
+        )
+        with tmock(Repository, config=config) as repository:
+            when(repository.get(1)).then_return("a")  # type: ignore[arg-type]
+            with self.assertRaises(MockTypeSafetyError):
+                when(repository.save(1, 1)).then_return(None)  # type: ignore[arg-type]
+
+        self.assertEqual("a", repository.get(1))  # type: ignore[arg-type]
+
+    def test_config__attribute_override(self):
+        config = MockConfig(members={"name": MemberConfig(type_check=TypeCheckBackend.NONE)})
+        with tmock(Repository, config=config) as repository:
+            when(repository.name).then_return(1)
+
+        self.assertEqual(1, repository.name)
+
+    def test_config__unknown_member(self):
+        config = MockConfig(members={"gett": MemberConfig(type_check=TypeCheckBackend.NONE)})
+
+        with self.assertRaises(MockingError) as context:
+            tmock(Repository, config=config)
+
+        self.assertIn("gett", str(context.exception))
+        with self.assertRaises(MockingError):
+            tmock(Repository, capture_overrides={"sav": CapturePolicy.REF})
+
+    def test_config__unknown_member_of_default_config_ignored(self):
+        config = MockConfig(members={"fetch": MemberConfig(type_check=TypeCheckBackend.NONE)})
+
+        with default_config(config):
+            repository = tmock(Repository)
+
+        self.assertEqual(TypeCheckBackend.COMPILED, _method_state(repository, "get")._type_check)
+
+    def test_config__resolved_per_member(self):
+        config = MockConfig(
+            capture=CapturePolicy.DIGEST,
+            instrument=True,
+            thread_safe=True,
+            members={
+                "save": MemberConfig(capture=CapturePolicy.REF, instrument=False),
+                "name": MemberConfig(thread_safe=False),
+            },
+        )
+        repository = tmock(Repository, config=config)
+
+        self.assertIsNotNone(_method_state(repository, "get")._capture_expected)
+        self.assertIsNotNone(_method_state(repository, "get")._stats)
+        self.assertIsNone(_method_state(repository, "save")._capture_expected)
+        self.assertIsNone(_method_state(repository, "save")._stats)
+        self.assertTrue(_method_state(repository, "save")._thread_safe)
+        self.assertIsNone(_attribute_state(repository, "name")._lock)
+
+    def test_config__explicit_settings_take_precedence(self):
+        repository = tmock(
+            Repository,
+            config="load-test",
+            instrument=False,
+            capture_overrides={"get": CapturePolicy.REF},
+        )
+
+        self.assertIsNone(_method_state(repository, "get")._stats)
+        self.assertIsNone(_method_state(repository, "get")._capture_expected)
+        self.assertIsNotNone(_method_state(repository, "save")._capture_expected)
+
+    def test_config__profiles(self):
+        for name in PROFILES:
+            with self.subTest(profile=name):
+                with tmock(Repository, config=name) as repository:
+                    when(repository.get("a")).then_return(1)
+
+                self.assertEqual(1, repository.get("a"))
+
+    def test_config__strict_profile_records_by_reference(self):
+        with tmock(Repository, config="strict") as repository:
+            when(repository.get("a")).then_return(1)
+
+        self.assertIsNone(_method_state(repository, "get")._capture)
+
+    def test_config__fast_profile_relaxed(self):
+        with tmock(Unhinted, config="fast") as unhinted:
+            when(unhinted.get("a")).then_return(2)
+
+        self.assertEqual(2, unhinted.get("a"))
+
+    def test_config__unknown_profile(self):
+        with self.assertRaises(MockingError):
+            tmock(Repository, config="slow")
+
+    def test_default_config(self):
+        with default_config("fast") as default:
+            self.assertEqual(TypeCheckBackend.NONE, default.type_check)
+            tmock(Unhinted)
+            with default_config(MockConfig(type_safety=TypeSafety.STRICT)) as nested:
+                self.assertEqual(TypeCheckBackend.NONE, nested.type_check)
+                with self.assertRaises(MissingTypeHintsError):
+                    tmock(Unhinted)
+
+        with self.assertRaises(MissingTypeHintsError):
+            tmock(Unhinted)
+
+    def test_default_config__not_seen_by_other_threads(self):
+        errors = []
+        entered = threading.Event()
+        made = threading.Event()
+
+        def make() -> None:
+            entered.wait()
+            try:
+                tmock(Unhinted)
+            except MissingTypeHintsError as e:
+                errors.append(e)
+            made.set()
+
+        thread = threading.Thread(target=make)
+        thread.start()
+        with default_config("fast"):
+            entered.set()
+            made.wait()
+        thread.join()
+
+        self.assertEqual(1, len(errors))
+
+    def test_default_config__copied_context(self):
+        made = []
+        with default_config("fast"):
+            context = contextvars.copy_context()
+            thread = threading.Thread(
+                target=context.run, args=(lambda: made.append(tmock(Unhinted)),)
+            )
+            thread.start()
+            thread.join()
+
+        self.assertEqual(1, len(made))
+
+    def test_default_config__tasks(self):
+        async def make_in_task() -> None:
+            tmock(Unhinted)
+
+        async def scenario() -> None:
+            with default_config("fast"):
+                await asyncio.create_task(make_in_task())
+
+        asyncio.run(scenario())
+
+    def test_member_config__over(self):
+        override = MemberConfig(type_check=TypeCheckBackend.NONE)
+        base = MockConfig(type_check=TypeCheckBackend.TYPEGUARD, capture=CapturePolicy.DIGEST)
+
+        self.assertEqual(
+            MemberConfig(type_check=TypeCheckBackend.NONE, capture=CapturePolicy.DIGEST),
+            override.over(base),
+        )
@@ -0,0 +1,143 @@
+import asyncio
+import time
+from unittest import TestCase
+
+import trio
+import trio.testing
+
+from typemock import attr, match, setup_mock, tmock, virtual_time_loop, when
+from typemock.api import MockingError
+
+
+class MyService:
+    name: str = "service"
+
+    async def fetch(self, request_id: int) -> str:
+        pass
+
+    def fetch_sync(self, request_id: int) -> str:
+        pass
+
+
+CONCURRENT_CALLS = 2_000
+
+
+def _service(delay) -> MyService:
+    mock = tmock(MyService)
+
+    async def setup():
+        with setup_mock(mock):
+            when(await mock.fetch(match.anything())).then_delay(delay).then_do(
+                lambda request_id: "result {}".format(request_id)
+            )
+
+    asyncio.run(setup())
+    return mock
+
+
+class TestDelayAsyncio(TestCase):
+    def test_delay__concurrent_calls__virtual_time(self):
+        mock = _service(0.2)
+
+        async def scenario() -> tuple[list[str], float]:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            results = await asyncio.gather(*(mock.fetch(i) for i in range(CONCURRENT_CALLS)))
+            return results, loop.time() - start
+
+        wall_start = time.perf_counter()
+        results, elapsed = asyncio.run(scenario(), loop_factory=virtual_time_loop)
+
+        self.assertLess(time.perf_counter() - wall_start, 5)
+        self.assertAlmostEqual(0.2, elapsed, places=6)
+        self.assertEqual(["result {}".format(i) for i in range(CONCURRENT_CALLS)], results)
+
+    def test_delay__completes_in_delay_order(self):
+        mock = _service(lambda: 0.0)
+        completed = []
+
+        async def setup():
+            with setup_mock(mock):
+                when(await mock.fetch(1)).then_delay(0.3).then_return("slow")
+                when(await mock.fetch(2)).then_delay(0.1).then_return("fast")
+
+        async def call(request_id: int):
+            completed.append(await mock.fetch(request_id))
+
+        async def scenario():
+            await setup()
+            await asyncio.gather(call(1), call(2), call(3))
+
+        asyncio.run(scenario(), loop_factory=virtual_time_loop)
+
+        self.assertEqual(["result 3", "fast", "slow"], completed)
+
+    def test_delay__error_raised_after_delay(self):
+        mock = tmock(MyService)
+
+        async def scenario() -> float:
+            with setup_mock(mock):
+                when(await mock.fetch(1)).then_delay(1.5).then_raise(TimeoutError())
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            with self.assertRaises(TimeoutError):
+                await mock.fetch(1)
+            return loop.time() - start
+
+        self.assertAlmostEqual(1.5, asyncio.run(scenario(), loop_factory=virtual_time_loop))
+
+    def test_delay__distribution(self):
+        delays = iter([0.1, 0.2, -1.0])
+        mock = _service(lambda: next(delays))
+
+        async def scenario() -> list[float]:
+            loop = asyncio.get_running_loop()
+            elapsed = []
+            for i in range(3):
+                start = loop.time()
+                await mock.fetch(i)
+                elapsed.append(loop.time() - start)
+            return elapsed
+
+        elapsed = asyncio.run(scenario(), loop_factory=virtual_time_loop)
+
+        self.assertAlmostEqual(0.1, elapsed[0])
+        self.assertAlmostEqual(0.2, elapsed[1])
+        self.assertAlmostEqual(0.0, elapsed[2])
+
+
+class TestDelayTrio(TestCase):
+    def test_delay__concurrent_calls__mock_clock(self):
+        mock = _service(0.2)
+        results = []
+
+        async def call(request_id: int):
+            results.append(await mock.fetch(request_id))
+
+        async def scenario() -> float:
+            start = trio.current_time()
+            async with trio.open_nursery() as nursery:
+                for i in range(CONCURRENT_CALLS):
+                    nursery.start_soon(call, i)
+            return trio.current_time() - start
+
+        elapsed = trio.run(scenario, clock=trio.testing.MockClock(autojump_threshold=0))
+
+        self.assertAlmostEqual(0.2, elapsed, places=6)
+        self.assertEqual(CONCURRENT_CALLS, len(results))
+
+
+class TestDelaySetup(TestCase):
+    def test_delay__sync_method__mocking_error(self):
+        mock = tmock(MyService)
+
+        with self.assertRaises(MockingError):
+            with setup_mock(mock):
+                when(mock.fetch_sync(1)).then_delay(0.1)
+
+    def test_delay__attribute__mocking_error(self):
+        mock = tmock(MyService)
+
+        with self.assertRaises(MockingError):
+            with setup_mock(mock):
+                attr(mock.name).then_delay(0.1)
@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+from typemock import match, tmock, verify, when
+from typemock._mock.diagnostics import call_similarity, nearest_calls, value_similarity
+from typemock.api import VerifyError
+
+
+class MyThing:
+    some_attribute: str = "a"
+
+    def multiple_arg(self, prefix: str, number: int) -> str:
+        pass
+
+
+def _call(prefix: str, number: int) -> tuple[tuple[str, object], ...]:
+    return (("prefix", prefix), ("number", number))
+
+
+class TestSimilarity(TestCase):
+    def test_value_similarity(self):
+        self.assertEqual(1.0, value_similarity(10, 10))
+        self.assertGreater(value_similarity(10, 11), value_similarity(10, 100))
+        self.assertGreater(value_similarity("hello", "help"), value_similarity("hello", "world"))
+        self.assertEqual(0.0, value_similarity("10", 10))
+
+    def test_call_similarity__equal_args_rank_first(self):
+        expected = _call("a", 1)
+
+        self.assertGreater(
+            call_similarity(_call("a", 1000), expected), call_similarity(_call("b", 1), expected)
+        )
+
+
+class TestNearestCalls(TestCase):
+    def test_nearest_calls__top_k_most_similar(self):
+        records = [_call("x", i) for i in range(1000)] + [_call("a", 1), _call("a", 2)]
+
+        nearest = nearest_calls(records, _call("a", 1), call_similarity, len(records), limit=2)
+
+        self.assertEqual([_call("a", 2), _call("x", 1)], nearest.calls)
+        self.assertFalse(nearest.truncated)
+
+    def test_nearest_calls__scan_limit(self):
+        records = [_call("x", i) for i in range(1000)]
+
+        nearest = nearest_calls(
+            records, _call("x", 999), call_similarity, len(records), scan_limit=10
+        )
+
+        self.assertEqual(10, nearest.scanned)
+        self.assertTrue(nearest.truncated)
+        self.assertIn("searched 10 of 1000", str(nearest))
+
+    def test_nearest_calls__time_budget(self):
+        records = [_call("x", i) for i in range(10_000)]
+
+        nearest = nearest_calls(
+            records, _call("y", 0), call_similarity, len(records), time_budget_ns=0
+        )
+
+        self.assertLess(nearest.scanned, len(records))
+
+
+class TestVerifyDiagnostics(TestCase):
+    def test_verify__failure_lists_nearest_calls(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg(match.anything(), match.anything())).then_return("a")
+        for i in range(100):
+            my_thing_mock.multiple_arg("other", i)
+        my_thing_mock.multiple_arg("hello", 41)
+
+        with self.assertRaises(VerifyError) as context:
+            verify(my_thing_mock).multiple_arg("hello", 42)
+
+        message = str(context.exception)
+        self.assertIn("101 other interaction(s)", message)
+        self.assertIn("Nearest:\n\n    (('prefix', 'hello'), ('number', 41))", message)
+
+    def test_verify__set_failure_lists_nearest_sets(self):
+        with tmock(MyThing) as my_thing_mock:
+            pass
+        my_thing_mock.some_attribute = "abc"
+        my_thing_mock.some_attribute = "hello"
+
+        with self.assertRaises(VerifyError) as context:
+            verify(my_thing_mock).some_attribute = "help"
+
+        self.assertIn("Nearest:\n\n    hello\n    abc", str(context.exception))
@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from typemock import expect, expect_all, match, recording_scope, tmock, when
+from typemock.api import CapturePolicy, MockingError, VerifyError
+
+
+class MyThing:
+    some_attribute: str = "a"
+
+    def convert_int_to_str(self, number: int) -> str:
+        pass
+
+    def take_list(self, values: list[int]) -> None:
+        pass
+
+
+def _thing_mock(**kwargs) -> MyThing:
+    with tmock(MyThing, **kwargs) as my_thing_mock:
+        when(my_thing_mock.convert_int_to_str(match.anything())).then_return("a")
+        when(my_thing_mock.take_list(match.anything())).then_return(None)
+        when(my_thing_mock.some_attribute).then_return("b")
+    return my_thing_mock
+
+
+class TestExpectAll(TestCase):
+    def test_expect_all__all_met(self):
+        my_thing_mock = _thing_mock()
+        my_thing_mock.convert_int_to_str(1)
+        my_thing_mock.convert_int_to_str(2)
+        my_thing_mock.convert_int_to_str(2)
+        my_thing_mock.take_list([1, 2])
+        _ = my_thing_mock.some_attribute
+
+        expect_all(
+            my_thing_mock,
+            [
+                expect(my_thing_mock).convert_int_to_str(1),
+                expect(my_thing_mock, exactly=2).convert_int_to_str(2),
+                expect(my_thing_mock, exactly=3).convert_int_to_str(match.anything()),
+                expect(my_thing_mock, exactly=0).convert_int_to_str(3),
+                expect(my_thing_mock).take_list([1, 2]),
+                expect(my_thing_mock, exactly=1).some_attribute,
+            ],
+        )
+
+    def test_expect_all__failures__reported_together(self):
+        my_thing_mock = _thing_mock()
+        my_thing_mock.convert_int_to_str(1)
+
+        with self.assertRaises(VerifyError) as context:
+            expect_all(
+                my_thing_mock,
+                [
+                    expect(my_thing_mock).convert_int_to_str(1),
+                    expect(my_thing_mock).convert_int_to_str(2),
+                    expect(my_thing_mock, exactly=2).convert_int_to_str(1),
+                    expect(my_thing_mock).some_attribute,
+                ],
+            )
+
+        message = str(context.exception)
+        self.assertIn("3 of 4 expectation(s) failed", message)
+        self.assertIn("('number', 2)", message)
+        self.assertIn("some_attribute", message)
+
+    def test_expect_all__scope(self):
+        my_thing_mock = _thing_mock()
+        my_thing_mock.convert_int_to_str(1)
+        with recording_scope() as scope:
+            my_thing_mock.convert_int_to_str(2)
+
+        expect_all(
+            my_thing_mock,
+            [
+                expect(my_thing_mock, exactly=0).convert_int_to_str(1),
+                expect(my_thing_mock, exactly=1).convert_int_to_str(2),
+            ],
+            scope=scope,
+        )
+
+    def test_expect_all__digest_capture(self):
+        my_thing_mock = _thing_mock(capture=CapturePolicy.DIGEST)
+        my_thing_mock.take_list([1, 2])
+
+        expect_all(
+            my_thing_mock,
+            [
+                expect(my_thing_mock, exactly=1).take_list([1, 2]),
+                expect(my_thing_mock, exactly=0).take_list([2, 1]),
+            ],
+        )
+
+    def test_expect_all__not_an_expectation__mocking_error(self):
+        my_thing_mock = _thing_mock()
+
+        with self.assertRaises(MockingError):
+            expect_all(my_thing_mock, ["not an expectation"])
+
+    def test_expect_all__other_mock__mocking_error(self):
+        my_thing_mock = _thing_mock()
+        other_mock = _thing_mock()
+
+        with self.assertRaises(MockingError):
+            expect_all(my_thing_mock, [expect(other_mock).convert_int_to_str(1)])
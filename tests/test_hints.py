@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import gc
+import weakref
+from collections.abc import Callable, Iterator
+from unittest import TestCase
+
+from typemock import tmock, when
+from typemock._hints import hints_of, unalias
+from typemock._safety import get_missing_class_type_hints
+from typemock._typecheck import compiled_checker
+from typemock.api import MockTypeSafetyError, TypeSafety
+
+type UserId = int
+type UserIds = list[UserId]
+
+
+class Repository:
+    label: str = "users"
+
+    def __init__(self, owner: Owner) -> None:
+        self.owner = owner
+
+    def get(self, user_id: UserId) -> User:
+        return User(user_id)
+
+    def ids(self) -> UserIds:
+        return []
+
+    def stream(self) -> Iterator[User]:
+        yield User(1)
+
+
+class Owner:
+    pass
+
+
+class User:
+    def __init__(self, user_id: int) -> None:
+        self.user_id = user_id
+
+
+class TestHints(TestCase):
+    def test_hints_of__resolves_forward_references(self):
+        hints = hints_of(Repository)
+
+        self.assertEqual({"label": str}, hints.attributes)
+        self.assertEqual(Owner, hints.init["owner"])
+        self.assertEqual({"user_id": UserId, "return": User}, hints.method(Repository.get))
+
+    def test_hints_of__cached(self):
+        self.assertIs(hints_of(Repository), hints_of(Repository))
+        self.assertIs(
+            hints_of(Repository).method(Repository.get), hints_of(Repository).method(Repository.get)
+        )
+
+    def test_hints_of__class_not_kept_alive(self):
+        def make() -> weakref.ref[type]:
+            class Local:
+                label: str = "local"
+
+                def __init__(self, owner: Owner | None = None) -> None:
+                    super().__init__()
+
+                def describe(self) -> str:
+                    return super().__repr__()
+
+            with tmock(Local) as local:
+                when(local.describe()).then_return("local")
+            local.describe()
+            return weakref.ref(Local)
+
+        local_class = make()
+        gc.collect()
+
+        self.assertIsNone(local_class())
+
+    def test_hints_of__refers_to_own_class(self):
+        class Local:
+            parent: Local | None = None
+
+            def __init__(self, children: list[Local]) -> None:
+                self.children = children
+
+            def find(self, match: Callable[[Local], bool]) -> dict[str, Local]:
+                return {}
+
+        hints = hints_of(Local)
+
+        self.assertEqual({"parent": Local | None}, hints.attributes)
+        self.assertEqual({"children": list[Local], "return": type(None)}, hints.init)
+        self.assertEqual(
+            {"match": Callable[[Local], bool], "return": dict[str, Local]},
+            hints.method(Local.find),
+        )
+
+    def test_hints_of__class_left_unchanged(self):
+        class Guarded(type):
+            def __setattr__(cls, name: str, value: object) -> None:
+                raise AttributeError(name)
+
+        class Local(metaclass=Guarded):
+            label: str = "local"
+
+        names = set(vars(Local))
+
+        hints_of(Local)
+
+        self.assertEqual(names, set(vars(Local)))
+        self.assertEqual({"label": str}, hints_of(Local).attributes)
+
+    def test_validate__uses_resolved_hints(self):
+        class Local:
+            def get(self, user_id: UserId) -> User:
+                return User(user_id)
+
+        self.assertEqual([], get_missing_class_type_hints(Local, None, TypeSafety.STRICT))
+
+    def test_hints_of__unresolvable_left_as_is(self):
+        class Local:
+            def do(self, thing: Missing) -> int:  # noqa: F821
+                return 1
+
+        self.assertEqual({"thing": "Missing", "return": int}, hints_of(Local).method(Local.do))
+
+    def test_unalias(self):
+        self.assertEqual(int, unalias(UserId))
+        self.assertEqual(list[UserId], unalias(UserIds))
+        self.assertEqual(str, unalias(str))
+
+    def test_compiled_checker__alias(self):
+        check = compiled_checker(UserId)
+
+        self.assertTrue(check(1))
+        self.assertFalse(check("1"))
+
+    def test_mock__forward_reference_return(self):
+        with tmock(Repository) as repository:
+            when(repository.get(1)).then_return(User(1))
+
+        self.assertEqual(1, repository.get(1).user_id)
+
+    def test_mock__forward_reference_return__type_safety(self):
+        with self.assertRaises(MockTypeSafetyError):
+            with tmock(Repository) as repository:
+                when(repository.get(1)).then_return(Owner())
+
+    def test_mock__alias_arg__type_safety(self):
+        with self.assertRaises(MockTypeSafetyError):
+            with tmock(Repository) as repository:
+                when(repository.get("1")).then_return(User(1))
+
+    def test_mock__alias_return__type_safety(self):
+        with tmock(Repository) as repository:
+            when(repository.ids()).then_return([1, 2])
+        with self.assertRaises(MockTypeSafetyError):
+            with tmock(Repository) as repository:
+                when(repository.ids()).then_return(["1"])
+
+    def test_mock__forward_reference_stream(self):
+        with tmock(Repository) as repository:
+            when(repository.stream()).then_stream([User(1), User(2)])
+
+        self.assertEqual([1, 2], [user.user_id for user in repository.stream()])
+
+    def test_mock__string_annotated_attribute(self):
+        with tmock(Repository) as repository:
+            when(repository.label).then_return("admins")
+
+        self.assertEqual("admins", repository.label)
+        with self.assertRaises(MockTypeSafetyError):
+            with tmock(Repository) as repository:
+                when(repository.label).then_return(1)
@@ -0,0 +1,207 @@
+import asyncio
+from unittest import TestCase
+
+from typemock import hooks, match, setup_mock, tmock, tspy, verify, when
+from typemock._mock import observe
+from typemock.api import MockingError, MockTypeSafetyError, NoBehaviourSpecifiedError
+
+
+class Repository:
+    name: str = "users"
+
+    def get(self, key: str) -> int:
+        return 1
+
+    async def fetch(self, key: str) -> int:
+        return 1
+
+
+def _stubbed() -> Repository:
+    repository = tmock(Repository)
+    with setup_mock(repository):
+        when(repository.get("a")).then_return(1)
+        when(repository.get(match.has_prefix("b"))).then_return(2)
+    return repository
+
+
+class TestHooks(TestCase):
+    def test_on_call(self):
+        repository = _stubbed()
+        events: list[hooks.CallEvent] = []
+
+        with hooks.on_call(events.append):
+            repository.get("a")
+            repository.get(key="b1")
+
+        self.assertEqual(2, len(events))
+        self.assertEqual("Repository", events[0].mock)
+        self.assertEqual("get", events[0].member)
+        self.assertEqual("call", events[0].kind)
+        self.assertEqual((("key", "a"),), events[0].args)
+        self.assertEqual(1, events[0].result)
+        self.assertIsNone(events[0].error)
+        self.assertGreaterEqual(events[0].duration_ns, 0)
+        self.assertEqual(2, events[1].result)
+
+    def test_on_call__attributes(self):
+        repository = _stubbed()
+        events: list[hooks.CallEvent] = []
+
+        with hooks.on_call(events.append):
+            repository.name = "admins"
+            repository.name
+
+        self.assertEqual(["set", "get"], [event.kind for event in events])
+        self.assertEqual((("value", "admins"),), events[0].args)
+        self.assertEqual("admins", events[1].result)
+
+    def test_on_call__async(self):
+        repository = tmock(Repository)
+        events: list[hooks.CallEvent] = []
+
+        async def run() -> None:
+            with setup_mock(repository):
+                when(await repository.fetch("a")).then_return(1)
+                when(await repository.fetch("b")).then_delay(0).then_return(2)
+            await repository.fetch("a")
+            await repository.fetch("b")
+
+        with hooks.on_call(events.append):
+            asyncio.run(run())
+
+        self.assertEqual([1, 2], [event.result for event in events])
+
+    def test_on_miss(self):
+        repository = _stubbed()
+        misses: list[hooks.MissEvent] = []
+        events: list[hooks.CallEvent] = []
+
+        with hooks.on_miss(misses.append), hooks.on_call(events.append):
+            with self.assertRaises(NoBehaviourSpecifiedError):
+                repository.get("z")
+
+        self.assertEqual(1, len(misses))
+        self.assertEqual((("key", "z"),), misses[0].args)
+        self.assertIsInstance(events[0].error, NoBehaviourSpecifiedError)
+
+    def test_on_type_error(self):
+        repository = _stubbed()
+        errors: list[hooks.TypeErrorEvent] = []
+
+        with hooks.on_type_error(errors.append):
+            with self.assertRaises(MockTypeSafetyError):
+                repository.get(1)  # type: ignore[arg-type]
+            with self.assertRaises(MockTypeSafetyError):
+                repository.name = 1  # type: ignore[assignment]
+
+        self.assertEqual(["get", "name"], [error.member for error in errors])
+
+    def test_on_setup(self):
+        setups: list[hooks.SetupEvent] = []
+
+        with hooks.on_setup(setups.append):
+            repository = _stubbed()
+            with setup_mock(repository):
+                when(repository.name).then_raise(ValueError())
+
+        self.assertEqual(
+            [("get", "ResponderBasic"), ("get", "ResponderBasic"), ("name", "ResponderRaise")],
+            [(setup.member, setup.behaviour) for setup in setups],
+        )
+        self.assertEqual((("key", "a"),), setups[0].args)
+
+    def test_batched(self):
+        repository = _stubbed()
+        batches: list[list[hooks.CallEvent]] = []
+
+        with hooks.on_call(batches.append, batch_size=2):
+            for _ in range(5):
+                repository.get("a")
+            self.assertEqual([2, 2], [len(batch) for batch in batches])
+            hooks.flush()
+            self.assertEqual([2, 2, 1], [len(batch) for batch in batches])
+
+        self.assertEqual(3, len(batches))
+
+    def test_batched__flushed_on_close(self):
+        repository = _stubbed()
+        batches: list[list[hooks.CallEvent]] = []
+
+        subscription = hooks.on_call(batches.append, batch_size=10)
+        repository.get("a")
+        subscription.close()
+
+        self.assertEqual([1], [len(batch) for batch in batches])
+
+    def test_batched__invalid_size(self):
+        with self.assertRaises(MockingError):
+            hooks.on_call(print, batch_size=0)
+
+    def test_subscriber_error__logged_not_raised(self):
+        repository = _stubbed()
+
+        def broken(event: hooks.CallEvent) -> None:
+            raise RuntimeError("broken tracer")
+
+        with self.assertLogs("typemock", level="ERROR") as logs:
+            with hooks.on_call(broken), hooks.on_miss(broken):
+                self.assertEqual(1, repository.get("a"))
+                with self.assertRaises(NoBehaviourSpecifiedError):
+                    repository.get("z")
+
+        self.assertEqual(3, len(logs.records))
+        self.assertIn("broken tracer", logs.output[0])
+
+    def test_subscriber_error__batched(self):
+        repository = _stubbed()
+
+        def broken(events: list[hooks.CallEvent]) -> None:
+            raise RuntimeError("broken tracer")
+
+        with self.assertLogs("typemock", level="ERROR") as logs:
+            with hooks.on_call(broken, batch_size=2):
+                repository.get("a")
+                repository.get("a")
+                repository.get("a")
+
+        self.assertEqual(2, len(logs.records))
+
+    def test_on_call__spy(self):
+        spy = tspy(Repository())
+        with setup_mock(spy):
+            when(spy.get("a")).then_return(5)
+        events: list[hooks.CallEvent] = []
+
+        with hooks.on_call(events.append):
+            spy.get("a")
+            spy.get("b")
+
+        self.assertEqual([5, 1], [event.result for event in events])
+        self.assertEqual([(("key", "a"),), (("key", "b"),)], [event.args for event in events])
+        verify(spy, exactly=2).get(match.anything())
+
+    def test_on_call__async_spy(self):
+        spy = tspy(Repository())
+        events: list[hooks.CallEvent] = []
+
+        async def run() -> None:
+            with setup_mock(spy):
+                when(await spy.fetch("a")).then_return(5)
+            await spy.fetch("a")
+            await spy.fetch("b")
+
+        with hooks.on_call(events.append):
+            asyncio.run(run())
+
+        self.assertEqual([5, 1], [event.result for event in events])
+
+    def test_unsubscribed(self):
+        repository = _stubbed()
+        events: list[hooks.CallEvent] = []
+
+        with hooks.on_call(events.append):
+            self.assertTrue(observe.enabled)
+        repository.get("a")
+
+        self.assertEqual([], events)
+        self.assertFalse(observe.enabled)
@@ -70,6 +70,26 @@ class TestMockObjectMatching(TestCase):
         with self.assertRaises(MockTypeSafetyError):
             my_thing_mock.convert_int_to_str("not an int")
 
+    def test_overlapping_matchers__override_after_default__override_wins(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg(match.anything(), match.anything())).then_return(
+                "default"
+            )
+            when(my_thing_mock.multiple_arg("a", match.anything())).then_return("override")
+
+        self.assertEqual("override", my_thing_mock.multiple_arg("a", 1))
+        self.assertEqual("default", my_thing_mock.multiple_arg("b", 1))
+
+    def test_overlapping_matchers__default_after_override__default_wins(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg("a", match.anything())).then_return("override")
+            when(my_thing_mock.multiple_arg(match.anything(), match.anything())).then_return(
+                "default"
+            )
+
+        self.assertEqual("default", my_thing_mock.multiple_arg("a", 1))
+        self.assertEqual("default", my_thing_mock.multiple_arg("b", 1))
+
 
 class TestInstanceOfMatcher(TestCase):
     def test_instance_of_matcher__matches_correct_type(self):
@@ -105,3 +125,65 @@ class TestInstanceOfMatcher(TestCase):
         obj = SubObject()
 
         self.assertEqual(obj, matcher)
+
+
+class TestPrecompiledMatchers(TestCase):
+    def test_matchers__match(self):
+        cases = [
+            (match.one_of({1, 2}), [1, 2], [3, "1"]),
+            (match.one_of([[1], [2]]), [[1]], [[3]]),
+            (match.between(1, 5), [1, 3, 5], [0, 6, "3"]),
+            (match.regex(r"^SELECT"), ["SELECT 1"], ["select 1", 1]),
+            (match.has_prefix("ab"), ["abc"], ["cab", b"abc"]),
+            (match.len_between(1, 2), ["a", [1, 2]], ["", [1, 2, 3], 1]),
+            (match.lambda_(lambda x: x % 2 == 0), [2, 4], [1]),
+            (match.all_of(match.instance_of(int), match.between(0, 9)), [0, 9], [10, 1.5]),
+            (match.any_of(1, match.has_prefix("a")), [1, "ab"], [2, "b"]),
+        ]
+        for matcher, matching, not_matching in cases:
+            for value in matching:
+                with self.subTest(matcher=matcher, value=value):
+                    self.assertEqual(matcher, value)
+            for value in not_matching:
+                with self.subTest(matcher=matcher, value=value):
+                    self.assertNotEqual(matcher, value)
+
+    def test_matchers__equal_by_type_and_args(self):
+        self.assertEqual(match.between(1, 2), match.between(1, 2))
+        self.assertNotEqual(match.between(1, 2), match.between(1, 3))
+        self.assertNotEqual(match.one_of({1}), match.any_of(1))
+
+    def test_matchers__index_values(self):
+        self.assertEqual(frozenset({1, 2}), match.one_of([1, 2]).index_values())
+        self.assertEqual(frozenset({1, 2}), match.any_of(1, match.one_of({2})).index_values())
+        self.assertEqual(
+            frozenset({1}), match.all_of(match.one_of({1, 2}), match.one_of({1})).index_values()
+        )
+        self.assertIsNone(match.any_of(1, match.between(2, 3)).index_values())
+        self.assertIsNone(match.between(2, 3).index_values())
+
+    def test_instance_of__resolves_lazy_type_once(self):
+        resolved = []
+
+        def expected_type() -> type:
+            resolved.append(1)
+            return int
+
+        matcher = match.instance_of(expected_type)  # type: ignore[arg-type]
+
+        self.assertEqual(matcher, 1)
+        self.assertNotEqual(matcher, "1")
+        self.assertEqual([1], resolved)
+
+    def test_matchers__with_mock(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.multiple_arg(match.anything(), match.between(1, 10))).then_return(
+                "b"
+            )
+            when(my_thing_mock.multiple_arg(match.regex("^a"), match.one_of({1, 2}))).then_return(
+                "a"
+            )
+
+        self.assertEqual("a", my_thing_mock.multiple_arg("abc", 2))
+        self.assertEqual("b", my_thing_mock.multiple_arg("abc", 3))
+        self.assertEqual("b", my_thing_mock.multiple_arg("xyz", 1))
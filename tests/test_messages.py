@@ -0,0 +1,110 @@
+import pickle
+from unittest import TestCase
+
+from typemock import set_error_message_limits, tmock, verify, when
+from typemock.api import MockTypeSafetyError, VerifyError
+
+
+class MyThing:
+    def take_bytes(self, blob: bytes) -> None:
+        pass
+
+    def take_dict(self, values: dict[str, int]) -> None:
+        pass
+
+
+class CountsReprs:
+    reprs = 0
+
+    def __repr__(self) -> str:
+        CountsReprs.reprs += 1
+        return "CountsReprs()"
+
+
+class TestLazyMessages(TestCase):
+    def tearDown(self):
+        set_error_message_limits(value_limit=500, message_limit=10_000, items_limit=20)
+
+    def test_message__rendered_only_when_shown(self):
+        CountsReprs.reprs = 0
+        error = VerifyError("Expected {}", CountsReprs())
+
+        self.assertEqual(0, CountsReprs.reprs)
+        self.assertEqual("Expected CountsReprs()", str(error))
+        self.assertEqual(1, CountsReprs.reprs)
+
+    def test_message__plain_message(self):
+        self.assertEqual("No {braces} formatted", str(VerifyError("No {braces} formatted")))
+
+    def test_message__value_capped(self):
+        set_error_message_limits(value_limit=20)
+
+        message = str(MockTypeSafetyError("Value: {}", b"x" * 1000))
+
+        self.assertLess(len(message), 100)
+
+    def test_message__container_items_capped(self):
+        set_error_message_limits(items_limit=3)
+
+        message = str(VerifyError("Value: {}", list(range(1000))))
+
+        self.assertEqual("Value: [0, 1, 2, ...]", message)
+
+    def test_message__whole_message_capped(self):
+        set_error_message_limits(message_limit=50)
+
+        message = str(VerifyError("Values: {} {}", "a" * 40, "b" * 40))
+
+        self.assertEqual("Values: " + "a" * 40 + " b... (39 more characters)", message)
+
+    def test_message__args_and_repr_rendered(self):
+        error = VerifyError("Expected {} in {name}", 1, name="calls")
+
+        self.assertEqual(("Expected 1 in calls",), error.args)
+        self.assertEqual("VerifyError('Expected 1 in calls')", repr(error))
+
+    def test_message__args_set_after_made(self):
+        error = VerifyError("Expected {}", 1)
+
+        error.args = ("Replaced",)
+
+        self.assertEqual("Replaced", str(error))
+        self.assertEqual("VerifyError('Replaced')", repr(error))
+
+    def test_message__pickled_as_rendered(self):
+        error = pickle.loads(pickle.dumps(VerifyError("Expected {}", [1, 2])))
+
+        self.assertEqual("Expected [1, 2]", str(error))
+
+    def test_verify__large_args__capped(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.take_dict({})).then_return(None)
+        big = {str(i): i for i in range(10_000)}
+
+        with self.assertRaises(VerifyError) as context:
+            verify(my_thing_mock).take_dict(big)
+
+        self.assertLess(len(str(context.exception)), 1000)
+
+    def test_type_safety__invalid_args__capped(self):
+        with tmock(MyThing) as my_thing_mock:
+            pass
+
+        with self.assertRaises(MockTypeSafetyError) as context:
+            my_thing_mock.take_bytes(b"x" * 100_000, 1)
+
+        self.assertLess(len(str(context.exception)), 1000)
+
+    def test_verify_and_type_safety__args_and_repr_rendered(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.take_dict({})).then_return(None)
+
+        with self.assertRaises(VerifyError) as verify_context:
+            verify(my_thing_mock).take_dict({"a": 1})
+        with self.assertRaises(MockTypeSafetyError) as type_context:
+            my_thing_mock.take_bytes("not bytes")
+
+        for error in (verify_context.exception, type_context.exception):
+            self.assertEqual(str(error), error.args[0])
+            self.assertEqual("{}({!r})".format(type(error).__name__, str(error)), repr(error))
+            self.assertNotIn("{}", error.args[0])
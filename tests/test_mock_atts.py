@@ -203,6 +203,16 @@ class TestAttrFunction(TestCase):
             actual = mock.class_att_with_type
             self.assertEqual(expected, actual)
 
+    def test_attr__then_yield_from(self):
+        mock = tmock(MyThing)
+
+        with setup_mock(mock):
+            attr(mock.class_att_with_type).then_yield_from(range(1, 4), loop=True)
+
+        for expected in [1, 2, 3, 1]:
+            actual = mock.class_att_with_type
+            self.assertEqual(expected, actual)
+
     def test_attr__then_raise(self):
         mock = tmock(MyThing)
 
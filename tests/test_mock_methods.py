@@ -2,7 +2,7 @@ from typing import Any
 from unittest import TestCase
 
 from typemock import match, setup_mock, tmock, verify, when
-from typemock.api import NoBehaviourSpecifiedError
+from typemock.api import MockingError, MockTypeSafetyError, NoBehaviourSpecifiedError
 
 
 class NestedThing:
@@ -261,6 +261,57 @@ class TestBasicMethodMocking(TestCase):
                         actual = my_thing_mock.return_a_str()
                         self.assertEqual(expected, actual)
 
+    def test_mock__then_yield_from__pulls_lazily(self):
+        pulled = []
+
+        def responses():
+            for i in range(3):
+                pulled.append(i)
+                yield "response {}".format(i)
+
+        for mocked_thing in mocked_things:
+            with self.subTest("{}".format(mocked_thing)):
+                pulled.clear()
+                with tmock(mocked_thing) as my_thing_mock:
+                    when(my_thing_mock.return_a_str()).then_yield_from(responses())
+
+                self.assertEqual([], pulled)
+                self.assertEqual("response 0", my_thing_mock.return_a_str())
+                self.assertEqual([0], pulled)
+                self.assertEqual("response 1", my_thing_mock.return_a_str())
+                self.assertEqual("response 2", my_thing_mock.return_a_str())
+
+                # Not looping, and responses have run out.
+                with self.assertRaises(NoBehaviourSpecifiedError):
+                    my_thing_mock.return_a_str()
+
+    def test_mock__then_yield_from__loop_with_factory(self):
+        def responses():
+            yield "first response"
+            yield "second response"
+
+        for mocked_thing in mocked_things:
+            with self.subTest("{}".format(mocked_thing)):
+                with tmock(mocked_thing) as my_thing_mock:
+                    when(my_thing_mock.return_a_str()).then_yield_from(responses, loop=True)
+
+                for i in range(2):
+                    self.assertEqual("first response", my_thing_mock.return_a_str())
+                    self.assertEqual("second response", my_thing_mock.return_a_str())
+
+    def test_mock__then_yield_from__loop_over_iterator__mocking_error(self):
+        with self.assertRaises(MockingError):
+            with tmock(MyThing) as my_thing_mock:
+                when(my_thing_mock.return_a_str()).then_yield_from(iter(["a"]), loop=True)
+
+    def test_mock__then_yield_from__validates_each_response_when_served(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.return_a_str()).then_yield_from(iter(["a", 1]))
+
+        self.assertEqual("a", my_thing_mock.return_a_str())
+        with self.assertRaises(MockTypeSafetyError):
+            my_thing_mock.return_a_str()
+
     def test_mock__then_do(self):
         expected_arg = 1
 
@@ -0,0 +1,166 @@
+import asyncio
+from unittest import TestCase
+
+from typemock import match, profile, setup_mock, tmock, tspy, when
+from typemock._mock import observe, profiling
+from typemock._mock.profiling import Profile
+from typemock.api import MockTypeSafetyError, NoBehaviourSpecifiedError
+
+
+class Repository:
+    def get(self, key: str) -> int:
+        return 1
+
+    def count(self) -> int:
+        return 0
+
+    async def fetch(self, key: str) -> int:
+        return 1
+
+
+def _stubbed() -> Repository:
+    repository = tmock(Repository)
+    with setup_mock(repository):
+        when(repository.get("a")).then_return(1)
+        when(repository.get(match.has_prefix("b"))).then_return(2)
+        when(repository.count()).then_return(0)
+    return repository
+
+
+class TestProfile(TestCase):
+    def test_profile__phases_per_method(self):
+        repository = _stubbed()
+
+        with profile() as p:
+            repository.get("a")
+            repository.get("b1")
+            repository.count()
+
+        get = p.of(repository)["get"]
+        self.assertEqual(2, get.calls)
+        self.assertEqual("Repository", get.mock_name)
+        for phase in profiling.PHASES:
+            with self.subTest(phase=phase):
+                self.assertGreaterEqual(get.phases[phase].count, 2)
+        # The call matched by a matcher is checked against the hints once, like any other.
+        self.assertEqual(2, get.phases[profiling.ARG_CHECK].count)
+        self.assertEqual(1, p.of(repository)["count"].calls)
+        self.assertEqual(["get", "count"], [m.method_name for m in p.methods()][:2])
+
+    def test_profile__per_mock(self):
+        first = _stubbed()
+        second = _stubbed()
+
+        with profile() as p:
+            first.get("a")
+            second.get("a")
+            second.get("a")
+
+        self.assertEqual(1, p.of(first)["get"].calls)
+        self.assertEqual(2, p.of(second)["get"].calls)
+
+    def test_profile__not_timed_outside(self):
+        repository = _stubbed()
+        repository.get("a")
+
+        with profile() as p:
+            pass
+        repository.get("a")
+
+        self.assertEqual({}, p.of(repository))
+        self.assertFalse(observe.profiling)
+
+    def test_profile__nested(self):
+        repository = _stubbed()
+
+        with profile() as outer:
+            repository.get("a")
+            with profile() as inner:
+                repository.get("a")
+            self.assertTrue(observe.profiling)
+
+        self.assertEqual(2, outer.of(repository)["get"].calls)
+        self.assertEqual(1, inner.of(repository)["get"].calls)
+        self.assertFalse(observe.profiling)
+
+    def test_profile__miss_and_type_error(self):
+        repository = _stubbed()
+
+        with profile() as p:
+            with self.assertRaises(NoBehaviourSpecifiedError):
+                repository.get("z")
+            with self.assertRaises(MockTypeSafetyError):
+                repository.get(1)  # type: ignore[arg-type]
+
+        get = p.of(repository)["get"]
+        self.assertEqual(2, get.calls)
+        self.assertEqual(1, get.phases[profiling.LOOKUP].count)
+        self.assertEqual(0, get.phases[profiling.RESPONDER].count)
+
+    def test_profile__async(self):
+        repository = tmock(Repository)
+
+        async def run() -> int:
+            with setup_mock(repository):
+                when(await repository.fetch("a")).then_return(1)
+            with profile() as p:
+                result = await repository.fetch("a")
+            self.assertEqual(1, p.of(repository)["fetch"].calls)
+            return result
+
+        self.assertEqual(1, asyncio.run(run()))
+
+    def test_profile__async_delayed(self):
+        repository = tmock(Repository)
+
+        async def run() -> Profile:
+            with setup_mock(repository):
+                when(await repository.fetch("a")).then_delay(0).then_return(1)
+            with profile() as p:
+                await repository.fetch("a")
+            return p
+
+        fetch = asyncio.run(run()).of(repository)["fetch"]
+        self.assertEqual(1, fetch.calls)
+        for phase in profiling.PHASES:
+            with self.subTest(phase=phase):
+                self.assertEqual(1, fetch.phases[phase].count)
+
+    def test_profile__spy(self):
+        spy = tspy(Repository())
+        with setup_mock(spy):
+            when(spy.get("a")).then_return(5)
+
+        with profile() as p:
+            spy.get("a")
+            spy.get("b")
+
+        get = p.of(spy)["get"]
+        self.assertEqual(2, get.calls)
+        self.assertEqual(2, get.phases[profiling.LOOKUP].count)
+        self.assertEqual(1, get.phases[profiling.RESPONDER].count)
+
+    def test_profile__async_spy(self):
+        spy = tspy(Repository())
+
+        async def run() -> Profile:
+            with setup_mock(spy):
+                when(await spy.fetch("a")).then_return(5)
+            with profile() as p:
+                await spy.fetch("a")
+            return p
+
+        fetch = asyncio.run(run()).of(spy)["fetch"]
+        self.assertEqual(1, fetch.calls)
+        self.assertEqual(1, fetch.phases[profiling.RETURN_CHECK].count)
+
+    def test_profile__report(self):
+        repository = _stubbed()
+
+        with profile() as p:
+            repository.get("a")
+
+        report = p.report()
+        self.assertIn("Repository.get", report)
+        self.assertIn("return_check", report)
+        self.assertEqual("get", p.as_dict()[0]["method"])
@@ -0,0 +1,134 @@
+import asyncio
+from unittest import TestCase
+
+import trio
+
+from typemock import (
+    attr,
+    calls,
+    current_scope,
+    match,
+    recording_scope,
+    setup_mock,
+    tmock,
+    verify,
+    when,
+)
+from typemock.api import VerifyError
+
+
+class MyClient:
+    name: str = "client"
+
+    def fetch(self, request_id: int) -> str:
+        pass
+
+    async def fetch_async(self, request_id: int) -> str:
+        pass
+
+
+def _client() -> MyClient:
+    client = tmock(MyClient)
+
+    async def setup():
+        with setup_mock(client):
+            when(client.fetch(match.anything())).then_return("result")
+            when(await client.fetch_async(match.anything())).then_return("result")
+
+    asyncio.run(setup())
+    return client
+
+
+class TestRecordingScope(TestCase):
+    def test_scope__only_sees_calls_within_it(self):
+        client = _client()
+        client.fetch(1)
+        with recording_scope() as scope:
+            client.fetch(2)
+        client.fetch(3)
+
+        self.assertEqual([(("request_id", 2),)], calls(client, scope=scope).fetch.call_args_list)
+        self.assertEqual(3, calls(client).fetch.call_count)
+        verify(client, exactly=1, scope=scope).fetch(2)
+        with self.assertRaises(VerifyError):
+            verify(client, scope=scope).fetch(1)
+
+    def test_scope__nested_scopes_both_record(self):
+        client = _client()
+        with recording_scope() as outer:
+            client.fetch(1)
+            with recording_scope() as inner:
+                self.assertIs(inner, current_scope())
+                client.fetch(2)
+            self.assertIs(outer, current_scope())
+
+        self.assertEqual(2, calls(client, scope=outer).fetch.call_count)
+        self.assertEqual(1, calls(client, scope=inner).fetch.call_count)
+        self.assertIsNone(current_scope())
+
+    def test_scope__attribute_gets_and_sets(self):
+        client = tmock(MyClient)
+        with setup_mock(client):
+            attr(client.name).then_return("mocked")
+
+        _ = client.name
+        with recording_scope() as scope:
+            _ = client.name
+            client.name = "changed"
+
+        verify(client, exactly=1, scope=scope).name
+        verify(client, exactly=1, scope=scope).name = "changed"
+        verify(client, exactly=2).name
+
+    def test_scope__asyncio_tasks(self):
+        client = _client()
+
+        async def handle(request_id: int):
+            with recording_scope() as scope:
+                await asyncio.sleep(0)
+                await client.fetch_async(request_id)
+                await asyncio.sleep(0)
+                await client.fetch_async(request_id)
+            return request_id, scope
+
+        async def main():
+            return await asyncio.gather(*(handle(i) for i in range(10)))
+
+        for request_id, scope in asyncio.run(main()):
+            verify(client, exactly=2, scope=scope).fetch_async(request_id)
+            self.assertEqual(2, calls(client, scope=scope).fetch_async.call_count)
+
+    def test_scope__trio_tasks(self):
+        client = _client()
+        scopes = {}
+
+        async def handle(request_id: int):
+            with recording_scope() as scope:
+                scopes[request_id] = scope
+                await trio.sleep(0)
+                await client.fetch_async(request_id)
+                await trio.sleep(0)
+                await client.fetch_async(request_id)
+
+        async def main():
+            async with trio.open_nursery() as nursery:
+                for i in range(10):
+                    nursery.start_soon(handle, i)
+
+        trio.run(main)
+
+        for request_id, scope in scopes.items():
+            verify(client, exactly=2, scope=scope).fetch_async(request_id)
+            self.assertEqual(2, calls(client, scope=scope).fetch_async.call_count)
+
+    def test_scope__tasks_started_within_scope_record_into_it(self):
+        client = _client()
+
+        async def main():
+            with recording_scope() as scope:
+                await asyncio.gather(*(client.fetch_async(i) for i in range(3)))
+            return scope
+
+        scope = asyncio.run(main())
+
+        self.assertEqual(3, calls(client, scope=scope).fetch_async.call_count)
@@ -0,0 +1,147 @@
+import asyncio
+import gc
+import weakref
+from collections.abc import Callable
+from unittest import TestCase
+
+from typemock import calls, match, tspy, verify, when
+from typemock.api import MockingError, MockTypeSafetyError
+
+
+class Service:
+    name: str = "service"
+
+    def __init__(self, looked_up: list[str] | None = None) -> None:
+        self.looked_up = looked_up if looked_up is not None else []
+
+    def lookup(self, key: str, default: int = 0) -> int:
+        self.looked_up.append(key)
+        return len(key) + default
+
+    def only_keywords(self, key: str, *, scale: int = 1) -> int:
+        return len(key) * scale
+
+    def only_positional(self, key: str, /, default: int = 0) -> int:
+        return len(key) + default
+
+    def joined(self, *parts: str, **options: str) -> str:
+        return options.get("sep", "").join(parts)
+
+    async def fetch(self, key: str) -> str:
+        return key.upper()
+
+
+class TestSpy(TestCase):
+    def test_spy__forwards_to_real_object(self):
+        real = Service()
+        spy = tspy(real)
+
+        self.assertEqual(3, spy.lookup("abc"))
+        self.assertEqual(4, spy.lookup(key="abc", default=1))
+        self.assertEqual(["abc", "abc"], real.looked_up)
+
+    def test_spy__records_forwarded_calls(self):
+        spy = tspy(Service())
+
+        spy.lookup("abc")
+        spy.lookup(key="abc")
+        spy.lookup("d", 1)
+
+        verify(spy, exactly=2).lookup("abc")
+        verify(spy).lookup(key="d", default=1)
+        self.assertEqual(3, calls(spy).lookup.call_count)
+
+    def test_spy__specified_behaviour_overrides_real(self):
+        real = Service()
+
+        with tspy(real) as spy:
+            when(spy.lookup("abc")).then_return(100)
+            when(spy.lookup(match.anything(), 5)).then_return(500)
+
+        self.assertEqual(100, spy.lookup("abc"))
+        self.assertEqual(100, spy.lookup(key="abc", default=0))
+        self.assertEqual(500, spy.lookup("x", default=5))
+        self.assertEqual(2, spy.lookup("xy"))
+        self.assertEqual(["xy"], real.looked_up)
+        verify(spy, exactly=4).lookup(match.anything(), match.anything())
+
+    def test_spy__specified_behaviour_is_type_checked(self):
+        with self.assertRaises(MockTypeSafetyError):
+            with tspy(Service()) as spy:
+                when(spy.lookup("abc")).then_return("not an int")
+
+    def test_spy__keyword_only_and_positional_only(self):
+        with tspy(Service()) as spy:
+            when(spy.only_keywords("ab", scale=10)).then_return(0)
+
+        self.assertEqual(0, spy.only_keywords("ab", scale=10))
+        self.assertEqual(2, spy.only_keywords("ab"))
+        self.assertEqual(3, spy.only_positional("ab", 1))
+        verify(spy).only_keywords("ab", scale=1)
+        verify(spy).only_positional("ab", default=1)
+
+    def test_spy__var_args(self):
+        with tspy(Service()) as spy:
+            when(spy.joined("a", "b", sep="-")).then_return("stubbed")
+
+        self.assertEqual("stubbed", spy.joined("a", "b", sep="-"))
+        self.assertEqual("a+b", spy.joined("a", "b", sep="+"))
+        verify(spy).joined("a", "b", sep="+")
+
+    def test_spy__async(self):
+        with tspy(Service()) as spy:
+            when(asyncio.run(spy.fetch("stubbed"))).then_return("STUBBED!")
+
+        self.assertEqual("ABC", asyncio.run(spy.fetch("abc")))
+        self.assertEqual("STUBBED!", asyncio.run(spy.fetch("stubbed")))
+        verify(spy).fetch("abc")
+
+    def test_spy__attributes_pass_through(self):
+        real = Service()
+        spy = tspy(real)
+
+        self.assertEqual("service", spy.name)
+        real.name = "changed"
+        self.assertEqual("changed", spy.name)
+        spy.name = "set by spy"
+        self.assertEqual("set by spy", real.name)
+        self.assertEqual("set by spy", spy.name)
+
+    def test_spy__attribute_specified_behaviour(self):
+        with tspy(Service()) as spy:
+            when(spy.name).then_return("stubbed")
+
+        self.assertEqual("stubbed", spy.name)
+
+    def test_spy__two_spies_of_a_class_are_independent(self):
+        first = Service()
+        second = Service()
+        first_spy = tspy(first)
+        second_spy = tspy(second)
+
+        first_spy.lookup("a")
+        second_spy.lookup("b")
+
+        self.assertEqual(["a"], first.looked_up)
+        self.assertEqual(["b"], second.looked_up)
+        verify(first_spy, exactly=0).lookup("b")
+
+    def test_spy__spied_class_not_kept_alive(self):
+        def spy_local() -> tuple[weakref.ref[type], weakref.ref[Callable]]:
+            class Local:
+                def lookup(self, key: str) -> int:
+                    return len(key)
+
+            spy = tspy(Local())
+            spy.lookup("a")
+            return weakref.ref(Local), weakref.ref(Local.lookup)
+
+        local_class, local_method = spy_local()
+        gc.collect()
+
+        self.assertIsNone(local_class())
+        self.assertIsNone(local_method())
+
+    def test_spy__class_raises(self):
+        with self.assertRaises(MockingError):
+            tspy(Service)
@@ -0,0 +1,91 @@
+from unittest import TestCase
+
+from typemock import attr, calls, match, setup_mock, tmock, when
+from typemock._mock.stats import Histogram
+from typemock.api import NoBehaviourSpecifiedError
+
+
+class MyThing:
+    name: str = "anonymous"
+
+    def get_items(self, count: int) -> list[str]:
+        pass
+
+    def fail(self) -> str:
+        pass
+
+
+class TestHistogram(TestCase):
+    def test_histogram__small_values_are_exact(self):
+        histogram = Histogram()
+        for value in range(10):
+            histogram.record(value)
+
+        self.assertEqual(10, histogram.count)
+        self.assertEqual(0, histogram.min)
+        self.assertEqual(9, histogram.max)
+        self.assertEqual(4, histogram.percentile(50))
+
+    def test_histogram__large_values_within_bucket_precision(self):
+        histogram = Histogram()
+        for value in range(1, 100_001):
+            histogram.record(value)
+
+        p90 = histogram.percentile(90)
+
+        self.assertLessEqual(abs(p90 - 90_000) / 90_000, 0.125)
+        self.assertEqual(100_000, histogram.percentile(100))
+
+
+class TestMethodStats(TestCase):
+    def test_stats__not_instrumented__none(self):
+        mock = tmock(MyThing)
+
+        self.assertIsNone(calls(mock).get_items.stats)
+
+    def test_stats__counts_returns_and_sizes(self):
+        mock = tmock(MyThing, instrument=True)
+        with setup_mock(mock):
+            when(mock.get_items(match.anything())).then_do(lambda count: ["x"] * count)
+
+        mock.get_items(2)
+        mock.get_items(5)
+
+        stats = calls(mock).get_items.stats
+        assert stats is not None
+        self.assertEqual(2, stats.calls)
+        self.assertEqual(2, stats.returned)
+        self.assertEqual(0, stats.raised)
+        self.assertEqual(2, stats.latency_ns.count)
+        self.assertEqual(2, stats.return_sizes.min)
+        self.assertEqual(5, stats.return_sizes.max)
+
+    def test_stats__counts_raises_and_misses(self):
+        mock = tmock(MyThing, instrument=True)
+        with setup_mock(mock):
+            when(mock.fail()).then_raise(IOError())
+
+        with self.assertRaises(IOError):
+            mock.fail()
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            mock.get_items(1)
+
+        fail_stats = calls(mock).fail.stats
+        get_stats = calls(mock).get_items.stats
+        assert fail_stats is not None and get_stats is not None
+        self.assertEqual(1, fail_stats.raised)
+        self.assertEqual(1, get_stats.misses)
+        self.assertEqual(0, get_stats.returned)
+
+    def test_stats__attribute_gets(self):
+        mock = tmock(MyThing, instrument=True)
+        with setup_mock(mock):
+            attr(mock.name).then_return("bob")
+
+        _ = mock.name
+        _ = mock.name
+
+        stats = calls(mock).name.stats
+        assert stats is not None
+        self.assertEqual(2, stats.calls)
+        self.assertEqual(3, stats.return_sizes.max)
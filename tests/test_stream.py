@@ -0,0 +1,139 @@
+import asyncio
+from collections.abc import AsyncIterator, Generator, Iterator
+from unittest import TestCase
+
+from typemock import match, tmock, verify, virtual_time_loop, when
+from typemock.api import MockingError, MockTypeSafetyError, TypeSafety
+
+
+class Pages:
+    name: str = "pages"
+
+    def rows(self, table: str) -> Iterator[int]:
+        pass
+
+    def generated(self, table: str) -> Generator[int, None, None]:
+        yield 1
+
+    def not_a_stream(self, table: str) -> int:
+        pass
+
+    async def async_rows(self, table: str) -> AsyncIterator[int]:
+        yield 1
+
+    def hinted_async_rows(self, table: str) -> AsyncIterator[int]:
+        pass
+
+
+class UnhintedPages:
+    def rows(self, table):
+        yield 1
+
+
+async def _collect(stream: AsyncIterator[int]) -> list[int]:
+    return [item async for item in stream]
+
+
+class TestStream(TestCase):
+    def test_then_stream__new_stream_per_call(self):
+        with tmock(Pages) as mock:
+            when(mock.rows("a")).then_stream([1, 2, 3])
+
+        self.assertEqual([1, 2, 3], list(mock.rows("a")))
+        self.assertEqual([1, 2, 3], list(mock.rows("a")))
+        verify(mock, exactly=2).rows("a")
+
+    def test_then_stream__pulls_lazily(self):
+        pulled = []
+
+        def source():
+            for i in range(1_000_000):
+                pulled.append(i)
+                yield i
+
+        with tmock(Pages) as mock:
+            when(mock.generated(match.anything())).then_stream(source)
+
+        stream = mock.generated("a")
+        self.assertEqual(0, next(stream))
+        self.assertEqual(1, next(stream))
+        self.assertEqual([0, 1], pulled)
+
+    def test_then_stream__iterator_streamed_once(self):
+        with tmock(Pages) as mock:
+            when(mock.rows("a")).then_stream(iter([1, 2]))
+
+        self.assertEqual([1, 2], list(mock.rows("a")))
+        self.assertEqual([], list(mock.rows("a")))
+
+    def test_then_stream__items_type_checked_as_yielded(self):
+        with tmock(Pages) as mock:
+            when(mock.rows("a")).then_stream([1, "two", 3])
+
+        stream = mock.rows("a")
+        self.assertEqual(1, next(stream))
+        with self.assertRaises(MockTypeSafetyError):
+            next(stream)
+
+    def test_then_stream__unhinted_generator_not_type_checked(self):
+        with tmock(UnhintedPages, type_safety=TypeSafety.RELAXED) as mock:
+            when(mock.rows("a")).then_stream(["one", 2])
+
+        self.assertEqual(["one", 2], list(mock.rows("a")))
+
+    def test_then_stream__async_generator(self):
+        async def source():
+            yield 1
+            yield 2
+
+        with tmock(Pages) as mock:
+            when(mock.async_rows("a")).then_stream([1, 2, 3])
+            when(mock.hinted_async_rows("a")).then_stream(source)
+
+        self.assertEqual([1, 2, 3], asyncio.run(_collect(mock.async_rows("a"))))
+        self.assertEqual([1, 2], asyncio.run(_collect(mock.hinted_async_rows("a"))))
+
+    def test_then_stream__async_items_type_checked(self):
+        with tmock(Pages) as mock:
+            when(mock.async_rows("a")).then_stream(["one"])
+
+        with self.assertRaises(MockTypeSafetyError):
+            asyncio.run(_collect(mock.async_rows("a")))
+
+    def test_then_stream__chunk_delay(self):
+        with tmock(Pages) as mock:
+            when(mock.async_rows("a")).then_stream(range(10), chunk_delay=0.5)
+
+        async def scenario() -> tuple[list[int], float]:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            items = await _collect(mock.async_rows("a"))
+            return items, loop.time() - start
+
+        items, elapsed = asyncio.run(scenario(), loop_factory=virtual_time_loop)
+
+        self.assertEqual(list(range(10)), items)
+        self.assertAlmostEqual(5.0, elapsed)
+
+    def test_then_stream__chunk_delay_sync_raises(self):
+        with self.assertRaises(MockingError):
+            with tmock(Pages) as mock:
+                when(mock.rows("a")).then_stream([1], chunk_delay=0.1)
+
+    def test_then_stream__async_source_for_sync_raises(self):
+        async def source():
+            yield 1
+
+        with self.assertRaises(MockingError):
+            with tmock(Pages) as mock:
+                when(mock.rows("a")).then_stream(source())
+
+    def test_then_stream__not_a_stream_raises(self):
+        with self.assertRaises(MockingError):
+            with tmock(Pages) as mock:
+                when(mock.not_a_stream("a")).then_stream([1])
+
+    def test_then_stream__attribute_raises(self):
+        with self.assertRaises(MockingError):
+            with tmock(Pages) as mock:
+                when(mock.name).then_stream(["a"])
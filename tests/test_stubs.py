@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+from typemock import match
+from typemock._mock.responders import ResponderBasic
+from typemock._mock.stubs import StubTable
+
+
+class TestStubTable(TestCase):
+    def test_lookup__hashable_key(self):
+        table = StubTable()
+        responder = ResponderBasic(1)
+        table.put((("a", 1),), responder, has_matchers=False)
+
+        self.assertEqual((responder, False), table.lookup((("a", 1),)))
+        self.assertIsNone(table.lookup((("a", 2),)))
+
+    def test_lookup__unhashable_key(self):
+        table = StubTable()
+        responder = ResponderBasic(1)
+        table.put((("a", [1, 2]),), responder, has_matchers=False)
+
+        self.assertEqual((responder, False), table.lookup((("a", [1, 2]),)))
+
+    def test_lookup__matchers_checked_newest_first(self):
+        table = StubTable()
+        first = ResponderBasic(1)
+        second = ResponderBasic(2)
+        table.put((("a", match.anything()),), first, has_matchers=True)
+        table.put((("a", match.instance_of(int)),), second, has_matchers=True)
+
+        self.assertEqual((second, True), table.lookup((("a", 1),)))
+        self.assertEqual((first, True), table.lookup((("a", "x"),)))
+
+        table.put((("a", match.anything()),), first, has_matchers=True)
+
+        self.assertEqual((first, True), table.lookup((("a", 1),)))
+
+    def test_lookup__sees_writes_made_after_a_read(self):
+        table = StubTable()
+        table.put((("a", 1),), ResponderBasic(1), has_matchers=False)
+        table.lookup((("a", 1),))
+
+        replacement = ResponderBasic(2)
+        table.put((("a", 1),), replacement, has_matchers=False)
+
+        self.assertEqual((replacement, False), table.lookup((("a", 1),)))
+        self.assertEqual(1, len(table))
+
+    def test_lookup__matchers_pruned_by_index_values(self):
+        tested = []
+
+        def predicate(value: int) -> bool:
+            tested.append(value)
+            return True
+
+        table = StubTable()
+        first = ResponderBasic(1)
+        second = ResponderBasic(2)
+        scanned = ResponderBasic(3)
+        table.put((("a", match.between(0, 10)),), scanned, has_matchers=True)
+        table.put(
+            (("a", match.all_of(match.one_of({1, 2}), match.lambda_(predicate))),),
+            first,
+            has_matchers=True,
+        )
+        table.put((("a", match.one_of({3})), ("b", match.anything())), second, has_matchers=True)
+
+        self.assertEqual((first, True), table.lookup((("a", 2),)))
+        self.assertEqual((scanned, True), table.lookup((("a", 5),)))
+        self.assertEqual([2], tested)
+
+    def test_lookup__indexed_matchers_checked_newest_first(self):
+        table = StubTable()
+        first = ResponderBasic(1)
+        second = ResponderBasic(2)
+        table.put((("a", match.one_of({1})), ("b", match.anything())), first, has_matchers=True)
+        table.put((("a", match.anything()), ("b", 1)), second, has_matchers=True)
+
+        self.assertEqual((second, True), table.lookup((("a", 1), ("b", 1))))
+        self.assertEqual((first, True), table.lookup((("a", 1), ("b", 2))))
+        self.assertIsNone(table.lookup((("a", 2), ("b", 2))))
+        self.assertEqual((second, True), table.lookup((("a", [1]), ("b", 1))))
+
+    def test_put__same_matchers_replace(self):
+        table = StubTable()
+        replacement = ResponderBasic(2)
+        table.put((("a", match.between(1, 2)),), ResponderBasic(1), has_matchers=True)
+        table.put((("a", match.one_of({5})),), ResponderBasic(3), has_matchers=True)
+        table.put((("a", match.between(1, 2)),), replacement, has_matchers=True)
+
+        self.assertEqual(2, len(table))
+        self.assertEqual((replacement, True), table.lookup((("a", 1),)))
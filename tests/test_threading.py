@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from typemock import attr, calls, match, setup_mock, tmock, verify, when
+from typemock._mock.recording import InteractionTally, ShardedCallLog
+from typemock._utils import gil_enabled
+from typemock.api import NoBehaviourSpecifiedError
+
+THREADS = 8
+CALLS_PER_THREAD = 2_000
+TOTAL_CALLS = THREADS * CALLS_PER_THREAD
+
+
+class MyThing:
+    count: int = 0
+
+    def next_id(self) -> int:
+        pass
+
+    def echo(self, value: int) -> int:
+        pass
+
+
+def _in_threads(work) -> list:
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        futures = [executor.submit(work, thread) for thread in range(THREADS)]
+        return [future.result() for future in futures]
+
+
+class TestShardedCallLog(TestCase):
+    def test_log__merged_in_call_order(self):
+        log: ShardedCallLog[tuple[int, int]] = ShardedCallLog()
+
+        def work(thread: int) -> None:
+            for i in range(CALLS_PER_THREAD):
+                log.append((thread, i))
+
+        _in_threads(work)
+        log.append((-1, 0))
+
+        self.assertEqual(TOTAL_CALLS + 1, len(log))
+        self.assertEqual((-1, 0), log[-1])
+        for thread in range(THREADS):
+            with self.subTest(thread=thread):
+                self.assertEqual(list(range(CALLS_PER_THREAD)), [i for t, i in log if t == thread])
+
+    def test_tally__counts_records_stamped_before_the_last_sync(self):
+        log: ShardedCallLog[str] = ShardedCallLog()
+        tally = InteractionTally(log)
+        log.append("first")
+        self.assertEqual([("first", 1)], tally.unverified())
+
+        # A call from another thread, stamped before the sync but appended after it, merges ahead of "first".
+        log._shards.append([(0, "early")])
+        log.append("second")
+
+        self.assertCountEqual([("first", 1), ("early", 1), ("second", 1)], tally.unverified())
+
+
+class TestThreadSafeMock(TestCase):
+    def test_calls__no_lost_records(self):
+        mock = tmock(MyThing, thread_safe=True)
+        with setup_mock(mock):
+            when(mock.echo(match.anything())).then_do(lambda value: value)
+
+        def work(thread: int) -> None:
+            for i in range(CALLS_PER_THREAD):
+                mock.echo(thread * CALLS_PER_THREAD + i)
+
+        _in_threads(work)
+
+        self.assertEqual(TOTAL_CALLS, calls(mock).echo.call_count)
+        self.assertEqual(
+            set(range(TOTAL_CALLS)),
+            {call[0][1] for call in calls(mock).echo.call_args_list},
+        )
+        verify(mock, exactly=1).echo(1234)
+
+    def test_return_many__each_response_served_exactly_once(self):
+        mock = tmock(MyThing, thread_safe=True)
+        with setup_mock(mock):
+            when(mock.next_id()).then_return_many(list(range(TOTAL_CALLS)))
+
+        def work(thread: int) -> list[int]:
+            return [mock.next_id() for _ in range(CALLS_PER_THREAD)]
+
+        served = [value for values in _in_threads(work) for value in values]
+
+        self.assertEqual(list(range(TOTAL_CALLS)), sorted(served))
+        with self.assertRaises(NoBehaviourSpecifiedError):
+            mock.next_id()
+
+    def test_yield_from__each_response_served_exactly_once(self):
+        mock = tmock(MyThing, thread_safe=True)
+        with setup_mock(mock):
+            when(mock.next_id()).then_yield_from(i for i in range(TOTAL_CALLS))
+
+        def work(thread: int) -> list[int]:
+            return [mock.next_id() for _ in range(CALLS_PER_THREAD)]
+
+        served = [value for values in _in_threads(work) for value in values]
+
+        self.assertEqual(list(range(TOTAL_CALLS)), sorted(served))
+
+    def test_attribute_gets__no_lost_updates(self):
+        mock = tmock(MyThing, thread_safe=True)
+        with setup_mock(mock):
+            attr(mock.count).then_return(1)
+
+        def work(thread: int) -> None:
+            for _ in range(CALLS_PER_THREAD):
+                _ = mock.count
+
+        _in_threads(work)
+
+        verify(mock, exactly=TOTAL_CALLS).count
+
+    def test_thread_safe__defaults_to_gil_status(self):
+        mock = tmock(MyThing)
+
+        self.assertEqual(not gil_enabled(), mock._mock_method_states[0]._thread_safe)
@@ -0,0 +1,110 @@
+import enum
+from collections.abc import Callable, Iterable
+from typing import Any, Literal, Optional, Protocol, TypedDict, Union
+from unittest import TestCase
+
+from typemock import tmock, when
+from typemock._typecheck import checker_for, compiled_checker, typeguard_checker
+from typemock.api import MockTypeSafetyError, TypeCheckBackend, TypeSafety
+
+
+class Colour(enum.Enum):
+    RED = 1
+
+
+class Named(Protocol):
+    name: str
+
+
+class Point(TypedDict):
+    x: int
+
+
+class Thing:
+    name: str = "thing"
+
+
+_hints_and_values: list[tuple[Any, list[Any]]] = [
+    (Any, [1, None]),
+    (object, [1, None]),
+    (None, [None, 1]),
+    (int, [1, True, 1.0, "1"]),
+    (float, [1.0, 1, "1", None]),
+    (complex, [1j, 1.0, 1, "1"]),
+    (bytes, [b"a", bytearray(b"a"), memoryview(b"a"), "a"]),
+    (bool, [True, 1]),
+    (str, ["a", b"a"]),
+    (Thing, [Thing(), object()]),
+    (Colour, [Colour.RED, 1]),
+    (Optional[int], [1, None, "1"]),
+    (int | str, [1, "a", None]),
+    (Union[int, float], [1, 1.0, "1"]),
+    (int | Any, [1, "a"]),
+    (Literal[1, "a"], [1, "a", True, 2, 1.0]),
+    (Literal[Colour.RED], [Colour.RED, 1]),
+    (list[str], [["a"], [1], "a", []]),
+    (dict[str, int], [{"a": 1}, {"a": "b"}]),
+    (tuple[int, ...], [(1, 2), (1, "a")]),
+    (Iterable[int], [[1], 1]),
+    (Callable[[int], str], [str, 1]),
+    (Named, [Thing(), 1]),
+    (Point, [{"x": 1}, {"x": "a"}]),
+    (int | list[str], [1, ["a"], [1]]),
+]
+
+
+class TestCompiledChecker(TestCase):
+    def test_compiled__agrees_with_typeguard(self):
+        for hint, values in _hints_and_values:
+            compiled = compiled_checker(hint)
+            typeguard = typeguard_checker(hint)
+            for value in values:
+                with self.subTest(hint=hint, value=value):
+                    self.assertEqual(typeguard(value), compiled(value))
+
+    def test_checker_for__backends(self):
+        self.assertTrue(checker_for(int, TypeCheckBackend.TYPEGUARD)(1))
+        self.assertFalse(checker_for(int, TypeCheckBackend.COMPILED)("1"))
+
+
+class Service:
+    def names(self, prefix: str) -> list[str]:
+        pass
+
+    def maybe(self, value: int | None = None) -> Optional[str]:
+        pass
+
+
+class NoReturnService:
+    def names(self, prefix: str) -> list[str]:
+        pass
+
+    def nothing(self, value: int):
+        pass
+
+
+class TestTypeCheckBackends(TestCase):
+    def test_mock__backends_check_args_and_returns(self):
+        for backend in (TypeCheckBackend.TYPEGUARD, TypeCheckBackend.COMPILED):
+            with self.subTest(backend=backend):
+                with tmock(Service, type_check=backend) as mock:
+                    when(mock.names("a")).then_return(["a"])
+                    when(mock.maybe()).then_return(None)
+                    with self.assertRaises(MockTypeSafetyError):
+                        when(mock.names("a")).then_return([1])
+                    with self.assertRaises(MockTypeSafetyError):
+                        when(mock.maybe("1")).then_return("a")  # type: ignore[arg-type]
+
+                self.assertEqual(["a"], mock.names("a"))
+                self.assertIsNone(mock.maybe(None))
+
+    def test_no_return_is_none_return__generic_return(self):
+        with tmock(NoReturnService, type_safety=TypeSafety.NO_RETURN_IS_NONE_RETURN) as mock:
+            when(mock.names("a")).then_return(["a"])
+            when(mock.nothing(1)).then_return(None)
+            with self.assertRaises(MockTypeSafetyError):
+                when(mock.names("b")).then_return([1])
+            with self.assertRaises(MockTypeSafetyError):
+                when(mock.nothing(2)).then_return(1)
+
+        self.assertEqual(["a"], mock.names("a"))
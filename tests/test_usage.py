@@ -0,0 +1,192 @@
+import json
+import tempfile
+import threading
+from pathlib import Path
+from unittest import TestCase
+
+from typemock import match, setup_mock, stub_usage, tmock, tspy, when
+from typemock._mock import observe
+from typemock._mock.stubs import StubTable
+from typemock._mock.usage import StubUsageReport
+from typemock.api import NoBehaviourSpecifiedError
+from typemock.pytest_plugin import merge_worker_usage, write_worker_usage
+
+
+class Repository:
+    def get(self, key: str) -> int:
+        return 1
+
+    def count(self) -> int:
+        return 0
+
+
+def _stubbed() -> Repository:
+    repository = tmock(Repository)
+    with setup_mock(repository):
+        when(repository.get("a")).then_return(1)
+        when(repository.get("b")).then_return(2)
+        when(repository.get(match.has_prefix("c"))).then_return(3)
+        when(repository.count()).then_return(0)
+    return repository
+
+
+A = (("key", "a"),)
+B = (("key", "b"),)
+Z = (("key", "z"),)
+
+
+class TestStubTable(TestCase):
+    def test_usage(self):
+        stubs: StubTable = StubTable()
+        first, second = object(), object()
+        stubs.put_all([(A, first, False), (B, second, False)])
+
+        stubs.count_hit(first)
+        stubs.count_hit(first)
+        stubs.count_miss(Z)
+        stubs.count_miss(((("key", ["unhashable"]),)))
+
+        hits, misses = stubs.usage()
+        self.assertEqual([(A, 2), (B, 0)], hits)
+        self.assertEqual([(Z, 1), ("(('key', ['unhashable']),)", 1)], misses)
+
+    def test_usage__replaced_stub_starts_again(self):
+        stubs: StubTable = StubTable()
+        first = object()
+        stubs.put_all([(A, first, False)])
+        stubs.count_hit(first)
+
+        stubs.put_all([(A, object(), False)])
+
+        self.assertEqual([(A, 0)], stubs.usage()[0])
+
+    def test_usage__hits_from_many_threads(self):
+        stubs: StubTable = StubTable()
+        first = object()
+        stubs.put_all([(A, first, False)])
+
+        def hit() -> None:
+            for _ in range(10_000):
+                stubs.count_hit(first)
+                stubs.count_miss(Z)
+
+        threads = [threading.Thread(target=hit) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(([(A, 80_000)], [(Z, 80_000)]), stubs.usage())
+
+    def test_usage__replaced_stub_hits_not_counted_for_replacement(self):
+        stubs: StubTable = StubTable()
+        first = object()
+        stubs.put_all([(A, first, False)])
+        stubs.count_hit(first)
+        stubs.put_all([(A, object(), False)])
+        stubs.count_hit(first)
+
+        stubs.put_all([(A, first, False)])
+
+        self.assertEqual([(A, 0)], stubs.usage()[0])
+
+
+class TestStubUsage(TestCase):
+    def test_stub_usage(self):
+        with stub_usage() as usage:
+            repository = _stubbed()
+            repository.get("a")
+            repository.get("a")
+            repository.get("c1")
+            with self.assertRaises(NoBehaviourSpecifiedError):
+                repository.get("z")
+
+        self.assertEqual(
+            [("Repository", "count", ""), ("Repository", "get", "key='b'")], usage.unused()
+        )
+        self.assertEqual(
+            [
+                ("Repository", "get", "key='a'", 2),
+                ("Repository", "get", "key=has_prefix('c')", 1),
+            ],
+            usage.hottest(),
+        )
+        self.assertEqual([("Repository", "get", "key='z'", 1)], usage.misses())
+
+    def test_stub_usage__summed_over_mocks(self):
+        with stub_usage() as usage:
+            first = _stubbed()
+            second = _stubbed()
+            first.get("a")
+            second.get("a")
+            del first
+
+        self.assertEqual([("Repository", "get", "key='a'", 2)], usage.hottest(limit=1))
+
+    def test_stub_usage__spy(self):
+        with stub_usage() as usage:
+            spy = tspy(Repository())
+            with setup_mock(spy):
+                when(spy.get("a")).then_return(5)
+            spy.get("a")
+            spy.get("b")
+
+        self.assertEqual([("Repository", "get", "key='a'", 1)], usage.hottest())
+        self.assertEqual([], usage.misses())
+
+    def test_stub_usage__not_counted_outside(self):
+        repository = _stubbed()
+
+        with stub_usage() as usage:
+            repository.get("a")
+
+        self.assertEqual([], usage.hottest())
+        self.assertFalse(observe.usage)
+        self.assertFalse(observe.enabled)
+
+    def test_stub_usage__format(self):
+        with stub_usage() as usage:
+            repository = _stubbed()
+            repository.get("a")
+
+        text = usage.format()
+        self.assertIn("Unused stubs (3):", text)
+        self.assertIn("Repository.get(key='b')", text)
+        self.assertIn("Misses (0):", text)
+
+
+class TestStubUsageReport(TestCase):
+    def test_round_trip(self):
+        report = StubUsageReport()
+        report.add("Repository", "get", [("key='a'", 2), ("key='b'", 0)], [("key='z'", 1)])
+
+        copy = StubUsageReport.from_dict(json.loads(report.dumps()))
+
+        self.assertEqual(report.as_dict(), copy.as_dict())
+
+    def test_merge(self):
+        report = StubUsageReport()
+        report.add("Repository", "get", [("key='a'", 2), ("key='b'", 0)], [("key='z'", 1)])
+        other = StubUsageReport()
+        other.add("Repository", "get", [("key='a'", 1), ("key='b'", 1)], [("key='z'", 2)])
+
+        report.merge(other)
+
+        self.assertEqual([], report.unused())
+        self.assertEqual(("Repository", "get", "key='a'", 3), report.hottest()[0])
+        self.assertEqual([("Repository", "get", "key='z'", 3)], report.misses())
+
+    def test_worker_files(self):
+        gw0 = StubUsageReport()
+        gw0.add("Repository", "get", [("key='a'", 2), ("key='b'", 0)], [])
+        gw1 = StubUsageReport()
+        gw1.add("Repository", "get", [("key='a'", 0), ("key='b'", 0)], [("key='z'", 1)])
+
+        with tempfile.TemporaryDirectory() as directory:
+            write_worker_usage(Path(directory), "gw0", gw0)
+            write_worker_usage(Path(directory), "gw1", gw1)
+            report = merge_worker_usage(Path(directory), StubUsageReport())
+
+        self.assertEqual([("Repository", "get", "key='b'")], report.unused())
+        self.assertEqual([("Repository", "get", "key='a'", 2)], report.hottest())
+        self.assertEqual([("Repository", "get", "key='z'", 1)], report.misses())
@@ -1,9 +1,33 @@
 from unittest import TestCase
 
-from typemock import match, tmock, verify, when
+from typemock import (
+    expect,
+    expect_all,
+    match,
+    tmock,
+    verify,
+    verify_no_more_interactions,
+    verify_zero_interactions,
+    when,
+)
+from typemock._mock.recording import InteractionTally
 from typemock.api import VerifyError
 
 
+class CountsComparisons:
+    comparisons = 0
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        CountsComparisons.comparisons += 1
+        return isinstance(other, CountsComparisons) and other.value == self.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
 class MyThing:
     some_instance_attribute: str = None
 
@@ -157,3 +181,121 @@ class TestMockVerify(TestCase):
 
         with self.assertRaises(VerifyError):
             verify(my_thing_mock).some_instance_attribute = match.anything()
+
+    def test_verify__wrapper_reused_per_mock_and_exactly(self):
+        my_thing_mock = tmock(MyThing)
+
+        self.assertIs(verify(my_thing_mock), verify(my_thing_mock))
+        self.assertIs(verify(my_thing_mock, exactly=2), verify(my_thing_mock, exactly=2))
+        self.assertIsNot(verify(my_thing_mock), verify(my_thing_mock, exactly=2))
+        self.assertIs(verify(my_thing_mock).return_a_str, verify(my_thing_mock).return_a_str)
+
+    def test_verify__reused_wrapper_sees_new_calls(self):
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.convert_int_to_str(1)).then_return("something")
+
+        verify(my_thing_mock, exactly=0).convert_int_to_str(1)
+        my_thing_mock.convert_int_to_str(1)
+
+        verify(my_thing_mock, exactly=1).convert_int_to_str(1)
+
+
+class TestVerifyNoMoreInteractions(TestCase):
+    def _mock(self) -> MyThing:
+        with tmock(MyThing) as my_thing_mock:
+            when(my_thing_mock.some_instance_attribute).then_return("Hello")
+            when(my_thing_mock.convert_int_to_str(match.anything())).then_return("a")
+            when(my_thing_mock.do_something_with_side_effects()).then_return(None)
+        return my_thing_mock
+
+    def test_verify_no_more_interactions__all_verified(self):
+        my_thing_mock = self._mock()
+        my_thing_mock.convert_int_to_str(1)
+        my_thing_mock.convert_int_to_str(1)
+        my_thing_mock.convert_int_to_str(2)
+        _ = my_thing_mock.some_instance_attribute
+        my_thing_mock.some_instance_attribute = "bye"
+
+        verify(my_thing_mock, exactly=2).convert_int_to_str(1)
+        verify(my_thing_mock).convert_int_to_str(2)
+        verify(my_thing_mock).some_instance_attribute
+        verify(my_thing_mock).some_instance_attribute = "bye"
+
+        verify_no_more_interactions(my_thing_mock)
+
+    def test_verify_no_more_interactions__matcher_verifies_all_matching(self):
+        my_thing_mock = self._mock()
+        for i in range(10):
+            my_thing_mock.convert_int_to_str(i)
+
+        verify(my_thing_mock).convert_int_to_str(match.anything())
+
+        verify_no_more_interactions(my_thing_mock)
+
+    def test_verify_no_more_interactions__unverified__verify_error(self):
+        my_thing_mock = self._mock()
+        my_thing_mock.convert_int_to_str(1)
+        my_thing_mock.convert_int_to_str(2)
+        my_thing_mock.do_something_with_side_effects()
+        _ = my_thing_mock.some_instance_attribute
+
+        verify(my_thing_mock).convert_int_to_str(1)
+
+        with self.assertRaises(VerifyError) as context:
+            verify_no_more_interactions(my_thing_mock)
+
+        message = str(context.exception)
+        self.assertIn("3 unverified interaction(s)", message)
+        self.assertIn("('number', 2)", message)
+        self.assertNotIn("('number', 1)", message)
+        self.assertIn("do_something_with_side_effects", message)
+        self.assertIn("some_instance_attribute", message)
+
+    def test_verify_no_more_interactions__calls_after_verify__verify_error(self):
+        my_thing_mock = self._mock()
+        my_thing_mock.convert_int_to_str(1)
+        verify(my_thing_mock).convert_int_to_str(1)
+
+        my_thing_mock.convert_int_to_str(1)
+
+        with self.assertRaises(VerifyError):
+            verify_no_more_interactions(my_thing_mock)
+
+    def test_verify_no_more_interactions__batch_expectations(self):
+        my_thing_mock = self._mock()
+        my_thing_mock.convert_int_to_str(1)
+        _ = my_thing_mock.some_instance_attribute
+
+        expect_all(
+            my_thing_mock,
+            [
+                expect(my_thing_mock).convert_int_to_str(1),
+                expect(my_thing_mock).some_instance_attribute,
+            ],
+        )
+
+        verify_no_more_interactions(my_thing_mock)
+
+    def test_mark_verified__without_matchers__looked_up_directly(self):
+        records = [CountsComparisons(i) for i in range(1000)]
+        tally = InteractionTally(records)
+        tally.unverified()
+        CountsComparisons.comparisons = 0
+
+        tally.mark_verified(CountsComparisons(5), has_matchers=False)
+
+        self.assertLessEqual(CountsComparisons.comparisons, 1)
+        self.assertEqual(999, len(tally.unverified()))
+
+    def test_verify_zero_interactions(self):
+        my_thing_mock = self._mock()
+
+        verify_zero_interactions(my_thing_mock)
+
+        my_thing_mock.convert_int_to_str(1)
+        verify(my_thing_mock).convert_int_to_str(1)
+
+        with self.assertRaises(VerifyError) as context:
+            verify_zero_interactions(my_thing_mock)
+
+        self.assertIn("1 x method 'convert_int_to_str'", str(context.exception))
@@ -1,18 +1,98 @@
-from collections.abc import Generator
+import asyncio
+import os
+from collections.abc import Generator, Iterable
 from contextlib import contextmanager
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from typemock._calls import CallsWrapper, _calls
-from typemock._mock import _attr, _setup_mock, _tmock, _when
-from typemock._verify import _verify
-from typemock.api import ResponseBuilder, TypeSafety
+from typemock._cassette import _tmock_from_cassette, _trecord
+from typemock._expect import _expect, _expect_all
+from typemock._messages import _set_message_limits
+from typemock._mock import _attr, _setup_mock, _tmock, _tspy, _when
+from typemock._mock.profiling import Profile, _profile
+from typemock._mock.scope import CallScope, _current_scope, _recording_scope
+from typemock._mock.timing import _virtual_time_loop
+from typemock._mock.usage import StubUsageReport, _stub_usage
+from typemock._verify import _verify, _verify_no_more_interactions, _verify_zero_interactions
+from typemock.api import CapturePolicy, ResponseBuilder, TypeCheckBackend, TypeSafety
+from typemock.config import MockConfig, _default_config
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
-def tmock(clazz: type[T] | T, type_safety: TypeSafety = TypeSafety.STRICT) -> T:
-    return _tmock(clazz=clazz, type_safety=type_safety)
+def tmock(
+    clazz: type[T] | T,
+    type_safety: TypeSafety | None = None,
+    instrument: bool | None = None,
+    thread_safe: bool | None = None,
+    capture: CapturePolicy | None = None,
+    capture_overrides: dict[str, CapturePolicy] | None = None,
+    type_check: TypeCheckBackend | None = None,
+    config: MockConfig | str | None = None,
+) -> T:
+    return _tmock(
+        clazz=clazz,
+        type_safety=type_safety,
+        instrument=instrument,
+        thread_safe=thread_safe,
+        capture=capture,
+        capture_overrides=capture_overrides,
+        type_check=type_check,
+        config=config,
+    )
+
+
+def tspy(
+    real_instance: T,
+    type_safety: TypeSafety | None = None,
+    instrument: bool | None = None,
+    thread_safe: bool | None = None,
+    capture: CapturePolicy | None = None,
+    capture_overrides: dict[str, CapturePolicy] | None = None,
+    type_check: TypeCheckBackend | None = None,
+    config: MockConfig | str | None = None,
+) -> T:
+    return _tspy(
+        real_instance=real_instance,
+        type_safety=type_safety,
+        instrument=instrument,
+        thread_safe=thread_safe,
+        capture=capture,
+        capture_overrides=capture_overrides,
+        type_check=type_check,
+        config=config,
+    )
+
+
+def trecord(real_instance: T, path: str | os.PathLike) -> T:
+    return _trecord(real_instance=real_instance, path=path)
+
+
+def tmock_from_cassette(
+    clazz: type[T],
+    path: str | os.PathLike,
+    type_safety: TypeSafety | None = None,
+    loop: bool = False,
+    instrument: bool | None = None,
+    thread_safe: bool | None = None,
+    capture: CapturePolicy | None = None,
+    capture_overrides: dict[str, CapturePolicy] | None = None,
+    type_check: TypeCheckBackend | None = None,
+    config: MockConfig | str | None = None,
+) -> T:
+    return _tmock_from_cassette(
+        clazz=clazz,
+        path=path,
+        type_safety=type_safety,
+        loop=loop,
+        instrument=instrument,
+        thread_safe=thread_safe,
+        capture=capture,
+        capture_overrides=capture_overrides,
+        type_check=type_check,
+        config=config,
+    )
 
 
 def when(mock_call_result: R) -> ResponseBuilder[R]:
@@ -23,15 +103,71 @@ def attr(mock_attr_access: R) -> ResponseBuilder[R]:
     return _attr(mock_attr_access=mock_attr_access)
 
 
-def verify(mock: T, exactly: int = -1) -> T:
-    return _verify(mock=mock, exactly=exactly)
+def verify(mock: T, exactly: int = -1, scope: CallScope | None = None) -> T:
+    return _verify(mock=mock, exactly=exactly, scope=scope)
+
+
+def verify_no_more_interactions(mock: object) -> None:
+    _verify_no_more_interactions(mock=mock)
 
 
-def calls(mock: T) -> CallsWrapper[T]:
-    return _calls(mock=mock)
+def verify_zero_interactions(mock: object) -> None:
+    _verify_zero_interactions(mock=mock)
+
+
+def calls(mock: T, scope: CallScope | None = None) -> CallsWrapper[T]:
+    return _calls(mock=mock, scope=scope)
 
 
 @contextmanager
 def setup_mock(mock: T) -> Generator[T, None, None]:
     with _setup_mock(mock) as m:
         yield m
+
+
+@contextmanager
+def recording_scope(name: str | None = None) -> Generator[CallScope, None, None]:
+    with _recording_scope(name) as scope:
+        yield scope
+
+
+def current_scope() -> CallScope | None:
+    return _current_scope()
+
+
+def expect(mock: T, exactly: int = -1) -> T:
+    return _expect(mock=mock, exactly=exactly)
+
+
+def expect_all(mock: object, expectations: Iterable[Any], scope: CallScope | None = None) -> None:
+    _expect_all(mock=mock, expectations=expectations, scope=scope)
+
+
+def set_error_message_limits(
+    value_limit: int | None = None, message_limit: int | None = None, items_limit: int | None = None
+) -> None:
+    _set_message_limits(
+        value_limit=value_limit, message_limit=message_limit, items_limit=items_limit
+    )
+
+
+@contextmanager
+def default_config(config: MockConfig | str) -> Generator[MockConfig, None, None]:
+    with _default_config(config) as default:
+        yield default
+
+
+@contextmanager
+def profile() -> Generator[Profile, None, None]:
+    with _profile() as p:
+        yield p
+
+
+@contextmanager
+def stub_usage() -> Generator[StubUsageReport, None, None]:
+    with _stub_usage() as report:
+        yield report
+
+
+def virtual_time_loop() -> asyncio.AbstractEventLoop:
+    return _virtual_time_loop()
@@ -1,7 +1,10 @@
 from typing import Any, Generic, TypeVar, cast
 
+from typemock._mock.attributes import MockAttributeState
 from typemock._mock.methods import MockMethodState
 from typemock._mock.object import MockObject
+from typemock._mock.scope import CallScope
+from typemock._mock.stats import MemberStats
 from typemock.api import VerifyError
 
 T = TypeVar("T")
@@ -12,25 +15,32 @@ type CallArgs = tuple[tuple[str, Any], ...]
 class CallInfo:
     """Provides information about calls to a mocked method."""
 
-    def __init__(self, method_state: MockMethodState) -> None:
+    def __init__(self, method_state: MockMethodState, scope: CallScope | None = None) -> None:
         self._method_state = method_state
+        self._scope = scope
 
     @property
     def call_count(self) -> int:
         """Total number of times the method was called."""
-        return len(self._method_state._call_record)
+        return len(self._method_state.recorded_calls(self._scope))
 
     @property
     def call_args(self) -> CallArgs | None:
         """Arguments of the last call, or None if never called."""
-        if not self._method_state._call_record:
+        records = self._method_state.recorded_calls(self._scope)
+        if not records:
             return None
-        return self._method_state._call_record[-1]
+        return records[-1]
 
     @property
     def call_args_list(self) -> list[CallArgs]:
         """List of arguments for all calls."""
-        return list(self._method_state._call_record)
+        return list(self._method_state.recorded_calls(self._scope))
+
+    @property
+    def stats(self) -> MemberStats | None:
+        """Usage counters and latency histograms, or None if the mock was not created with `instrument=True`."""
+        return self._method_state._stats
 
     def assert_called(self) -> None:
         """Assert that the method was called at least once."""
@@ -59,15 +69,19 @@ class CallInfo:
         """Assert that the last call had the specified arguments."""
         if self.call_count == 0:
             raise VerifyError(
-                f"\nExpected '{self._method_state.name}' to have been called with {args}, {kwargs}. "
-                f"Not called.\n"
+                "\nExpected '{}' to have been called with {}, {}. Not called.\n",
+                self._method_state.name,
+                args,
+                kwargs,
             )
-        expected = self._method_state._ordered_call(None, *args, **kwargs)
+        expected = self._method_state.expected_call(None, *args, **kwargs)
         actual = self.call_args
         if expected != actual:
             raise VerifyError(
-                f"\nExpected call: {self._method_state.name}{expected}\n"
-                f"Actual call: {self._method_state.name}{actual}\n"
+                "\nExpected call: {name}{expected}\nActual call: {name}{actual}\n",
+                name=self._method_state.name,
+                expected=expected,
+                actual=actual,
             )
 
     def assert_called_once_with(self, *args, **kwargs) -> None:
@@ -76,6 +90,29 @@ class CallInfo:
         self.assert_called_with(*args, **kwargs)
 
 
+class AttributeCallInfo:
+    """Provides information about interactions with a mocked attribute."""
+
+    def __init__(self, attribute_state: MockAttributeState, scope: CallScope | None = None) -> None:
+        self._attribute_state = attribute_state
+        self._scope = scope
+
+    @property
+    def call_count(self) -> int:
+        """Total number of times the attribute was read."""
+        return self._attribute_state.call_count_gets(self._scope)
+
+    @property
+    def set_args_list(self) -> list[Any]:
+        """List of values the attribute was set to."""
+        return list(self._attribute_state.recorded_sets(self._scope))
+
+    @property
+    def stats(self) -> MemberStats | None:
+        """Usage counters and latency histograms, or None if the mock was not created with `instrument=True`."""
+        return self._attribute_state._stats
+
+
 def _call_info_for_method(method_state: MockMethodState) -> CallInfo:
     return CallInfo(method_state)
 
@@ -84,7 +121,7 @@ class CallsWrapper(Generic[T]):
     """
     Type wrapper for calls() return type.
 
-    Provides CallInfo for each method attribute access.
+    Provides CallInfo for each method attribute access, and AttributeCallInfo for mocked attributes.
     """
 
     def __getattr__(self, name: str) -> CallInfo: ...
@@ -95,24 +132,34 @@ class _CallsObject(Generic[T]):
 
     _tmock_initialised = False
 
-    def __init__(self, mock: MockObject[T]) -> None:
+    def __init__(self, mock: MockObject[T], scope: CallScope | None = None) -> None:
         self._mock = mock
-        self._method_infos: dict[str, CallInfo] = {}
-        for method_state in mock._mock_method_states:
-            self._method_infos[method_state.name] = CallInfo(method_state)
+        self._scope = scope
+        self._method_infos: dict[str, CallInfo | AttributeCallInfo] = {}
         self._tmock_initialised = True
 
-    def __getattribute__(self, item: str) -> CallInfo:
+    def __getattribute__(self, item: str) -> CallInfo | AttributeCallInfo:
         if item.startswith("_"):
             return object.__getattribute__(self, item)
         if object.__getattribute__(self, "_tmock_initialised"):
             method_infos = object.__getattribute__(self, "_method_infos")
-            if item in method_infos:
-                return method_infos[item]
+            info = method_infos.get(item)
+            if info is not None:
+                return info
+            mock = object.__getattribute__(self, "_mock")
+            scope = object.__getattribute__(self, "_scope")
+            method_state = mock._mock_method_states_by_name.get(item)
+            if method_state is not None:
+                info = CallInfo(method_state, scope)
+            elif item in mock._mock_attribute_states:
+                info = AttributeCallInfo(mock._mock_attribute_states[item], scope)
+            if info is not None:
+                method_infos[item] = info
+                return info
         return object.__getattribute__(self, item)
 
 
-def _calls(mock: T) -> CallsWrapper[T]:
+def _calls(mock: T, scope: CallScope | None = None) -> CallsWrapper[T]:
     """
     Get call information for a mock's methods.
 
@@ -122,8 +169,16 @@ def _calls(mock: T) -> CallsWrapper[T]:
 
     Args:
         mock: A mock object created with tmock()
+        scope: If given, only the calls made within this recording scope are considered.
 
     Returns:
         A wrapper that provides CallInfo for each method
     """
-    return cast(CallsWrapper[T], cast(object, _CallsObject(cast(MockObject[T], mock))))
+    mock_object = cast(MockObject[T], mock)
+    if scope is not None:
+        return cast(CallsWrapper[T], cast(object, _CallsObject(mock_object, scope)))
+    calls_object = mock_object._calls_object
+    if calls_object is None:
+        calls_object = _CallsObject(mock_object)
+        mock_object._calls_object = calls_object
+    return cast(CallsWrapper[T], calls_object)
@@ -0,0 +1,299 @@
+import inspect
+import os
+import pickle
+import threading
+import weakref
+from typing import Any, BinaryIO, TypeVar, cast
+
+from typemock._mock import _explicit_config
+from typemock._mock.methods import CallBinder, OrderedCallValues
+from typemock._mock.object import MockObject
+from typemock._mock.responders import Responder, ResponderReplay
+from typemock._utils import methods, typemock_logger
+from typemock.api import CapturePolicy, MockingError, TypeCheckBackend, TypeSafety
+from typemock.config import MockConfig, _configured_members, _mock_config
+
+T = TypeVar("T")
+
+_FORMAT = "typemock-cassette"
+_VERSION = 1
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+type Outcome = tuple[bool, Any]
+type _MethodOutcomes = tuple[
+    dict[OrderedCallValues, list[Outcome]], list[tuple[OrderedCallValues, list[Outcome]]]
+]
+
+
+def _class_name(clazz: type) -> str:
+    return "{}.{}".format(clazz.__module__, clazz.__qualname__)
+
+
+class _CassetteWriter:
+    """
+    Streams interactions to a cassette file, as a header followed by one pickle frame per interaction.
+
+    The file is opened on the first write, or on close if nothing was written, and each frame is flushed as it is
+    written, so the cassette holds every interaction recorded so far even if it is never closed.
+    """
+
+    def __init__(self, path: str | os.PathLike, clazz: type) -> None:
+        self._lock = threading.Lock()
+        self._path = path
+        self._header = pickle.dumps((_FORMAT, _VERSION, _class_name(clazz)), _PROTOCOL)
+        self._file: BinaryIO | None = None
+        self._closed = False
+
+    def _open(self) -> BinaryIO:
+        file = self._file
+        if file is None:
+            if self._closed:
+                raise MockingError("Cassette {} is already closed".format(self._path))
+            file = open(self._path, "wb")
+            file.write(self._header)
+            self._file = file
+        return file
+
+    def write(self, name: str, call: OrderedCallValues, raised: bool, value: Any) -> None:
+        try:
+            # Each frame is pickled whole before it is written, so a failure cannot corrupt the stream.
+            frame = pickle.dumps((name, call, raised, value), _PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise MockingError(
+                "Could not record call to '{}' with args: {}. {}".format(name, call, e)
+            ) from e
+        with self._lock:
+            file = self._open()
+            file.write(frame)
+            file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._open().close()
+            self._closed = True
+
+
+def _write_raised(writer: _CassetteWriter, name: str, call: OrderedCallValues, error: Exception):
+    """
+    Records an error raised by the real method. If it cannot be recorded, that is logged, so that the error itself
+    is what reaches the caller.
+    """
+    try:
+        writer.write(name, call, True, error)
+    except MockingError as e:
+        typemock_logger().warning(str(e))
+
+
+def _sync_recorder(binder: CallBinder, real_method: Any, writer: _CassetteWriter):
+    name = binder.name
+    canonical_call = binder.canonical_call
+
+    def record(*args, **kwargs):
+        call = canonical_call(None, *args, **kwargs)
+        try:
+            result = real_method(*args, **kwargs)
+        except Exception as e:
+            _write_raised(writer, name, call, e)
+            raise
+        writer.write(name, call, False, result)
+        return result
+
+    return record
+
+
+def _async_recorder(binder: CallBinder, real_method: Any, writer: _CassetteWriter):
+    name = binder.name
+    canonical_call = binder.canonical_call
+
+    async def record(*args, **kwargs):
+        call = canonical_call(None, *args, **kwargs)
+        try:
+            result = await real_method(*args, **kwargs)
+        except Exception as e:
+            _write_raised(writer, name, call, e)
+            raise
+        writer.write(name, call, False, result)
+        return result
+
+    return record
+
+
+class _RecordingProxy:
+    """
+    Forwards to a real object, recording the calls to its methods, and their outcomes, to a cassette.
+
+    The cassette is closed when the proxy's context closes, or failing that, when the proxy is collected.
+    """
+
+    def __init__(self, real: Any, path: str | os.PathLike) -> None:
+        real_class = real.__class__
+        writer = _CassetteWriter(path, real_class)
+        object.__setattr__(self, "_real", real)
+        object.__setattr__(self, "_real_class", real_class)
+        object.__setattr__(self, "_writer", writer)
+        object.__setattr__(self, "_finalizer", weakref.finalize(self, writer.close))
+        for func_entry in methods(real_class):
+            binder = CallBinder(func_entry.name, inspect.signature(func_entry.func))
+            real_method = getattr(real, func_entry.name)
+            if inspect.iscoroutinefunction(func_entry.func):
+                recorder = _async_recorder(binder, real_method, writer)
+            else:
+                recorder = _sync_recorder(binder, real_method, writer)
+            object.__setattr__(self, func_entry.name, recorder)
+
+    def __getattr__(self, item: str):
+        return getattr(object.__getattribute__(self, "_real"), item)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        setattr(object.__getattribute__(self, "_real"), key, value)
+
+    @property
+    def __class__(self):  # type: ignore[override]
+        return object.__getattribute__(self, "_real_class")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        object.__getattribute__(self, "_finalizer")()
+
+
+def _trecord(real_instance: T, path: str | os.PathLike) -> T:
+    """
+    Wraps a real object, to record the calls made to its methods, and what they returned or raised, to a cassette.
+
+    Attributes are read from and set on the real object, but are not recorded. Each interaction is written to the
+    cassette as it is recorded, and the cassette is closed once the recorder's context closes, or the recorder is
+    collected.
+
+    Examples:
+
+        with trecord(MyService(), "my_service.cassette") as service:
+            run_scenario(service)
+
+        my_mock = tmock_from_cassette(MyService, "my_service.cassette")
+
+    Args:
+        real_instance: The object to record.
+        path: Where to write the cassette.
+
+    Returns:
+        A recorder, which stands in for the real object.
+    """
+    return cast(T, _RecordingProxy(real_instance, path))
+
+
+def _load_cassette(path: str | os.PathLike, clazz: type) -> dict[str, _MethodOutcomes]:
+    """
+    Streams the interactions from a cassette, grouping the outcomes of each method by call.
+    """
+    outcomes_by_method: dict[str, _MethodOutcomes] = {}
+    with open(path, "rb") as f:
+        unpickler = pickle.Unpickler(f)
+        try:
+            header = unpickler.load()
+        except EOFError:
+            header = None
+        if not (isinstance(header, tuple) and len(header) == 3 and header[0] == _FORMAT):
+            raise MockingError("Not a cassette: {}".format(path))
+        _, version, class_name = header
+        if version != _VERSION:
+            raise MockingError("Unsupported cassette version {}: {}".format(version, path))
+        if class_name != _class_name(clazz):
+            raise MockingError(
+                "Cassette {} was recorded from {}, not {}".format(
+                    path, class_name, _class_name(clazz)
+                )
+            )
+        load = unpickler.load
+        while True:
+            try:
+                name, call, raised, value = load()
+            except EOFError:
+                break
+            by_call = outcomes_by_method.get(name)
+            if by_call is None:
+                by_call = ({}, [])
+                outcomes_by_method[name] = by_call
+            hashed, unhashable = by_call
+            try:
+                outcomes = hashed.get(call)
+                if outcomes is None:
+                    outcomes = []
+                    hashed[call] = outcomes
+            except TypeError:
+                outcomes = _unhashable_outcomes(unhashable, call)
+            outcomes.append((raised, value))
+    return outcomes_by_method
+
+
+def _unhashable_outcomes(
+    unhashable: list[tuple[OrderedCallValues, list[Outcome]]], call: OrderedCallValues
+) -> list[Outcome]:
+    for existing, outcomes in unhashable:
+        if existing == call:
+            return outcomes
+    outcomes: list[Outcome] = []
+    unhashable.append((call, outcomes))
+    return outcomes
+
+
+def _tmock_from_cassette(
+    clazz: type[T],
+    path: str | os.PathLike,
+    type_safety: TypeSafety | None = None,
+    loop: bool = False,
+    instrument: bool | None = None,
+    thread_safe: bool | None = None,
+    capture: CapturePolicy | None = None,
+    capture_overrides: dict[str, CapturePolicy] | None = None,
+    type_check: TypeCheckBackend | None = None,
+    config: MockConfig | str | None = None,
+) -> T:
+    """
+    Mocks a class with the behaviour recorded to a cassette by `trecord`.
+
+    Each call replays the outcomes recorded for its args, in the order they were recorded. Returns are type checked
+    as they are replayed, as with any other mocked behaviour. The cassette is streamed, and its calls are loaded
+    straight into each method's hashed index of behaviour.
+
+    Cassettes are pickles, so only load cassettes you trust.
+
+    Args:
+        clazz: The class the cassette was recorded from.
+        path: The cassette to load.
+        type_safety:
+        loop: If True, the recorded outcomes for each call are replayed again once they run out. Otherwise, an
+            error is raised.
+        instrument:
+        thread_safe:
+        capture:
+        capture_overrides:
+        type_check:
+        config: As for `tmock`.
+
+    Returns:
+        A mock, which can be set up further as usual.
+    """
+    explicit = _explicit_config(
+        type_safety, instrument, thread_safe, capture, capture_overrides, type_check
+    )
+    mock = MockObject(
+        clazz,
+        _mock_config(config, explicit),
+        configured_members=_configured_members(config, explicit),
+    )
+    for name, (hashed, unhashable) in _load_cassette(path, clazz).items():
+        method_state = mock._mock_method_states_by_name.get(name)
+        if method_state is None:
+            raise MockingError(
+                "Cassette {} has calls to '{}', which {} does not have".format(path, name, clazz)
+            )
+        responders: list[tuple[OrderedCallValues, Responder]] = [
+            (call, ResponderReplay(outcomes, loop)) for call, outcomes in hashed.items()
+        ]
+        responders.extend((call, ResponderReplay(outcomes, loop)) for call, outcomes in unhashable)
+        method_state.set_responders(responders)
+    return cast(T, mock)
@@ -0,0 +1,194 @@
+from collections.abc import Iterable
+from typing import Any, TypeVar, cast
+
+from typemock._messages import limited_repr
+from typemock._mock.attributes import MockAttributeState
+from typemock._mock.methods import MockMethodState, OrderedCallValues, has_matchers
+from typemock._mock.object import MockObject
+from typemock._mock.scope import CallScope
+from typemock.api import MockingError, VerifyError
+from typemock.match import capture_args, has_captors
+
+T = TypeVar("T")
+
+_error_expectations_failed = """
+
+{failed} of {total} expectation(s) failed:
+
+{failures}
+
+"""
+
+
+class Expectation:
+    """
+    An expected interaction with a mock, to be checked together with others by `expect_all`.
+    """
+
+    def __init__(
+        self,
+        mock: MockObject,
+        member_state: MockMethodState | MockAttributeState,
+        call: OrderedCallValues | None,
+        exactly: int,
+    ) -> None:
+        self.mock = mock
+        self.member_state = member_state
+        self.call = call
+        self.exactly = exactly
+        self.count = 0
+
+    def mark_verified(self) -> None:
+        member_state = self.member_state
+        if isinstance(member_state, MockMethodState):
+            member_state.mark_verified(cast(OrderedCallValues, self.call))
+        else:
+            member_state.mark_gets_verified()
+
+    def failure(self) -> str | None:
+        if self.exactly == -1:
+            if self.count >= 1:
+                return None
+            expected = "at least 1"
+        else:
+            if self.count == self.exactly:
+                return None
+            expected = str(self.exactly)
+        if self.call is None:
+            return "Expected {} gets of attribute '{}', but there were {}.".format(
+                expected, self.member_state.name, self.count
+            )
+        return "Expected {} interaction(s) with '{}' with args: {}, but there were {}.".format(
+            expected, self.member_state.name, limited_repr(self.call), self.count
+        )
+
+
+class _ExpectObject:
+    _tmock_initialised = False
+
+    def __init__(self, mock: MockObject, exactly: int) -> None:
+        self._mock = mock
+        self._exactly = exactly
+        self._tmock_initialised = True
+
+    def __getattribute__(self, item: str):
+        if item.startswith("_") or not object.__getattribute__(self, "_tmock_initialised"):
+            return object.__getattribute__(self, item)
+        mock = object.__getattribute__(self, "_mock")
+        exactly = object.__getattribute__(self, "_exactly")
+        method_state = mock._mock_method_states_by_name.get(item)
+        if method_state is not None:
+
+            def expect_call(*args, **kwargs) -> Expectation:
+                call = method_state.expected_call(None, *args, **kwargs)
+                return Expectation(mock, method_state, call, exactly)
+
+            return expect_call
+        if item in mock._mock_attribute_states:
+            return Expectation(mock, mock._mock_attribute_states[item], None, exactly)
+        return object.__getattribute__(self, item)
+
+
+def _expect(mock: T, exactly: int = -1) -> T:
+    """
+    Describes an expected interaction, to be checked by `expect_all`, in the same way as with `verify`.
+
+    Examples:
+
+        expect(my_mock).do_something(1)
+        expect(my_mock, exactly=2).do_something(2)
+        expect(my_mock).some_attribute  # <- at least one get
+
+    """
+    return cast(T, _ExpectObject(cast(MockObject, mock), exactly))
+
+
+def _count_method_calls(
+    method_state: MockMethodState, expectations: list[Expectation], scope: CallScope | None
+) -> None:
+    by_call: dict[OrderedCallValues, list[Expectation]] = {}
+    unhashable: list[Expectation] = []
+    with_matchers: list[Expectation] = []
+    for expectation in expectations:
+        call = cast(OrderedCallValues, expectation.call)
+        if has_matchers(call):
+            with_matchers.append(expectation)
+            continue
+        try:
+            by_call.setdefault(call, []).append(expectation)
+        except TypeError:
+            unhashable.append(expectation)
+    for record in method_state.recorded_calls(scope):
+        try:
+            matched = by_call.get(record, ())
+        except TypeError:
+            # A recorded call with unhashable args can only equal the unhashable expectations.
+            matched = ()
+        for expectation in matched:
+            expectation.count += 1
+        for expectation in unhashable:
+            if expectation.call == record:
+                expectation.count += 1
+        for expectation in with_matchers:
+            if record == expectation.call:
+                expectation.count += 1
+                call = cast(OrderedCallValues, expectation.call)
+                if has_captors(call):
+                    capture_args(call, record)
+
+
+def _expect_all(mock: object, expectations: Iterable[Any], scope: CallScope | None = None) -> None:
+    """
+    Checks many expected interactions with a mock in one pass over the calls recorded for each method.
+
+    Every failed expectation is reported together in one VerifyError.
+
+    Examples:
+
+        expect_all(my_mock, [
+            expect(my_mock).do_something(1),
+            expect(my_mock, exactly=2).do_something(2),
+            expect(my_mock, exactly=0).do_something_else(match.anything()),
+        ])
+
+    Args:
+        mock: A mock object created with tmock()
+        expectations: Expectations created with expect()
+        scope: If given, only the interactions made within this recording scope are considered.
+
+    Raises:
+        VerifyError
+    """
+    mock_object = cast(MockObject, mock)
+    checked: list[Expectation] = []
+    by_method: dict[MockMethodState, list[Expectation]] = {}
+    for expectation in expectations:
+        if not isinstance(expectation, Expectation):
+            raise MockingError(
+                "Expected expectations created with expect(), but got: {}".format(expectation)
+            )
+        if expectation.mock is not mock_object:
+            raise MockingError("Expectation {} is for a different mock".format(expectation))
+        expectation.count = 0
+        checked.append(expectation)
+        member_state = expectation.member_state
+        if isinstance(member_state, MockMethodState):
+            by_method.setdefault(member_state, []).append(expectation)
+        else:
+            expectation.count = member_state.call_count_gets(scope)
+    for method_state, method_expectations in by_method.items():
+        _count_method_calls(method_state, method_expectations, scope)
+    failures = []
+    for expectation in checked:
+        failure = expectation.failure()
+        if failure is not None:
+            failures.append(failure)
+        elif scope is None:
+            expectation.mark_verified()
+    if failures:
+        raise VerifyError(
+            _error_expectations_failed,
+            failed=len(failures),
+            total=len(checked),
+            failures="\n".join("    " + failure for failure in failures),
+        )
@@ -0,0 +1,125 @@
+import inspect
+import sys
+import threading
+import typing
+import weakref
+from types import FunctionType
+from typing import Any, TypeAliasType
+
+_MAX_ALIAS_DEPTH = 100
+
+
+def unalias(hint: Any) -> Any:
+    """
+    The value of a `type` statement alias, following aliases of aliases, or the hint itself if it is not an alias.
+    """
+    for _ in range(_MAX_ALIAS_DEPTH):
+        if not isinstance(hint, TypeAliasType):
+            return hint
+        hint = hint.__value__
+    return hint
+
+
+class _Annotations:
+    def __init__(self, annotations: dict[str, Any]) -> None:
+        self.__annotations__ = annotations
+
+
+def _resolve(
+    annotations: dict[str, Any], globalns: dict[str, Any], localns: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Resolves string and forward reference annotations. If some cannot be resolved, they are left as they were, and
+    the rest are resolved one by one.
+    """
+    try:
+        return typing.get_type_hints(_Annotations(annotations), globalns, localns)
+    except (NameError, AttributeError, TypeError):
+        pass
+    resolved: dict[str, Any] = {}
+    for name, annotation in annotations.items():
+        try:
+            resolved[name] = typing.get_type_hints(
+                _Annotations({name: annotation}), globalns, localns
+            )[name]
+        except (NameError, AttributeError, TypeError):
+            resolved[name] = annotation
+    return resolved
+
+
+def _annotations(thing: type | FunctionType) -> dict[str, Any]:
+    """
+    The annotations of a class, not those it inherits, or of a function.
+
+    From Python 3.14, annotations are evaluated when first asked for (PEP 649), and are not kept in the class
+    `__dict__`. Those which refer to names that are not defined are then left as forward references.
+    """
+    try:
+        return inspect.get_annotations(thing)
+    except NameError:
+        forward_ref = getattr(getattr(inspect, "Format", None), "FORWARDREF", None)
+        if forward_ref is None:
+            raise
+        get_annotations: Any = inspect.get_annotations
+        return get_annotations(thing, format=forward_ref)
+
+
+def _localns(cls: type | None) -> dict[str, Any]:
+    return {} if cls is None else {cls.__name__: cls, **vars(cls)}
+
+
+class ClassHints:
+    """
+    The type hints of a class, its `__init__` and its methods, with string and forward reference annotations
+    resolved, as by `typing.get_type_hints`, in the namespace of the module the class was defined in, and of the class
+    itself.
+
+    Hints are resolved once per class, and each method's once, on first use. The class, and its methods, are only
+    referenced weakly, so the hints go with the class, unless they name the class itself.
+    """
+
+    def __init__(self, cls: type) -> None:
+        self._cls = weakref.ref(cls)
+        self._lock = threading.Lock()
+        self._methods: weakref.WeakKeyDictionary[FunctionType, dict[str, Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+        module = sys.modules.get(cls.__module__)
+        globalns: dict[str, Any] = vars(module) if module is not None else {}
+        self.attributes = _resolve(_annotations(cls), globalns, _localns(cls))
+        init = cls.__init__
+        self.init = self.method(init) if isinstance(init, FunctionType) else {}
+
+    def method(self, func: FunctionType) -> dict[str, Any]:
+        """
+        The resolved annotations of a method of the class, by arg name, and "return".
+        """
+        hints = self._methods.get(func)
+        if hints is None:
+            with self._lock:
+                hints = self._methods.get(func)
+                if hints is None:
+                    hints = _resolve(_annotations(func), func.__globals__, _localns(self._cls()))
+                    self._methods[func] = hints
+        return hints
+
+
+# Keyed weakly, so that the hints of a class go with it.
+_class_hints: "weakref.WeakKeyDictionary[type, ClassHints]" = weakref.WeakKeyDictionary()
+_class_hints_lock = threading.Lock()
+
+
+def hints_of(cls: type) -> ClassHints:
+    """
+    The resolved type hints of a class, which are cached for as long as the class exists.
+    """
+    try:
+        return _class_hints[cls]
+    except KeyError:
+        pass
+    with _class_hints_lock:
+        hints = _class_hints.get(cls)
+        if hints is None:
+            hints = ClassHints(cls)
+            _class_hints[cls] = hints
+        return hints
@@ -0,0 +1,92 @@
+import reprlib
+from collections.abc import Callable
+from typing import Any
+
+
+class MessageLimits:
+    """
+    Caps on the size of rendered error messages.
+
+    Args:
+        value_limit: The most characters any one value is rendered with.
+        message_limit: The most characters a whole message is rendered with.
+        items_limit: The most items of any one list, tuple, dict or set which are rendered.
+    """
+
+    def __init__(self, value_limit: int = 500, message_limit: int = 10_000, items_limit: int = 20):
+        self.value_limit = value_limit
+        self.message_limit = message_limit
+        self.items_limit = items_limit
+        self._repr = reprlib.Repr()
+        for name in (
+            "maxlist",
+            "maxtuple",
+            "maxdict",
+            "maxset",
+            "maxfrozenset",
+            "maxdeque",
+            "maxarray",
+        ):
+            setattr(self._repr, name, items_limit)
+        self._repr.maxlevel = 8
+        self._repr.maxstring = value_limit
+        self._repr.maxlong = value_limit
+        self._repr.maxother = value_limit
+
+
+_limits = MessageLimits()
+
+
+def _set_message_limits(
+    value_limit: int | None = None, message_limit: int | None = None, items_limit: int | None = None
+) -> None:
+    """
+    Sets the caps on the size of rendered error messages. Limits which are not given are kept as they are.
+    """
+    global _limits
+    _limits = MessageLimits(
+        value_limit=_limits.value_limit if value_limit is None else value_limit,
+        message_limit=_limits.message_limit if message_limit is None else message_limit,
+        items_limit=_limits.items_limit if items_limit is None else items_limit,
+    )
+
+
+def _cap(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return "{}... ({} more characters)".format(text[:limit], len(text) - limit)
+
+
+class Deferred:
+    """
+    A part of a message which is costly to work out, so is only worked out if the message is rendered.
+    """
+
+    def __init__(self, work_out: Callable[[], Any]):
+        self._work_out = work_out
+
+
+def limited_repr(value: Any) -> str:
+    """
+    Renders a value for an error message within the size limits. Strings are rendered as they are, other values
+    with a repr which elides the items of large containers.
+    """
+    limits = _limits
+    if isinstance(value, Deferred):
+        return _cap(str(value._work_out()), limits.message_limit)
+    if isinstance(value, str):
+        return _cap(value, limits.value_limit)
+    return _cap(limits._repr.repr(value), limits.value_limit)
+
+
+def render_message(template: str, values: tuple[Any, ...], named_values: dict[str, Any]) -> str:
+    """
+    Formats a message template with values rendered by `limited_repr`, capping the length of the whole message.
+    """
+    if not values and not named_values:
+        return _cap(template, _limits.message_limit)
+    message = template.format(
+        *[limited_repr(value) for value in values],
+        **{name: limited_repr(value) for name, value in named_values.items()},
+    )
+    return _cap(message, _limits.message_limit)
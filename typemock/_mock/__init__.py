@@ -4,7 +4,14 @@ from types import FunctionType
 from typing import TypeVar, cast
 
 from typemock._mock.object import MockObject
-from typemock.api import MockingError, ResponseBuilder, TypeSafety
+from typemock.api import (
+    CapturePolicy,
+    MockingError,
+    ResponseBuilder,
+    TypeCheckBackend,
+    TypeSafety,
+)
+from typemock.config import MemberConfig, MockConfig, _configured_members, _mock_config
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -27,7 +34,39 @@ You need to await async functions when defining behaviour of the mock. Example:
 """
 
 
-def _tmock(clazz: type[T] | T, type_safety: TypeSafety = TypeSafety.STRICT) -> T:
+def _explicit_config(
+    type_safety: TypeSafety | None,
+    instrument: bool | None,
+    thread_safe: bool | None,
+    capture: CapturePolicy | None,
+    capture_overrides: dict[str, CapturePolicy] | None,
+    type_check: TypeCheckBackend | None,
+) -> MockConfig:
+    """
+    The settings given explicitly to `tmock` or `tspy`, which take precedence over any config.
+    """
+    return MockConfig(
+        type_safety=type_safety,
+        type_check=type_check,
+        capture=capture,
+        thread_safe=thread_safe,
+        instrument=instrument,
+        members={
+            name: MemberConfig(capture=policy) for name, policy in (capture_overrides or {}).items()
+        },
+    )
+
+
+def _tmock(
+    clazz: type[T] | T,
+    type_safety: TypeSafety | None = None,
+    instrument: bool | None = None,
+    thread_safe: bool | None = None,
+    capture: CapturePolicy | None = None,
+    capture_overrides: dict[str, CapturePolicy] | None = None,
+    type_check: TypeCheckBackend | None = None,
+    config: MockConfig | str | None = None,
+) -> T:
     """
     Mocks a given class.
 
@@ -44,8 +83,42 @@ def _tmock(clazz: type[T] | T, type_safety: TypeSafety = TypeSafety.STRICT) -> T
 
     Args:
 
-        type_safety:
         clazz:
+        type_safety:
+
+            Which type hints the mocked class must have. Defaults to `TypeSafety.STRICT`.
+
+        instrument:
+
+            If True, per member usage counters and latency histograms are kept. These can be read
+            through `calls(mock).<member>.stats`.
+
+        thread_safe:
+
+            If True, the mock can be called concurrently from many threads. Calls are recorded into per thread
+            logs which are merged when verifying, and sequenced responses are served atomically. Defaults to
+            True on free-threaded builds of Python running without the GIL, and False otherwise.
+
+        capture:
+
+            How the args of each call are recorded for verification. By reference (the default), as a shallow or
+            deep copy taken at call time, or with str and bytes-like args as a digest of their content, which does
+            not keep them alive.
+
+        capture_overrides:
+
+            Capture policies for individual methods, by method name.
+
+        type_check:
+
+            How args and returns are checked against their type hints. Compiled checkers (the default) check
+            simple hints, such as classes, optionals, unions of classes and literals, without typeguard.
+
+        config:
+
+            A `MockConfig`, or the name of a profile in `typemock.config.PROFILES`, for the settings which are not
+            given explicitly. Settings it does not give are taken from the default config, set with
+            `default_config`.
 
     Returns:
 
@@ -56,7 +129,75 @@ def _tmock(clazz: type[T] | T, type_safety: TypeSafety = TypeSafety.STRICT) -> T
         raise MockingError(
             "Cannot mock a {} for now. Only objects and classes supported".format(clazz)
         )
-    return cast(T, MockObject(clazz, type_safety))
+    explicit = _explicit_config(
+        type_safety, instrument, thread_safe, capture, capture_overrides, type_check
+    )
+    return cast(
+        T,
+        MockObject(
+            clazz,
+            _mock_config(config, explicit),
+            configured_members=_configured_members(config, explicit),
+        ),
+    )
+
+
+def _tspy(
+    real_instance: T,
+    type_safety: TypeSafety | None = None,
+    instrument: bool | None = None,
+    thread_safe: bool | None = None,
+    capture: CapturePolicy | None = None,
+    capture_overrides: dict[str, CapturePolicy] | None = None,
+    type_check: TypeCheckBackend | None = None,
+    config: MockConfig | str | None = None,
+) -> T:
+    """
+    Spies on a real object.
+
+    Calls to the spy are recorded, for `verify` and `calls`, and are forwarded to the real object, unless their
+    behaviour is specified with `when`, in the spy's context. Attributes are read from and set on the real object.
+
+    Examples:
+
+        with tspy(MyClass()) as my_spy:
+            when(my_spy.do_something()).then_return("A Result")
+
+        result = my_spy.do_something()  # <- Stubbed.
+        other = my_spy.do_something_else()  # <- Forwarded to the real object.
+
+    Args:
+
+        real_instance: The object to spy on.
+        type_safety:
+        instrument:
+        thread_safe:
+        capture:
+        capture_overrides:
+        type_check:
+        config:
+
+            As for `tmock`. Type safety applies to the specified behaviour. Forwarded calls are not type checked.
+
+    Returns:
+
+        spy:
+
+    """
+    if isinstance(real_instance, (type, FunctionType)):
+        raise MockingError("Can only spy on an instance, not a {}".format(real_instance))
+    explicit = _explicit_config(
+        type_safety, instrument, thread_safe, capture, capture_overrides, type_check
+    )
+    return cast(
+        T,
+        MockObject(
+            real_instance,
+            _mock_config(config, explicit),
+            spy=True,
+            configured_members=_configured_members(config, explicit),
+        ),
+    )
 
 
 def _when(mock_call_result: T) -> ResponseBuilder[T]:
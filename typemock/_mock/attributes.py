@@ -1,25 +1,57 @@
+import threading
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+from time import perf_counter_ns
 from types import CoroutineType
 from typing import Any, Generic, List, Tuple, Type, TypeVar, overload
 
+from typemock._mock import hooks, observe
+from typemock._mock.diagnostics import NearestCalls, nearest_calls, value_similarity
+from typemock._mock.recording import InteractionTally, ShardedCounter
 from typemock._mock.responders import (
+    Fault,
     Responder,
     ResponderBasic,
+    ResponderChoose,
+    ResponderDelayed,
     ResponderDo,
+    ResponderIter,
     ResponderMany,
     ResponderRaise,
+    ResponderSynchronised,
+    StreamSource,
+    iterable_factory,
 )
-from typemock._utils import Blank, is_type
-from typemock.api import DoFunction, MockTypeSafetyError, ResponseBuilder
+from typemock._mock.scope import CallScope, active_scopes
+from typemock._mock.stats import MemberStats, instrumented_response, new_member_stats
+from typemock._mock.timing import DelaySource
+from typemock._typecheck import Checker, checker_for
+from typemock._utils import Blank
+from typemock.api import (
+    DoFunction,
+    MockingError,
+    MockTypeSafetyError,
+    ResponseBuilder,
+    TypeCheckBackend,
+)
+from typemock.match import Matcher
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
 class CalledSetRecord:
-    def __init__(self, call: Any, count: int, other_calls: List[Any]):
+    def __init__(self, call: Any, count: int, other_count: int, records: List[Any]):
         self.call = call
         self.count = count
-        self.other_calls = other_calls
+        self.other_count = other_count
+        self._records = records
+
+    def nearest_others(self) -> NearestCalls[Any]:
+        """
+        The other recorded sets most similar to the expected one, searched for only when needed for a failure.
+        """
+        return nearest_calls(self._records, self.call, value_similarity, len(self._records))
 
 
 def _null_ordered_call(*args, **kwargs) -> Tuple[Tuple[str, Any], ...]:
@@ -27,61 +59,196 @@ def _null_ordered_call(*args, **kwargs) -> Tuple[Tuple[str, Any], ...]:
 
 
 class MockAttributeState(Generic[R]):
-    def __init__(self, name: str, initial_value: R, type_hint: Type):
+    def __init__(
+        self,
+        name: str,
+        initial_value: R,
+        type_hint: Type,
+        instrument: bool = False,
+        thread_safe: bool = False,
+        type_check: TypeCheckBackend = TypeCheckBackend.COMPILED,
+        owner: str = "",
+    ):
         self.name = name
+        self.owner = owner
         self.type_hint = type_hint
+        self._checker: Checker | None = (
+            None
+            if isinstance(type_hint, Blank) or type_check == TypeCheckBackend.NONE
+            else checker_for(type_hint, type_check)
+        )
+        self._stats: MemberStats | None = new_member_stats(name, instrument, thread_safe)
+        self._lock: threading.Lock | None = threading.Lock() if thread_safe else None
         self._responder: Responder = ResponderBasic(initial_value)
         self._call_count = 0
+        self._sharded_call_count: ShardedCounter | None = ShardedCounter() if thread_safe else None
         self._set_calls: List[R] = []
+        self._spied: Any = None
+        self._verified_gets = 0
+        self._set_tally = InteractionTally(self._set_calls)
+
+    def spy_on(self, real: Any):
+        """
+        Reads gets through from, and forwards sets to, the attribute of a real object, unless behaviour is specified.
+        """
+        self._spied = real
+        self._responder = ResponderDo(partial(getattr, real, self.name), _null_ordered_call)
 
     def _validate_return(self, response: R):
-        if not isinstance(self.type_hint, Blank):
-            if not is_type(response, self.type_hint):
-                raise MockTypeSafetyError(
-                    "Attribute: {} must be of type:{}".format(
-                        self.name,
-                        self.type_hint,
-                    )
-                )
+        checker = self._checker
+        if checker is not None and not checker(response):
+            raise MockTypeSafetyError(
+                "Attribute: {} must be of type:{}",
+                self.name,
+                self.type_hint,
+            )
+
+    def _set_responder(self, responder: Responder):
+        self._responder = responder
+        if observe.hooks:
+            hooks.behaviour_set(self, (), responder)
 
     def set_response(self, response: R):
         self._validate_return(response)
-        self._responder = ResponderBasic(response)
+        self._set_responder(ResponderBasic(response))
 
     def set_response_many(self, results: List[R], loop: bool):
         for response in results:
             self._validate_return(response)
-        self._responder = ResponderMany(results, loop)
+        responder: Responder = ResponderMany(results, loop)
+        if self._lock is not None:
+            responder = ResponderSynchronised(responder, threading.Lock())
+        self._set_responder(responder)
+
+    def set_response_iter(self, source: Iterable[R] | Callable[[], Iterable[R]], loop: bool):
+        responder: Responder = ResponderIter(iterable_factory(source, loop), loop)
+        if self._lock is not None:
+            responder = ResponderSynchronised(responder, threading.Lock())
+        self._set_responder(responder)
+
+    def set_response_choose(
+        self,
+        outcomes: Sequence[tuple[float, Any]],
+        seed: int | str | bytes | None,
+        faults: Sequence[Fault],
+    ):
+        responder = ResponderChoose(
+            list(outcomes),
+            list(faults),
+            seed,
+            threading.Lock() if self._lock is not None else None,
+        )
+        for outcome in responder.all_outcomes():
+            if isinstance(outcome, ResponderDelayed):
+                raise MockingError(
+                    "Delayed outcomes can only be chosen for async methods, not attribute: {}".format(
+                        self.name
+                    )
+                )
+            if isinstance(outcome, ResponderBasic):
+                self._validate_return(outcome.response())
+        self._set_responder(responder)
 
     def set_error_response(self, error: Exception):
-        self._responder = ResponderRaise(error)
+        self._set_responder(ResponderRaise(error))
 
     def set_response_do(self, do_function: DoFunction):
-        self._responder = ResponderDo(do_function, _null_ordered_call)
+        self._set_responder(ResponderDo(do_function, _null_ordered_call))
+
+    def observed_response(self) -> R:
+        """
+        As `response`, but emits the events of the get to the hook subscribers.
+        """
+        return self._observed(self.response, "get", ())
+
+    def observed_set_with(self, item):
+        """
+        As `called_set_with`, but emits the events of the set to the hook subscribers.
+        """
+        self._observed(self.called_set_with, "set", (("value", item),))
+
+    def _observed(self, interaction: Callable[..., Any], kind: str, args: tuple) -> Any:
+        """
+        Makes a get or set, emitting its events to the hook subscribers.
+        """
+        start = perf_counter_ns()
+        result: Any = None
+        error: BaseException | None = None
+        try:
+            result = interaction(*[value for _, value in args])
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            hooks.call_finished(self, kind, args, result, error, start)
 
     def response(self) -> R:
-        self._call_count += 1
-        r = self._responder.response()
+        sharded_call_count = self._sharded_call_count
+        if sharded_call_count is None:
+            self._call_count += 1
+        else:
+            sharded_call_count.increment()
+        for scope in active_scopes():
+            scope.record_get(self)
+        stats = self._stats
+        if stats is None:
+            r = self._responder.response()
+        else:
+            stats.record_call(perf_counter_ns())
+            r = instrumented_response(stats, self._responder, (), {})
         self._validate_return(r)
         return r
 
-    def call_count_gets(self) -> int:
+    def call_count_gets(self, scope: CallScope | None = None) -> int:
+        if scope is not None:
+            return scope.gets_for(self)
+        if self._sharded_call_count is not None:
+            return self._sharded_call_count.value
         return self._call_count
 
+    def mark_gets_verified(self):
+        self._verified_gets = self.call_count_gets()
+
+    def unverified_gets(self) -> int:
+        return self.call_count_gets() - self._verified_gets
+
     def called_set_with(self, item):
         self._validate_return(item)
-        self._set_calls.append(item)
-        self._responder = ResponderBasic(item)
+        spied = self._spied
+        if spied is not None:
+            setattr(spied, self.name, item)
+        lock = self._lock
+        if lock is None:
+            self._set_calls.append(item)
+            if spied is None:
+                self._responder = ResponderBasic(item)
+        else:
+            with lock:
+                self._set_calls.append(item)
+                if spied is None:
+                    self._responder = ResponderBasic(item)
+        for scope in active_scopes():
+            scope.record_set(self, item)
+
+    def recorded_sets(self, scope: CallScope | None = None) -> List[R]:
+        if scope is None:
+            return self._set_calls
+        return scope.sets_for(self)
 
-    def called_set_record(self, expected_call) -> CalledSetRecord:
-        other_calls = []
+    def called_set_record(self, expected_call, scope: CallScope | None = None) -> CalledSetRecord:
+        records = self.recorded_sets(scope)
         count = 0
-        for call in self._set_calls:
+        for call in records:
             if expected_call == call:
                 count += 1
-            else:
-                other_calls.append(call)
-        return CalledSetRecord(expected_call, count, other_calls)
+        return CalledSetRecord(expected_call, count, len(records) - count, records)
+
+    def mark_set_verified(self, expected_call):
+        self._set_tally.mark_verified(expected_call, isinstance(expected_call, Matcher))
+
+    def unverified_sets(self) -> List[Tuple[R, int]]:
+        return self._set_tally.unverified()
 
 
 class AttributeResponseBuilder(Generic[R], ResponseBuilder[R]):
@@ -105,5 +272,32 @@ class AttributeResponseBuilder(Generic[R], ResponseBuilder[R]):
     def then_return_many(self, results: List[R], loop: bool = False) -> None:
         self._attribute_state.set_response_many(results, loop)
 
+    def then_yield_from(
+        self, source: Iterable[R] | Callable[[], Iterable[R]], loop: bool = False
+    ) -> None:
+        self._attribute_state.set_response_iter(source, loop)
+
+    def then_choose(
+        self,
+        outcomes: Sequence[tuple[float, Any]],
+        seed: int | str | bytes | None = None,
+        faults: Sequence[Fault] = (),
+    ) -> None:
+        self._attribute_state.set_response_choose(outcomes, seed, faults)
+
+    def then_stream(self, source: StreamSource, chunk_delay: DelaySource | None = None) -> None:
+        raise MockingError(
+            "Streams can only be specified for methods, not attribute: {}".format(
+                self._attribute_state.name
+            )
+        )
+
+    def then_delay(self, delay: DelaySource) -> "AttributeResponseBuilder[R]":
+        raise MockingError(
+            "Delays can only be specified for async methods, not attribute: {}".format(
+                self._attribute_state.name
+            )
+        )
+
     def then_do(self, do_function: DoFunction) -> None:
         self._attribute_state.set_response_do(do_function)
@@ -0,0 +1,103 @@
+import copy
+import hashlib
+from collections.abc import Callable
+from typing import Any
+
+from typemock._utils import typemock_logger
+from typemock.api import CapturePolicy
+from typemock.match import Matcher
+
+type CallValues = tuple[tuple[str, Any], ...]
+
+# Values of these types are small and immutable, so are recorded as they are under every policy.
+_SCALAR_TYPES = (type(None), bool, int, float, complex)
+
+# Values of these types have one encoding per value, so only they are digested: equal values always digest the same.
+_DIGESTED_TYPES = (bytes, bytearray, memoryview, str)
+
+
+class ArgDigest:
+    """
+    Stands in for a recorded str or bytes-like call arg under the DIGEST capture policy.
+
+    It is only equal to another digest of the same kind, size and content, and hashes by its digest, so expected args
+    are digested, with `digest_args`, before they are compared with recorded ones, or looked up among them. Like the
+    values themselves, a str is never equal to bytes.
+    """
+
+    __slots__ = ("type_name", "size", "digest", "text")
+
+    def __init__(self, type_name: str, size: int, digest: str, text: bool) -> None:
+        self.type_name = type_name
+        self.size = size
+        self.digest = digest
+        self.text = text
+
+    @classmethod
+    def of(cls, value: str | bytes | bytearray | memoryview) -> "ArgDigest":
+        type_name = type(value).__qualname__
+        if isinstance(value, str):
+            content = value.encode("utf-8", "surrogatepass")
+            return cls(type_name, len(value), hashlib.blake2b(content).hexdigest(), True)
+        view = memoryview(value)
+        # Only contiguous buffers can be hashed in place.
+        content = view if view.c_contiguous else view.tobytes()
+        return cls(type_name, view.nbytes, hashlib.blake2b(content).hexdigest(), False)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArgDigest):
+            return NotImplemented
+        return self.digest == other.digest and self.size == other.size and self.text == other.text
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __repr__(self) -> str:
+        return "<{} size={} blake2b={}>".format(self.type_name, self.size, self.digest[:16])
+
+
+def _capture_value(value: Any, policy: CapturePolicy) -> Any:
+    if isinstance(value, _SCALAR_TYPES) or isinstance(value, Matcher):
+        return value
+    if policy == CapturePolicy.DIGEST:
+        if isinstance(value, _DIGESTED_TYPES):
+            return ArgDigest.of(value)
+        # Other values have no canonical encoding, so are recorded by reference, which keeps no more alive than the
+        # call itself did, and compared with ==.
+        return value
+    try:
+        if policy == CapturePolicy.SHALLOW_COPY:
+            return copy.copy(value)
+        return copy.deepcopy(value)
+    except Exception:
+        typemock_logger().warning(
+            "Could not copy arg of type {}. A reference to it will be recorded instead.".format(
+                type(value)
+            )
+        )
+        return value
+
+
+def capture_function(policy: CapturePolicy) -> Callable[[CallValues], CallValues] | None:
+    """
+    The function which converts the ordered args of a call into what is recorded, or None if they are recorded
+    as they are.
+    """
+    if policy == CapturePolicy.REF:
+        return None
+
+    def capture(call: CallValues) -> CallValues:
+        return tuple((name, _capture_value(value, policy)) for name, value in call)
+
+    return capture
+
+
+def digest_args(call: CallValues) -> CallValues:
+    """
+    Digests the str and bytes-like args of an expected call, so that they are compared digest to digest with calls
+    recorded under the DIGEST policy.
+    """
+    return tuple(
+        (name, ArgDigest.of(value) if isinstance(value, _DIGESTED_TYPES) else value)
+        for name, value in call
+    )
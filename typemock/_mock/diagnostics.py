@@ -0,0 +1,122 @@
+import heapq
+from collections.abc import Callable, Iterable
+from numbers import Real
+from time import perf_counter_ns
+from typing import Any, Generic, TypeVar
+
+from typemock._messages import limited_repr
+from typemock.match import Matcher
+
+T = TypeVar("T")
+
+# The most similar recorded calls listed in a failure message.
+NEAREST_LIMIT = 3
+# Hard budgets for the search, so that diagnosing a failure on a huge call log stays cheap.
+SCAN_LIMIT = 100_000
+TIME_BUDGET_NS = 50_000_000
+# Only a prefix of long strings is compared.
+_PREFIX_LIMIT = 256
+# How often, in records, the time budget is checked.
+_TIME_CHECK_INTERVAL = 1024
+
+
+class NearestCalls(Generic[T]):
+    """
+    The recorded calls most similar to an expected call, most similar first.
+    """
+
+    def __init__(self, calls: list[T], scanned: int, total: int) -> None:
+        self.calls = calls
+        self.scanned = scanned
+        self.total = total
+
+    @property
+    def truncated(self) -> bool:
+        return self.scanned < self.total
+
+    def __str__(self) -> str:
+        lines = ["    " + limited_repr(call) for call in self.calls]
+        if self.truncated:
+            lines.append("    (searched {} of {} recorded calls)".format(self.scanned, self.total))
+        return "\n".join(lines)
+
+
+def value_similarity(actual: Any, expected: Any) -> float:
+    """
+    How similar a recorded value is to an expected one, from 0.0 to 1.0 where 1.0 means they are equal.
+
+    Unequal values score at most 0.5, so a call with more equal args always ranks higher.
+    """
+    try:
+        if actual == expected:
+            return 1.0
+    except Exception:
+        return 0.0
+    if isinstance(expected, Matcher) or type(actual) is not type(expected):
+        return 0.0
+    if isinstance(actual, Real) and not isinstance(actual, bool):
+        scale = max(abs(actual), abs(expected))
+        if scale == 0:
+            return 0.5
+        return 0.5 * (1 - min(1.0, abs(actual - expected) / scale))
+    if isinstance(actual, (str, bytes)):
+        longest = max(len(actual), len(expected))
+        if longest == 0:
+            return 0.5
+        prefix = 0
+        for a, b in zip(actual[:_PREFIX_LIMIT], expected[:_PREFIX_LIMIT]):
+            if a != b:
+                break
+            prefix += 1
+        return 0.5 * prefix / min(longest, _PREFIX_LIMIT)
+    return 0.25
+
+
+def call_similarity(
+    actual: tuple[tuple[str, Any], ...], expected: tuple[tuple[str, Any], ...]
+) -> float:
+    """
+    The sum of the similarities of each arg of a recorded call to those of an expected call.
+    """
+    return sum(
+        value_similarity(actual_value, expected_value)
+        for (_, actual_value), (_, expected_value) in zip(actual, expected)
+    )
+
+
+def nearest_calls(
+    records: Iterable[T],
+    expected: Any,
+    similarity: Callable[[T, Any], float],
+    total: int,
+    limit: int = NEAREST_LIMIT,
+    scan_limit: int = SCAN_LIMIT,
+    time_budget_ns: int = TIME_BUDGET_NS,
+) -> NearestCalls[T]:
+    """
+    Finds the recorded calls, other than those equal to the expected call, most similar to it.
+
+    Keeps only the best `limit` in a bounded heap, and stops early once `scan_limit` records have been searched or
+    the time budget has run out. Of equally similar calls, the earliest are listed.
+    """
+    deadline = perf_counter_ns() + time_budget_ns
+    heap: list[tuple[float, int, T]] = []
+    scanned = 0
+    for record in records:
+        if scanned >= scan_limit:
+            break
+        if scanned % _TIME_CHECK_INTERVAL == 0 and scanned > 0 and perf_counter_ns() > deadline:
+            break
+        scanned += 1
+        try:
+            if record == expected:
+                continue
+        except Exception:
+            pass
+        entry = (similarity(record, expected), -scanned, record)
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+    ranked = sorted(heap, key=lambda entry: entry[:2], reverse=True)
+    return NearestCalls([record for _, _, record in ranked], scanned, total)
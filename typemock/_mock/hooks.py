@@ -0,0 +1,240 @@
+import atexit
+import threading
+from collections.abc import Callable
+from time import perf_counter_ns
+from typing import Any
+
+from typemock._mock import observe
+from typemock._utils import typemock_logger
+from typemock.api import MockingError, MockTypeSafetyError, NoBehaviourSpecifiedError
+
+CALL = "call"
+MISS = "miss"
+TYPE_ERROR = "type_error"
+SETUP = "setup"
+
+
+class MockEvent:
+    """
+    Something which happened to a member of a mock.
+
+    Attributes:
+        mock: The name of the mocked class.
+        member: The name of the method or attribute.
+    """
+
+    def __init__(self, mock: str, member: str) -> None:
+        self.mock = mock
+        self.member = member
+
+    def __repr__(self) -> str:
+        return "{}({})".format(
+            self.__class__.__name__,
+            ", ".join("{}={!r}".format(name, value) for name, value in vars(self).items()),
+        )
+
+
+class CallEvent(MockEvent):
+    """
+    A call to a method of a mock, or a get or set of one of its attributes, once it has returned or raised.
+
+    Attributes:
+        kind: "call" for a method, or "get" or "set" for an attribute.
+        args: The args of the call, by name, in signature order. A set has the value set as its only arg.
+        result: What the call returned, or None if it raised.
+        error: What the call raised, or None if it returned.
+        start_ns: When the call started, by `time.perf_counter_ns`.
+        duration_ns: How long the call took.
+    """
+
+    def __init__(
+        self,
+        mock: str,
+        member: str,
+        kind: str,
+        args: tuple[tuple[str, Any], ...],
+        result: Any,
+        error: BaseException | None,
+        start_ns: int,
+        duration_ns: int,
+    ) -> None:
+        super().__init__(mock, member)
+        self.kind = kind
+        self.args = args
+        self.result = result
+        self.error = error
+        self.start_ns = start_ns
+        self.duration_ns = duration_ns
+
+
+class MissEvent(MockEvent):
+    """
+    A call to a method of a mock with no behaviour specified for its args.
+    """
+
+    def __init__(self, mock: str, member: str, args: tuple[tuple[str, Any], ...]) -> None:
+        super().__init__(mock, member)
+        self.args = args
+
+
+class TypeErrorEvent(MockEvent):
+    """
+    A call to a mock, or a get or set of one of its attributes, which broke its type hints.
+    """
+
+    def __init__(self, mock: str, member: str, error: MockTypeSafetyError) -> None:
+        super().__init__(mock, member)
+        self.error = error
+
+
+class SetupEvent(MockEvent):
+    """
+    Behaviour specified for a member of a mock.
+
+    Attributes:
+        args: The args the behaviour is for. Empty for an attribute.
+        behaviour: The kind of behaviour, such as "ResponderBasic" for `then_return`.
+    """
+
+    def __init__(
+        self, mock: str, member: str, args: tuple[tuple[str, Any], ...], behaviour: str
+    ) -> None:
+        super().__init__(mock, member)
+        self.args = args
+        self.behaviour = behaviour
+
+
+class Subscription:
+    """
+    A callback subscribed to a kind of event.
+
+    Unbatched, the callback is called with each event as it happens, in the thread it happens in. Batched, the
+    callback is called with a list of events once `batch_size` have happened, and with any remaining events when
+    flushed, or closed, or when the interpreter exits. Errors raised by the callback are logged, not raised.
+
+    Closing the subscription unsubscribes the callback. It can be used as a context manager, which closes it on exit.
+    """
+
+    def __init__(self, event_type: str, callback: Callable[[Any], Any], batch_size: int | None):
+        self.event_type = event_type
+        self._callback = callback
+        self._batch_size = batch_size
+        self._batch: list[MockEvent] = []
+        self._lock = threading.Lock()
+
+    def deliver(self, event: MockEvent) -> None:
+        if self._batch_size is None:
+            self._call(event)
+            return
+        with self._lock:
+            self._batch.append(event)
+            if len(self._batch) < self._batch_size:
+                return
+            batch, self._batch = self._batch, []
+        self._call(batch)
+
+    def _call(self, events: Any) -> None:
+        # A broken subscriber must not change the behaviour of the code under test, so what it raises is only logged.
+        try:
+            self._callback(events)
+        except Exception:
+            typemock_logger().exception(
+                "Subscriber {!r} to {} events raised an error.".format(
+                    self._callback, self.event_type
+                )
+            )
+
+    def flush(self) -> None:
+        """
+        Delivers the events of a partly filled batch.
+        """
+        with self._lock:
+            batch, self._batch = self._batch, []
+        if batch:
+            self._call(batch)
+
+    def close(self) -> None:
+        _unsubscribe(self)
+        self.flush()
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+_subscriptions: dict[str, tuple[Subscription, ...]] = {
+    CALL: (),
+    MISS: (),
+    TYPE_ERROR: (),
+    SETUP: (),
+}
+_subscriptions_lock = threading.Lock()
+
+
+def _refresh() -> None:
+    observe.hooks = any(_subscriptions.values())
+    observe.refresh()
+
+
+def subscribe(
+    event_type: str, callback: Callable[[Any], Any], batch_size: int | None
+) -> Subscription:
+    if batch_size is not None and batch_size < 1:
+        raise MockingError("Batch size must be at least 1, but was: {}".format(batch_size))
+    subscription = Subscription(event_type, callback, batch_size)
+    with _subscriptions_lock:
+        _subscriptions[event_type] = _subscriptions[event_type] + (subscription,)
+        _refresh()
+    return subscription
+
+
+def _unsubscribe(subscription: Subscription) -> None:
+    with _subscriptions_lock:
+        _subscriptions[subscription.event_type] = tuple(
+            s for s in _subscriptions[subscription.event_type] if s is not subscription
+        )
+        _refresh()
+
+
+def flush() -> None:
+    for subscriptions in list(_subscriptions.values()):
+        for subscription in subscriptions:
+            subscription.flush()
+
+
+atexit.register(flush)
+
+
+def _emit(event_type: str, event: MockEvent) -> None:
+    for subscription in _subscriptions[event_type]:
+        subscription.deliver(event)
+
+
+def call_finished(
+    member_state: Any,
+    kind: str,
+    args: tuple[tuple[str, Any], ...],
+    result: Any,
+    error: BaseException | None,
+    start_ns: int,
+) -> None:
+    """
+    Emits the events of a call to a member of a mock, which has returned or raised.
+    """
+    duration_ns = perf_counter_ns() - start_ns
+    owner = member_state.owner
+    if isinstance(error, NoBehaviourSpecifiedError):
+        _emit(MISS, MissEvent(owner, member_state.name, args))
+    elif isinstance(error, MockTypeSafetyError):
+        _emit(TYPE_ERROR, TypeErrorEvent(owner, member_state.name, error))
+    if _subscriptions[CALL]:
+        _emit(
+            CALL,
+            CallEvent(owner, member_state.name, kind, args, result, error, start_ns, duration_ns),
+        )
+
+
+def behaviour_set(member_state: Any, args: tuple[tuple[str, Any], ...], responder: Any) -> None:
+    _emit(SETUP, SetupEvent(member_state.owner, member_state.name, args, type(responder).__name__))
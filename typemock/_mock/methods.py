@@ -1,25 +1,57 @@
 import inspect
-from collections.abc import Callable
+import threading
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from functools import partial
 from inspect import Signature
+from time import perf_counter_ns
 from types import CoroutineType, FunctionType
-from typing import Any, TypeVar, overload
+from typing import Any, TypeVar, get_args, get_origin, overload
 
+from typemock._hints import unalias
+from typemock._mock import hooks, observe, profiling, usage
+from typemock._mock.capture import capture_function, digest_args
+from typemock._mock.diagnostics import NearestCalls, call_similarity, nearest_calls
+from typemock._mock.recording import InteractionTally, ShardedCallLog
 from typemock._mock.responders import (
+    Fault,
     Responder,
     ResponderBasic,
+    ResponderChoose,
+    ResponderDelayed,
     ResponderDo,
+    ResponderIter,
     ResponderMany,
     ResponderRaise,
+    ResponderStream,
+    ResponderSynchronised,
+    StreamSource,
+    iterable_factory,
 )
-from typemock._utils import InefficientUnHashableKeyDict, is_type
+from typemock._mock.scope import CallScope, active_scopes
+from typemock._mock.stats import MemberStats, instrumented_response, new_member_stats
+from typemock._mock.stubs import StubTable, replace_entry, same_key
+from typemock._mock.timing import Delay, DelaySource, sleep
+from typemock._typecheck import Checker, checker_for
 from typemock.api import (
+    CapturePolicy,
     DoFunction,
+    MockingError,
     MockTypeSafetyError,
     NoBehaviourSpecifiedError,
     ResponseBuilder,
+    TypeCheckBackend,
     TypeSafety,
 )
-from typemock.match import Matcher
+from typemock.match import Matcher, capture_args, has_captors
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -29,11 +61,24 @@ type OrderedCallValues = tuple[tuple[str, Any], ...]
 
 class CallCount:
     def __init__(
-        self, call: OrderedCallValues, count: int, other_calls: list[OrderedCallValues]
+        self,
+        call: OrderedCallValues,
+        count: int,
+        other_count: int,
+        records: Iterable[OrderedCallValues],
     ) -> None:
         self.call = call
         self.count = count
-        self.other_calls = other_calls
+        self.other_count = other_count
+        self._records = records
+
+    def nearest_others(self) -> NearestCalls[OrderedCallValues]:
+        """
+        The other recorded calls most similar to the expected call, searched for only when needed for a failure.
+        """
+        return nearest_calls(
+            self._records, self.call, call_similarity, self.other_count + self.count
+        )
 
 
 _error_invalid_mock_args = """
@@ -54,32 +99,45 @@ def has_matchers(call: OrderedCallValues) -> bool:
     return False
 
 
-class MockMethodState[R]:
-    def __init__(
-        self,
-        name: str,
-        signature: Signature,
-        func: FunctionType,
-        type_safety: TypeSafety,
-    ) -> None:
+_sync_streams = (Iterator, Iterable, Generator)
+_async_streams = (AsyncIterator, AsyncIterable, AsyncGenerator)
+
+
+def stream_of(func: FunctionType, hints: dict[str, Any]) -> tuple[bool, Any] | None:
+    """
+    Whether a method returns a stream, as a generator or async generator method, or by the iterator type it is hinted
+    to return, and if so, whether the stream is async, with the type of its items.
+
+    Returns:
+        (is_async, item_type), or None if the method does not return a stream.
+    """
+    return_type = unalias(hints.get("return"))
+    origin = get_origin(return_type) or return_type
+    if origin in _async_streams or origin in _sync_streams:
+        type_args = get_args(return_type)
+        item_type = type_args[0] if type_args else Any
+        return origin in _async_streams, item_type
+    if inspect.isasyncgenfunction(func):
+        return True, Any
+    if inspect.isgeneratorfunction(func):
+        return False, Any
+    return None
+
+
+class CallBinder:
+    """
+    Binds the args of calls to a method to their names, as the keys calls are recorded and looked up by.
+    """
+
+    def __init__(self, name: str, signature: Signature) -> None:
         self.name = name
-        self.func = func
         self._signature = signature
-        self._type_safety = type_safety
-        self._responses: InefficientUnHashableKeyDict[OrderedCallValues, Responder] = (
-            InefficientUnHashableKeyDict()
-        )
-        self._matcher_responses: InefficientUnHashableKeyDict[OrderedCallValues, Responder] = (
-            InefficientUnHashableKeyDict()
-        )
-        self._open = False
         self._arg_index_to_arg_name: dict[int, str] = {}
         self._arg_name_to_parameter: dict[str, inspect.Parameter] = {}
-        self._call_record: list[OrderedCallValues] = []
         i = 0
-        for name, param in signature.parameters.items():
-            self._arg_index_to_arg_name[i] = name
-            self._arg_name_to_parameter[name] = param
+        for arg_name, param in signature.parameters.items():
+            self._arg_index_to_arg_name[i] = arg_name
+            self._arg_name_to_parameter[arg_name] = param
             i += 1
 
     def _populate_defaults(self, ordered_call: OrderedCallValues) -> OrderedCallValues:
@@ -96,103 +154,438 @@ class MockMethodState[R]:
             ordered_key_values.append((name, value))
         return tuple(ordered_key_values)
 
-    def _ordered_call(self, *args, **kwargs) -> OrderedCallValues:
+    def canonical_call(self, *args, **kwargs) -> OrderedCallValues:
+        """
+        The args of a call, with self as the first, bound to their names in signature order, with defaults filled in.
+
+        Unlike the calls made to the mock, the types of the args are not checked.
+        """
         try:
             binding = self._signature.bind(*args, **kwargs)
             ordered_call = tuple(binding.arguments.items())[1:]
-            ordered_call = self._populate_defaults(ordered_call)
-            self._check_key_type_safety(ordered_call)
-            return ordered_call
+            return self._populate_defaults(ordered_call)
         except TypeError as e:
             raise MockTypeSafetyError(
-                _error_invalid_mock_args.format(
-                    method_name=self.name,
-                    attempted_args=args[1:],
-                    attempted_kwargs=kwargs,
-                    actual_signature=self._signature,
-                )
+                _error_invalid_mock_args,
+                method_name=self.name,
+                attempted_args=args[1:],
+                attempted_kwargs=kwargs,
+                actual_signature=str(self._signature),
             ) from e
 
+
+class MockMethodState[R](CallBinder):
+    def __init__(
+        self,
+        name: str,
+        signature: Signature,
+        func: FunctionType,
+        type_safety: TypeSafety,
+        instrument: bool = False,
+        thread_safe: bool = False,
+        capture: CapturePolicy = CapturePolicy.REF,
+        type_check: TypeCheckBackend = TypeCheckBackend.COMPILED,
+        hints: dict[str, Any] | None = None,
+        owner: str = "",
+    ) -> None:
+        super().__init__(name, signature)
+        self.owner = owner
+        self.func = func
+        self._hints = hints if hints is not None else func.__annotations__
+        self._type_check = type_check
+        self._type_safety = type_safety
+        self._stats: MemberStats | None = new_member_stats(name, instrument, thread_safe)
+        self._thread_safe = thread_safe
+        self._capture = capture_function(capture)
+        self._capture_expected = digest_args if capture == CapturePolicy.DIGEST else None
+        self._stubs: StubTable[Responder] = StubTable()
+        self._delays: StubTable[Delay] = StubTable()
+        self._captor_stubs: list[tuple[OrderedCallValues, Responder]] = []
+        self.has_delays = False
+        self._stream = stream_of(func, self._hints)
+        self._open = False
+        self._call_record: list[OrderedCallValues] | ShardedCallLog[OrderedCallValues] = (
+            ShardedCallLog() if thread_safe else []
+        )
+        self._tally = InteractionTally(self._call_record)
+        self._arg_checkers, self._return_checker = self._compile_checkers()
+        if observe.usage:
+            usage.track(self)
+
+    def _compile_checkers(
+        self,
+    ) -> tuple[dict[str, tuple[Any, Checker]], tuple[Any, Checker] | None]:
+        """
+        Compiles a checker for the hint of each arg and of the return, once, for the calls to check against.
+        """
+        func_annotations = self._hints
+        arg_checkers: dict[str, tuple[Any, Checker]] = {}
+        if self._type_check == TypeCheckBackend.NONE:
+            return arg_checkers, None
+        for name, param in self._arg_name_to_parameter.items():
+            if name not in func_annotations:
+                continue
+            arg_type = func_annotations[name]
+            if param.kind == inspect.Parameter.VAR_POSITIONAL:
+                arg_type = tuple[arg_type, ...]
+            if param.kind == inspect.Parameter.VAR_KEYWORD:
+                arg_type = dict[str, arg_type]
+            arg_checkers[name] = (arg_type, checker_for(arg_type, self._type_check))
+        return_checker: tuple[Any, Checker] | None = None
+        if "return" in func_annotations:
+            return_type = func_annotations["return"]
+            return_checker = (return_type, checker_for(return_type, self._type_check))
+        elif self._type_safety == TypeSafety.NO_RETURN_IS_NONE_RETURN:
+            return_checker = (None, checker_for(None, self._type_check))
+        return arg_checkers, return_checker
+
+    def _ordered_call(self, *args, **kwargs) -> OrderedCallValues:
+        ordered_call = self.canonical_call(*args, **kwargs)
+        self._check_key_type_safety(ordered_call)
+        return ordered_call
+
     def response_for(self, *args, **kwargs) -> R:
-        key = self._ordered_call(*args, **kwargs)
-        self._call_record.append(key)
-        if key in self._responses:
-            r = self._responses[key].response(*args, **kwargs)
-            self._validate_return(r)
-            return r
+        key = self.canonical_call(*args, **kwargs)
+        responder, args, kwargs = self._find_responder(key, args, kwargs)
+        return self._respond(responder, args, kwargs)
+
+    def observed_response_for(self, *args, **kwargs) -> R:
+        """
+        As `response_for`, but times each phase of the call for the active profiles, and emits its events to the
+        hook subscribers.
+        """
+        timings: profiling.Timings = []
+        call_start = perf_counter_ns()
+        key: OrderedCallValues = ()
+        result: Any = None
+        error: BaseException | None = None
+        try:
+            key = self.canonical_call(*args, **kwargs)
+            profiling.lap(timings, profiling.BIND, call_start)
+            responder, args, kwargs = self._find_responder(key, args, kwargs, timings)
+            result = self._respond(responder, args, kwargs, timings)
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._observed(timings, key, result, error, call_start)
+
+    async def delayed_response_for(self, *args, **kwargs) -> R:
+        """
+        As `response_for`, but first waits for any delay specified for the call.
+        """
+        if not observe.enabled:
+            key = self.canonical_call(*args, **kwargs)
+            responder, args, kwargs = self._find_responder(key, args, kwargs)
+            return await self._delayed_respond(key, responder, args, kwargs)
+        timings: profiling.Timings = []
+        call_start = perf_counter_ns()
+        key = ()
+        result: Any = None
+        error: BaseException | None = None
+        try:
+            key = self.canonical_call(*args, **kwargs)
+            profiling.lap(timings, profiling.BIND, call_start)
+            responder, args, kwargs = self._find_responder(key, args, kwargs, timings)
+            result = await self._delayed_respond(key, responder, args, kwargs, timings)
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._observed(timings, key, result, error, call_start)
+
+    def _observed(
+        self,
+        timings: profiling.Timings,
+        key: OrderedCallValues,
+        result: Any,
+        error: BaseException | None,
+        start: int,
+    ) -> None:
+        if observe.profiling:
+            profiling.record(self, timings)
+        if observe.hooks:
+            hooks.call_finished(self, "call", key, result, error, start)
+
+    async def _delayed_respond(
+        self,
+        key: OrderedCallValues,
+        responder: Responder,
+        args: tuple,
+        kwargs: dict[str, Any],
+        timings: profiling.Timings | None = None,
+    ) -> R:
+        found = self._delays.lookup(key)
+        if found is not None:
+            await sleep(found[0].seconds())
+        if isinstance(responder, ResponderChoose):
+            responder = responder.choose()
+            if isinstance(responder, ResponderDelayed):
+                await sleep(responder.delay.seconds())
+        return self._respond(responder, args, kwargs, timings)
+
+    def _find_responder(
+        self,
+        key: OrderedCallValues,
+        args: tuple,
+        kwargs: dict[str, Any],
+        timings: profiling.Timings | None = None,
+    ) -> tuple[Responder, tuple, dict[str, Any]]:
+        """
+        Checks the args of a call, records it and finds its responder, with the args to call it with.
+
+        Observed calls pass timings, to which the time of each phase is added, and count the stub usage.
+        """
+        start = 0
+        if timings is None:
+            self._check_key_type_safety(key)
+            stats = self._record(key)
+            found = self._stubs.lookup(key)
         else:
-            for matcher_key, responder in self._matcher_responses.items():
-                if matcher_key == key:
-                    self._check_key_type_safety(key)
-                    r = responder.response(**dict(key))
-                    self._validate_return(r)
-                    return r
+            start = perf_counter_ns()
+            self._check_key_type_safety(key)
+            start = profiling.lap(timings, profiling.ARG_CHECK, start)
+            stats = self._record(key)
+            start = profiling.lap(timings, profiling.RECORD, start)
+            found = self._stubs.lookup(key)
+            start = profiling.lap(timings, profiling.LOOKUP, start)
+            if observe.usage:
+                if found is None:
+                    self._stubs.count_miss(key)
+                else:
+                    self._stubs.count_hit(found[0])
+        if found is None:
+            if stats is not None:
+                stats.record_miss()
             raise NoBehaviourSpecifiedError(
                 "No behaviour specified for method: {} with args: {}".format(self.name, key)
             )
+        responder, matched_by_matcher = found
+        if not matched_by_matcher:
+            return responder, args, kwargs
+        if self._captor_stubs:
+            self._capture_args(responder, key)
+            if timings is not None:
+                profiling.lap(timings, profiling.RECORD, start)
+        return responder, (), dict(key)
+
+    def _record(self, key: OrderedCallValues) -> MemberStats | None:
+        capture = self._capture
+        record = key if capture is None else capture(key)
+        self._call_record.append(record)
+        for scope in active_scopes():
+            scope.record_call(self, record)
+        stats = self._stats
+        if stats is not None:
+            stats.record_call(perf_counter_ns())
+        return stats
+
+    def spy_lookup(
+        self, key: OrderedCallValues, timings: profiling.Timings | None = None
+    ) -> Responder | None:
+        """
+        Records a call to a spy, and finds the responder for it, or None if the call goes to the real object.
+
+        Observed calls pass timings, as to `_find_responder`.
+        """
+        if timings is None:
+            self._record(key)
+            found = self._stubs.lookup(key)
+            start = 0
+        else:
+            start = perf_counter_ns()
+            self._record(key)
+            start = profiling.lap(timings, profiling.RECORD, start)
+            found = self._stubs.lookup(key)
+            start = profiling.lap(timings, profiling.LOOKUP, start)
+            if observe.usage and found is not None:
+                self._stubs.count_hit(found[0])
+        if found is None:
+            return None
+        self._check_key_type_safety(key)
+        if found[1] and self._captor_stubs:
+            self._capture_args(found[0], key)
+        if timings is not None:
+            profiling.lap(timings, profiling.ARG_CHECK, start)
+        return found[0]
+
+    def _capture_args(self, responder: Responder, key: OrderedCallValues) -> None:
+        for stub_key, captor_responder in self._captor_stubs:
+            if captor_responder is responder:
+                capture_args(stub_key, key)
+                return
+
+    def observed_spy_response(self, key: OrderedCallValues, real: Callable[[], R]) -> R:
+        """
+        Responds to a call to a spy, as the spy itself does, timing each phase of the call for the active profiles,
+        and emitting its events to the hook subscribers. Calls which go to the real object are not timed.
+        """
+        timings: profiling.Timings = []
+        start = perf_counter_ns()
+        result: Any = None
+        error: BaseException | None = None
+        try:
+            responder = self.spy_lookup(key, timings)
+            if responder is None:
+                result = real()
+            else:
+                result = self.spy_respond(responder, key, timings)
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._observed(timings, key, result, error, start)
+
+    async def observed_spy_response_async(
+        self, key: OrderedCallValues, real: Callable[[], Any]
+    ) -> R:
+        timings: profiling.Timings = []
+        start = perf_counter_ns()
+        result: Any = None
+        error: BaseException | None = None
+        try:
+            responder = self.spy_lookup(key, timings)
+            if responder is None:
+                result = await real()
+            else:
+                result = await self.spy_respond_async(responder, key, timings)
+            return result
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            self._observed(timings, key, result, error, start)
+
+    def spy_respond(
+        self,
+        responder: Responder,
+        key: OrderedCallValues,
+        timings: profiling.Timings | None = None,
+    ) -> R:
+        return self._respond(responder, (), dict(key), timings)
+
+    async def spy_respond_async(
+        self,
+        responder: Responder,
+        key: OrderedCallValues,
+        timings: profiling.Timings | None = None,
+    ) -> R:
+        if self.has_delays:
+            return await self._delayed_respond(key, responder, (), dict(key), timings)
+        return self._respond(responder, (), dict(key), timings)
+
+    def _respond(
+        self,
+        responder: Responder,
+        args: tuple,
+        kwargs: dict[str, Any],
+        timings: profiling.Timings | None = None,
+    ) -> R:
+        stats = self._stats
+        start = 0 if timings is None else perf_counter_ns()
+        if stats is None:
+            r = responder.response(*args, **kwargs)
+        else:
+            r = instrumented_response(stats, responder, args, kwargs)
+        if timings is not None:
+            start = profiling.lap(timings, profiling.RESPONDER, start)
+        self._validate_return(r)
+        if timings is not None:
+            profiling.lap(timings, profiling.RETURN_CHECK, start)
+        return r
+
+    def recorded_calls(
+        self, scope: CallScope | None = None
+    ) -> Sequence[OrderedCallValues] | ShardedCallLog[OrderedCallValues]:
+        """
+        The calls made to this method, either all of them or only those made within the given scope.
+        """
+        if scope is None:
+            return self._call_record
+        return scope.calls_for(self)
+
+    def expected_call(self, *args, **kwargs) -> OrderedCallValues:
+        """
+        The ordered args of an expected call, in the form they can be compared with recorded calls.
+        """
+        expected_call = self._ordered_call(*args, **kwargs)
+        if self._capture_expected is not None:
+            # Compare digests with digests, rather than digesting the expected args for every record.
+            expected_call = self._capture_expected(expected_call)
+        return expected_call
 
     def call_count_for(self, *args, **kwargs) -> CallCount:
-        other_calls = []
+        return self.call_count_in(self._call_record, *args, **kwargs)
+
+    def call_count_in(
+        self,
+        records: Iterable[OrderedCallValues],
+        /,
+        *args,
+        **kwargs,
+    ) -> CallCount:
         count = 0
-        expected_call = self._ordered_call(*args, **kwargs)
-        for call in self._call_record:
+        total = 0
+        expected_call = self.expected_call(*args, **kwargs)
+        captors = has_captors(expected_call)
+        for call in records:
+            total += 1
             if call == expected_call:
                 count += 1
-            else:
-                other_calls.append(call)
-        return CallCount(expected_call, count, other_calls)
+                if captors:
+                    capture_args(expected_call, call)
+        return CallCount(expected_call, count, total - count, records)
+
+    def mark_verified(self, expected_call: OrderedCallValues) -> None:
+        self._tally.mark_verified(expected_call, has_matchers(expected_call))
+
+    def unverified_calls(self) -> list[tuple[OrderedCallValues, int]]:
+        return self._tally.unverified()
 
     def _validate_return(self, response: R):
-        func_annotations = self.func.__annotations__
-        if self._type_safety == TypeSafety.NO_RETURN_IS_NONE_RETURN:
-            return_type = func_annotations.get("return")
-            if return_type is None:
-                if response is not None:
-                    raise MockTypeSafetyError(
-                        "Method: {} return must be of type:{}".format(
-                            self.name,
-                            return_type,
-                        )
-                    )
-            elif not isinstance(response, return_type):
-                raise MockTypeSafetyError(
-                    "Method: {} return must be of type:{}".format(
-                        self.name,
-                        return_type,
-                    )
-                )
-        else:
-            if "return" in func_annotations:
-                return_type = func_annotations["return"]
-                if return_type is None:
-                    if response is not None:
-                        raise MockTypeSafetyError(
-                            "Method: {} return must be of type:{}".format(
-                                self.name,
-                                return_type,
-                            )
-                        )
-                elif not is_type(response, return_type):
-                    raise MockTypeSafetyError(
-                        "Method: {} return must be of type:{}".format(
-                            self.name,
-                            return_type,
-                        )
-                    )
+        return_checker = self._return_checker
+        if return_checker is not None and not return_checker[1](response):
+            raise MockTypeSafetyError(
+                "Method: {} return must be of type:{}",
+                self.name,
+                return_checker[0],
+            )
 
     def _set_key_to_responder(self, key: OrderedCallValues, responder: Responder):
-        if has_matchers(key):
-            self._matcher_responses[key] = responder
-        else:
-            self._responses[key] = responder
+        if self._thread_safe and isinstance(responder, (ResponderMany, ResponderIter)):
+            responder = ResponderSynchronised(responder, threading.Lock())
+        if has_captors(key):
+            # Behaviour specified again for the same captor replaces the last, as it does in the stub table.
+            replace_entry(self._captor_stubs, key, responder, same_key)
+        self._stubs.put(key, responder, has_matchers(key))
+        if observe.hooks:
+            hooks.behaviour_set(self, key, responder)
+
+    def set_responders(self, responders: Iterable[tuple[OrderedCallValues, Responder]]) -> None:
+        """
+        Sets the responders for many concrete calls at once.
+        """
+        thread_safe = self._thread_safe
+        if observe.hooks:
+            responders = list(responders)
+            for key, responder in responders:
+                hooks.behaviour_set(self, key, responder)
+        self._stubs.put_all(
+            (
+                key,
+                ResponderSynchronised(responder, threading.Lock()) if thread_safe else responder,
+                False,
+            )
+            for key, responder in responders
+        )
 
     def set_response(self, response: R, *args, **kwargs):
         key = self._ordered_call(*args, **kwargs)
         self._validate_return(response)
-        if has_matchers(key):
-            self._matcher_responses[key] = ResponderBasic(response)
-        else:
-            self._responses[key] = ResponderBasic(response)
+        self._set_key_to_responder(key, ResponderBasic(response))
 
     def set_response_many(self, results: list[R], loop: bool, *args, **kwargs) -> None:
         key = self._ordered_call(*args, **kwargs)
@@ -200,6 +593,88 @@ class MockMethodState[R]:
             self._validate_return(response)
         self._set_key_to_responder(key, ResponderMany(results, loop))
 
+    def set_response_iter(
+        self, source: Iterable[R] | Callable[[], Iterable[R]], loop: bool, *args, **kwargs
+    ) -> None:
+        key = self._ordered_call(*args, **kwargs)
+        self._set_key_to_responder(key, ResponderIter(iterable_factory(source, loop), loop))
+
+    def set_response_stream(
+        self, source: StreamSource, chunk_delay: DelaySource | None, *args, **kwargs
+    ) -> None:
+        stream = self._stream
+        if stream is None:
+            raise MockingError(
+                "Streams can only be specified for methods which return an iterator, but '{}' does not.".format(
+                    self.name
+                )
+            )
+        is_async, item_type = stream
+        if chunk_delay is not None and not is_async:
+            raise MockingError(
+                "Chunk delays can only be specified for async streams, but '{}' is not async.".format(
+                    self.name
+                )
+            )
+        if not (isinstance(source, (Iterable, AsyncIterable)) or callable(source)):
+            raise MockingError(
+                "Expected an iterable or a factory of iterables, but got: {}".format(source)
+            )
+        if isinstance(source, AsyncIterable) and not is_async:
+            raise MockingError(
+                "Cannot stream an async iterable from '{}', which is not async.".format(self.name)
+            )
+        key = self._ordered_call(*args, **kwargs)
+        self._set_key_to_responder(
+            key,
+            ResponderStream(
+                source,
+                partial(
+                    self._validate_stream_item, item_type, checker_for(item_type, self._type_check)
+                ),
+                is_async,
+                None if chunk_delay is None else Delay(chunk_delay),
+            ),
+        )
+
+    def _validate_stream_item(self, item_type: Any, checker: Checker, item: Any) -> None:
+        if not checker(item):
+            raise MockTypeSafetyError(
+                "Method: {} streamed item must be of type:{}", self.name, item_type
+            )
+
+    def set_response_choose(
+        self,
+        outcomes: Sequence[tuple[float, Any]],
+        seed: int | str | bytes | None,
+        faults: Sequence[Fault],
+        *args,
+        **kwargs,
+    ) -> None:
+        key = self._ordered_call(*args, **kwargs)
+        responder = ResponderChoose(
+            list(outcomes),
+            list(faults),
+            seed,
+            threading.Lock() if self._thread_safe else None,
+        )
+        delayed = False
+        for outcome in responder.all_outcomes():
+            if isinstance(outcome, ResponderDelayed):
+                delayed = True
+                outcome = outcome.responder
+            if isinstance(outcome, ResponderBasic):
+                self._validate_return(outcome.response())
+        if delayed:
+            if not inspect.iscoroutinefunction(self.func):
+                raise MockingError(
+                    "Delayed outcomes can only be chosen for async methods, but '{}' is not async.".format(
+                        self.name
+                    )
+                )
+            self.has_delays = True
+        self._set_key_to_responder(key, responder)
+
     def set_error_response(self, error: Exception, *args, **kwargs):
         key = self._ordered_call(*args, **kwargs)
         self._set_key_to_responder(key, ResponderRaise(error))
@@ -208,6 +683,17 @@ class MockMethodState[R]:
         key = self._ordered_call(*args, **kwargs)
         self._set_key_to_responder(key, ResponderDo(do_function, self._ordered_call))
 
+    def set_delay(self, delay: DelaySource, *args, **kwargs):
+        if not inspect.iscoroutinefunction(self.func):
+            raise MockingError(
+                "Delays can only be specified for async methods, but '{}' is not async.".format(
+                    self.name
+                )
+            )
+        key = self._ordered_call(*args, **kwargs)
+        self._delays.put(key, Delay(delay), has_matchers(key))
+        self.has_delays = True
+
     def open_for_setup(self):
         self._open = True
 
@@ -218,25 +704,15 @@ class MockMethodState[R]:
         return self._open
 
     def _check_key_type_safety(self, key: OrderedCallValues):
-        func_annotations = self.func.__annotations__
-        for call_arg in key:
-            arg_name = call_arg[0]
-            arg_value = call_arg[1]
+        arg_checkers = self._arg_checkers
+        for arg_name, arg_value in key:
             if isinstance(arg_value, Matcher):
                 continue
-            if arg_name in func_annotations:
-                param = self._arg_name_to_parameter[arg_name]
-                arg_type = func_annotations[arg_name]
-                if param.kind == inspect.Parameter.VAR_POSITIONAL:
-                    arg_type = tuple[arg_type, ...]
-                if param.kind == inspect.Parameter.VAR_KEYWORD:
-                    arg_type = dict[str, arg_type]
-                if not is_type(arg_value, arg_type):
-                    raise MockTypeSafetyError(
-                        "Method: {} Arg: {} must be of type:{}".format(
-                            self.name, arg_name, arg_type
-                        )
-                    )
+            arg_checker = arg_checkers.get(arg_name)
+            if arg_checker is not None and not arg_checker[1](arg_value):
+                raise MockTypeSafetyError(
+                    "Method: {} Arg: {} must be of type:{}", self.name, arg_name, arg_checker[0]
+                )
 
 
 def mock_method(state: MockMethodState) -> Callable:
@@ -245,6 +721,10 @@ def mock_method(state: MockMethodState) -> Callable:
         async def async_mock(*args, **kwargs):
             if state.is_open():
                 return MethodResponseBuilder(state, *args, **kwargs)
+            elif state.has_delays:
+                return await state.delayed_response_for(*args, **kwargs)
+            elif observe.enabled:
+                return state.observed_response_for(*args, **kwargs)
             else:
                 return state.response_for(*args, **kwargs)
 
@@ -253,6 +733,8 @@ def mock_method(state: MockMethodState) -> Callable:
     def sync_mock(*args, **kwargs):
         if state.is_open():
             return MethodResponseBuilder(state, *args, **kwargs)
+        elif observe.enabled:
+            return state.observed_response_for(*args, **kwargs)
         else:
             return state.response_for(*args, **kwargs)
 
@@ -282,5 +764,25 @@ class MethodResponseBuilder[R](ResponseBuilder[R]):
     def then_return_many(self, results: list[R], loop: bool = False) -> None:
         self._method_state.set_response_many(results, loop, *self._args, **self._kwargs)
 
+    def then_yield_from(
+        self, source: Iterable[R] | Callable[[], Iterable[R]], loop: bool = False
+    ) -> None:
+        self._method_state.set_response_iter(source, loop, *self._args, **self._kwargs)
+
+    def then_choose(
+        self,
+        outcomes: Sequence[tuple[float, Any]],
+        seed: int | str | bytes | None = None,
+        faults: Sequence[Fault] = (),
+    ) -> None:
+        self._method_state.set_response_choose(outcomes, seed, faults, *self._args, **self._kwargs)
+
+    def then_stream(self, source: StreamSource, chunk_delay: DelaySource | None = None) -> None:
+        self._method_state.set_response_stream(source, chunk_delay, *self._args, **self._kwargs)
+
+    def then_delay(self, delay: DelaySource) -> "MethodResponseBuilder[R]":
+        self._method_state.set_delay(delay, *self._args, **self._kwargs)
+        return self
+
     def then_do(self, do_function: DoFunction) -> None:
         self._method_state.set_response_do(do_function, *self._args, **self._kwargs)
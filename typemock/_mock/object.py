@@ -1,18 +1,29 @@
 import inspect
-from typing import TypeVar, cast
+from collections.abc import Collection
+from typing import Any, TypeVar, cast
 
+from typemock._hints import hints_of
+from typemock._mock import observe
 from typemock._mock.attributes import AttributeResponseBuilder, MockAttributeState
 from typemock._mock.methods import MockMethodState, mock_method
+from typemock._mock.spy import spy_method
 from typemock._safety import validate_class_type_hints
-from typemock._utils import attributes, bind, methods, try_instantiate_class
-from typemock.api import TypeSafety
+from typemock._utils import attributes, bind, gil_enabled, methods, try_instantiate_class
+from typemock.api import CapturePolicy, MockingError, TypeCheckBackend, TypeSafety
+from typemock.config import MockConfig
 
 T = TypeVar("T")
 R = TypeVar("R")
 
 
 class MockObject[T]:
-    def __init__(self, mocked_thing: type[T] | T, type_safety: TypeSafety) -> None:
+    def __init__(
+        self,
+        mocked_thing: type[T] | T,
+        config: MockConfig,
+        spy: bool = False,
+        configured_members: Collection[str] = (),
+    ) -> None:
         mocked_instance: T | None
         mocked_class: type[T]
         if not inspect.isclass(mocked_thing):
@@ -21,6 +32,7 @@ class MockObject[T]:
         else:
             mocked_class = mocked_thing
             mocked_instance = try_instantiate_class(cast(type[T], mocked_thing))
+        type_safety = cast(TypeSafety, config.type_safety)
         validate_class_type_hints(
             clazz=mocked_class,
             instance=mocked_instance,
@@ -28,29 +40,73 @@ class MockObject[T]:
         )
         self._mocked_class = mocked_class
         self._mock_method_states: list[MockMethodState] = []
+        self._mock_method_states_by_name: dict[str, MockMethodState] = {}
         self._mock_attribute_states: dict[str, MockAttributeState] = {}
         self._open = False
+        self._verify_objects: dict[int, Any] = {}
+        self._calls_object: Any = None
+        # Unless configured, mocks are made thread safe when the GIL is disabled.
+        gil_disabled = not gil_enabled()
 
         # Set up method mocks
+        class_hints = hints_of(mocked_class)
         for func_entry in methods(mocked_class):
             sig = inspect.signature(func_entry.func)
+            member = config.member(func_entry.name)
             method_state: MockMethodState = MockMethodState(
-                name=func_entry.name, signature=sig, func=func_entry.func, type_safety=type_safety
+                name=func_entry.name,
+                signature=sig,
+                func=func_entry.func,
+                type_safety=type_safety,
+                instrument=bool(member.instrument),
+                thread_safe=gil_disabled if member.thread_safe is None else member.thread_safe,
+                capture=cast(CapturePolicy, member.capture),
+                type_check=cast(TypeCheckBackend, member.type_check),
+                hints=class_hints.method(func_entry.func),
+                owner=mocked_class.__qualname__,
             )
             self._mock_method_states.append(method_state)
-            mocked_method = mock_method(method_state)
+            self._mock_method_states_by_name[func_entry.name] = method_state
+            if spy:
+                mocked_method = spy_method(method_state, getattr(mocked_thing, func_entry.name))
+            else:
+                mocked_method = mock_method(method_state)
             bind(self, mocked_method, func_entry.name)
 
         # Set up attribute mocks
         attributes_entries = attributes(mocked_class, mocked_instance)
         for attribute_entry in attributes_entries:
+            member = config.member(attribute_entry.name)
             attribute_state = MockAttributeState(
                 name=attribute_entry.name,
                 initial_value=attribute_entry.initial_value,
                 type_hint=attribute_entry.type_hint,
+                instrument=bool(member.instrument),
+                thread_safe=gil_disabled if member.thread_safe is None else member.thread_safe,
+                type_check=cast(TypeCheckBackend, member.type_check),
+                owner=mocked_class.__qualname__,
             )
+            if spy:
+                attribute_state.spy_on(mocked_thing)
             self._mock_attribute_states[attribute_entry.name] = attribute_state
 
+        unknown_members = sorted(
+            name
+            for name in configured_members
+            if name not in self._mock_method_states_by_name
+            and name not in self._mock_attribute_states
+        )
+        if unknown_members:
+            raise MockingError(
+                "Config given for members which {} does not have: {}. Its members are: {}".format(
+                    mocked_class.__qualname__,
+                    ", ".join(unknown_members),
+                    ", ".join(
+                        sorted([*self._mock_method_states_by_name, *self._mock_attribute_states])
+                    ),
+                )
+            )
+
     def __getattribute__(self, item: str):
         if item.startswith("_") or item in {"is_open"}:
             return object.__getattribute__(self, item)
@@ -63,6 +119,8 @@ class MockObject[T]:
         else:
             if item in self._mock_attribute_states:
                 state = self._mock_attribute_states[item]
+                if observe.hooks:
+                    return state.observed_response()
                 return state.response()
             else:
                 return object.__getattribute__(self, item)
@@ -74,7 +132,10 @@ class MockObject[T]:
                 if self.is_open():
                     raise Exception("Cannot mock behaviour of setting an attribute at this time")
                 state = mock_attribute_states[key]
-                state.called_set_with(item)
+                if observe.hooks:
+                    state.observed_set_with(item)
+                else:
+                    state.called_set_with(item)
         object.__setattr__(self, key, item)
 
     @property
@@ -0,0 +1,18 @@
+# The single flag read on every call to a mock. While it is set, calls take the observed path, which times their
+# phases for the active profiles, emits events to the hook subscribers and counts stub usage. Otherwise, calls are
+# not observed at all.
+enabled = False
+
+# Whether any profile is active.
+profiling = False
+
+# Whether any hook has subscribers.
+hooks = False
+
+# Whether the usage of stubs is being counted.
+usage = False
+
+
+def refresh() -> None:
+    global enabled
+    enabled = profiling or hooks or usage
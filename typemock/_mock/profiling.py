@@ -0,0 +1,191 @@
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any
+
+from typemock._mock import observe
+
+BIND = "bind"
+ARG_CHECK = "arg_check"
+RECORD = "record"
+LOOKUP = "lookup"
+RESPONDER = "responder"
+RETURN_CHECK = "return_check"
+
+PHASES = (BIND, ARG_CHECK, RECORD, LOOKUP, RESPONDER, RETURN_CHECK)
+
+_active: tuple["Profile", ...] = ()
+_active_lock = threading.Lock()
+
+type Timings = list[tuple[str, int]]
+
+
+class PhaseTime:
+    """
+    The number of times a phase of a call ran, and the total time it took.
+    """
+
+    __slots__ = ("count", "total_ns")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"count": self.count, "total_ns": self.total_ns, "mean_ns": self.mean_ns}
+
+
+class MethodProfile:
+    """
+    The time spent in each phase of the calls to one method of one mock.
+
+    Phases:
+
+    - bind: binding the args to the signature of the method.
+    - arg_check: checking the args against their type hints.
+    - record: recording the call for verification.
+    - lookup: finding the specified behaviour for the call.
+    - responder: producing the response.
+    - return_check: checking the response against the return type hint.
+    """
+
+    def __init__(self, mock_name: str, method_name: str) -> None:
+        self.mock_name = mock_name
+        self.method_name = method_name
+        self.calls = 0
+        self.phases: dict[str, PhaseTime] = {phase: PhaseTime() for phase in PHASES}
+
+    def add(self, timings: Timings) -> None:
+        self.calls += 1
+        phases = self.phases
+        for phase, ns in timings:
+            phase_time = phases[phase]
+            phase_time.count += 1
+            phase_time.total_ns += ns
+
+    @property
+    def total_ns(self) -> int:
+        return sum(phase_time.total_ns for phase_time in self.phases.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "mock": self.mock_name,
+            "method": self.method_name,
+            "calls": self.calls,
+            "total_ns": self.total_ns,
+            "phases": {phase: phase_time.as_dict() for phase, phase_time in self.phases.items()},
+        }
+
+
+class Profile:
+    """
+    The time spent in each phase of the calls to mocks made while the profile was active, per mock and per method.
+
+    Counters are updated without locking, so on free-threaded builds of Python, concurrent calls to the same method
+    may be slightly undercounted.
+    """
+
+    def __init__(self) -> None:
+        self._methods: dict[Any, MethodProfile] = {}
+        self._lock = threading.Lock()
+
+    def _method(self, method_state: Any) -> MethodProfile:
+        method_profile = self._methods.get(method_state)
+        if method_profile is None:
+            with self._lock:
+                method_profile = self._methods.get(method_state)
+                if method_profile is None:
+                    method_profile = MethodProfile(method_state.owner, method_state.name)
+                    self._methods[method_state] = method_profile
+        return method_profile
+
+    def methods(self) -> list[MethodProfile]:
+        """
+        The profiles of every method called, slowest in total first.
+        """
+        return sorted(self._methods.values(), key=lambda m: m.total_ns, reverse=True)
+
+    def of(self, mock: Any) -> dict[str, MethodProfile]:
+        """
+        The profiles of the methods of a mock which were called, by method name.
+        """
+        return {
+            name: self._methods[state]
+            for name, state in object.__getattribute__(mock, "_mock_method_states_by_name").items()
+            if state in self._methods
+        }
+
+    def as_dict(self) -> list[dict[str, Any]]:
+        return [method_profile.as_dict() for method_profile in self.methods()]
+
+    def report(self) -> str:
+        """
+        A table of the time spent in each phase, per method, in mean nanoseconds per call.
+        """
+        lines = [
+            "{:<40} {:>8} ".format("method", "calls")
+            + " ".join("{:>12}".format(phase) for phase in PHASES)
+        ]
+        for method_profile in self.methods():
+            lines.append(
+                "{:<40} {:>8} ".format(
+                    "{}.{}".format(method_profile.mock_name, method_profile.method_name),
+                    method_profile.calls,
+                )
+                + " ".join(
+                    "{:>12,.0f}".format(method_profile.phases[phase].mean_ns) for phase in PHASES
+                )
+            )
+        return "\n".join(lines)
+
+
+def lap(timings: Timings, phase: str, start: int) -> int:
+    """
+    Adds the time since start to the timings of a phase, and returns the time now, as the start of the next phase.
+    """
+    now = perf_counter_ns()
+    timings.append((phase, now - start))
+    return now
+
+
+def record(method_state: Any, timings: Timings) -> None:
+    for active_profile in _active:
+        active_profile._method(method_state).add(timings)
+
+
+@contextmanager
+def _profile() -> Generator[Profile, None, None]:
+    """
+    Breaks down the time spent in calls to mocks, made within the context in any thread, into phases, per mock and
+    per method.
+
+    Outside of any profile, calls to mocks are not timed at all.
+
+    Examples:
+
+        with profile() as p:
+            run_slow_test()
+
+        print(p.report())
+
+    Yields:
+        The profile, which is filled in as calls are made.
+    """
+    global _active
+    new_profile = Profile()
+    with _active_lock:
+        _active = _active + (new_profile,)
+        observe.profiling = True
+        observe.refresh()
+    try:
+        yield new_profile
+    finally:
+        with _active_lock:
+            _active = tuple(p for p in _active if p is not new_profile)
+            observe.profiling = bool(_active)
+            observe.refresh()
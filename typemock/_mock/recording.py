@@ -0,0 +1,200 @@
+import heapq
+import threading
+from collections.abc import Iterator, Sequence
+from operator import itemgetter
+from time import perf_counter_ns
+from typing import Any, Generic, TypeVar, overload
+
+T = TypeVar("T")
+
+_timestamp_of = itemgetter(0)
+
+
+class ShardedCallLog(Generic[T]):
+    """
+    Append only call log for mocks which are called from many threads.
+
+    Each thread appends to its own shard, tagged with a monotonic timestamp, so recording never contends on
+    shared state, with or without the GIL. The shards are merged back into call order lazily, when the log is
+    read. Calls from the same thread always keep their order.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[list[tuple[int, T]]] = []
+        self._shards_lock = threading.Lock()
+        self._merged: tuple[int, list[T]] = (0, [])
+
+    def append(self, item: T) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+        shard.append((perf_counter_ns(), item))
+
+    def _new_shard(self) -> list[tuple[int, T]]:
+        shard: list[tuple[int, T]] = []
+        with self._shards_lock:
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
+
+    def _snapshot(self) -> list[T]:
+        with self._shards_lock:
+            shards = [list(shard) for shard in self._shards]
+        size = sum(len(shard) for shard in shards)
+        merged_size, merged = self._merged
+        if size != merged_size:
+            merged = [item for _, item in heapq.merge(*shards, key=_timestamp_of)]
+            self._merged = (size, merged)
+        return merged
+
+    def unread(self, offsets: list[int]) -> list[T]:
+        """
+        The items appended since the log was last read with the same offsets, one per shard, which are moved past
+        them. Unlike slicing the merged log, no item is missed when one stamped earlier is appended later.
+        """
+        with self._shards_lock:
+            shards = list(self._shards)
+        items: list[T] = []
+        for index, shard in enumerate(shards):
+            if index == len(offsets):
+                offsets.append(0)
+            size = len(shard)
+            items.extend(item for _, item in shard[offsets[index] : size])
+            offsets[index] = size
+        return items
+
+    def __len__(self) -> int:
+        with self._shards_lock:
+            return sum(len(shard) for shard in self._shards)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._snapshot())
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._snapshot()[index]
+
+
+class ShardedCounter:
+    """
+    Counter which each thread increments in its own shard, so increments are never lost and never contend.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._shards: list[list[int]] = []
+        self._shards_lock = threading.Lock()
+
+    def increment(self) -> None:
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = [0]
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        shard[0] += 1
+
+    @property
+    def value(self) -> int:
+        with self._shards_lock:
+            return sum(shard[0] for shard in self._shards)
+
+
+class InteractionTally(Generic[T]):
+    """
+    Counts of the distinct interactions recorded with a mock member, and how many of each have been verified.
+
+    The tally follows the member's record lazily, only consuming the records added since it was last read, so
+    recording a call costs nothing extra, and checking for unverified interactions is proportional to the
+    number of distinct interactions rather than the number of calls.
+    """
+
+    def __init__(self, records: Sequence[T] | ShardedCallLog[T]) -> None:
+        self._records = records
+        self._consumed = 0
+        self._shard_offsets: list[int] = []
+        self._lock = threading.Lock()
+        # Each count is [recorded, verified]
+        self._hashed: dict[T, list[int]] = {}
+        self._unhashable: list[tuple[T, list[int]]] = []
+
+    def _sync(self) -> None:
+        records = self._records
+        if isinstance(records, ShardedCallLog):
+            new_records = records.unread(self._shard_offsets)
+        else:
+            size = len(records)
+            if size == self._consumed:
+                return
+            new_records = records[self._consumed : size]
+            self._consumed = size
+        for record in new_records:
+            try:
+                counts = self._hashed.get(record)
+                if counts is None:
+                    counts = [0, 0]
+                    self._hashed[record] = counts
+            except TypeError:
+                counts = self._unhashable_counts(record)
+            counts[0] += 1
+
+    def _unhashable_counts(self, record: T) -> list[int]:
+        for existing, counts in self._unhashable:
+            if existing == record:
+                return counts
+        counts = [0, 0]
+        self._unhashable.append((record, counts))
+        return counts
+
+    def _entries(self) -> Iterator[tuple[T, list[int]]]:
+        yield from self._hashed.items()
+        yield from self._unhashable
+
+    def mark_verified(self, expected: Any, has_matchers: bool = True) -> None:
+        """
+        Marks every interaction recorded so far which equals the expected one, which may contain matchers, as verified.
+
+        An expected interaction without matchers, if hashable, is looked up directly rather than compared with every
+        distinct interaction.
+        """
+        with self._lock:
+            self._sync()
+            if not has_matchers:
+                try:
+                    counts = self._hashed.get(expected)
+                except TypeError:
+                    pass
+                else:
+                    if counts is not None:
+                        counts[1] = counts[0]
+                    for record, counts in self._unhashable:
+                        if record == expected:
+                            counts[1] = counts[0]
+                    return
+            for record, counts in self._entries():
+                if record == expected:
+                    counts[1] = counts[0]
+
+    def unverified(self) -> list[tuple[T, int]]:
+        """
+        Returns:
+            Each distinct interaction with calls that have not been verified, with the number of those calls.
+        """
+        with self._lock:
+            self._sync()
+            return [
+                (record, counts[0] - counts[1])
+                for record, counts in self._entries()
+                if counts[0] > counts[1]
+            ]
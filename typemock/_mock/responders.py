@@ -1,8 +1,12 @@
+import random
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from bisect import bisect_right
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from contextlib import AbstractContextManager
 from typing import Any, Generic, NoReturn, TypeVar
 
-from typemock.api import DoFunction, NoBehaviourSpecifiedError
+from typemock._mock.timing import Delay, sleep
+from typemock.api import DoFunction, MockingError, NoBehaviourSpecifiedError
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -53,6 +57,283 @@ class ResponderMany[R](Responder[R]):
         return response
 
 
+class ResponderIter[R](Responder[R]):
+    """
+    Pulls each response lazily from an iterable, so that responses need never all be held in memory.
+
+    To loop, a new iterator is made from the source once the current one is exhausted.
+    """
+
+    def __init__(self, source: Callable[[], Iterable[R]], loop: bool):
+        self._source = source
+        self._loop = loop
+        self._iterator: Iterator[R] | None = None
+
+    def response(self, *args, **kwargs) -> R:
+        if self._iterator is None:
+            self._iterator = iter(self._source())
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            pass
+        if self._loop:
+            self._iterator = iter(self._source())
+            try:
+                return next(self._iterator)
+            except StopIteration:
+                pass
+            raise NoBehaviourSpecifiedError("No responses to loop through, the source is empty.")
+        raise NoBehaviourSpecifiedError(
+            "No more responses. Do you want to loop through the responses?"
+        )
+
+
+class ResponderReplay[R](Responder[R]):
+    """
+    Replays recorded outcomes in order, each either a return value or a raised error.
+    """
+
+    def __init__(self, outcomes: list[tuple[bool, Any]], loop: bool):
+        self._outcomes = outcomes
+        self._loop = loop
+        self._index = 0
+
+    def response(self, *args, **kwargs) -> R:
+        if self._index >= len(self._outcomes):
+            if not self._loop:
+                raise NoBehaviourSpecifiedError(
+                    "No more recorded responses. Do you want to loop through the recording?"
+                )
+            self._index = 0
+        raised, value = self._outcomes[self._index]
+        self._index += 1
+        if raised:
+            raise value
+        return value
+
+
+type StreamSource = (
+    Iterable[Any] | AsyncIterable[Any] | Callable[[], Iterable[Any] | AsyncIterable[Any]]
+)
+
+
+class ResponderStream(Responder[Any]):
+    """
+    Responds to each call with a new generator, sync or async, which lazily streams the items of a source, validating
+    each item as it is yielded.
+    """
+
+    def __init__(
+        self,
+        source: StreamSource,
+        validate_item: Callable[[Any], None],
+        is_async: bool,
+        chunk_delay: Delay | None = None,
+    ):
+        self._source = source
+        self._validate_item = validate_item
+        self._is_async = is_async
+        self._chunk_delay = chunk_delay
+
+    def response(self, *args, **kwargs) -> Iterator[Any] | AsyncIterator[Any]:
+        source = self._source
+        if callable(source) and not isinstance(source, (Iterable, AsyncIterable)):
+            source = source()
+        if self._is_async:
+            return self._async_stream(source)
+        if not isinstance(source, Iterable):
+            raise MockingError("Cannot stream an async iterable from a method which is not async.")
+        return self._stream(source)
+
+    def _stream(self, source: Iterable[Any]) -> Iterator[Any]:
+        validate_item = self._validate_item
+        for item in source:
+            validate_item(item)
+            yield item
+
+    async def _async_stream(self, source: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+        validate_item = self._validate_item
+        chunk_delay = self._chunk_delay
+        if isinstance(source, AsyncIterable):
+            async for item in source:
+                if chunk_delay is not None:
+                    await sleep(chunk_delay.seconds())
+                validate_item(item)
+                yield item
+        else:
+            for item in source:
+                if chunk_delay is not None:
+                    await sleep(chunk_delay.seconds())
+                validate_item(item)
+                yield item
+
+
+class ResponderRaiseNew(Responder[NoReturn]):
+    """
+    Raises a new error for each response, made by a factory, such as an exception class.
+    """
+
+    def __init__(self, error_factory: Callable[[], BaseException]):
+        self._error_factory = error_factory
+
+    def response(self, *args, **kwargs) -> NoReturn:
+        raise self._error_factory()
+
+
+class ResponderDelayed[R](Responder[R]):
+    """
+    An outcome of a `ResponderChoose`, which is given by another responder once a delay has passed.
+
+    The delay is slept by the async mocked method which chose the outcome.
+    """
+
+    def __init__(self, delay: Delay, responder: Responder[R]):
+        self.delay = delay
+        self.responder = responder
+
+    def response(self, *args, **kwargs) -> R:
+        return self.responder.response(*args, **kwargs)
+
+
+class Fault:
+    """
+    An outcome which is scheduled by call number, taking precedence over the weighted outcomes of a `then_choose`.
+
+    The fault is active from call `after`, counted from zero, onwards. With `every`, it is active only in bursts of
+    `length` calls at the start of each `every` calls. While active, it occurs with the given probability.
+
+    Examples:
+
+        # Fail 5% of calls after call 1000.
+        Fault(outcome.raises(TimeoutError), probability=0.05, after=1000)
+
+        # A burst of 20 errors every 10k calls.
+        Fault(outcome.raises(ConnectionError), every=10_000, length=20)
+
+    """
+
+    def __init__(
+        self,
+        outcome: Any,
+        probability: float = 1.0,
+        after: int = 0,
+        every: int | None = None,
+        length: int = 1,
+    ):
+        if not 0.0 <= probability <= 1.0:
+            raise MockingError(
+                "Fault probability must be between 0 and 1, but was: {}".format(probability)
+            )
+        if every is not None and not 0 < length <= every:
+            raise MockingError(
+                "Fault bursts must be at least 1 call long and no longer than every {} calls, but were: {}".format(
+                    every, length
+                )
+            )
+        self.outcome = outcome_responder(outcome)
+        self.probability = probability
+        self.after = after
+        self.every = every
+        self.length = length
+
+    def active(self, call: int) -> bool:
+        since = call - self.after
+        if since < 0:
+            return False
+        every = self.every
+        return every is None or since % every < self.length
+
+
+def outcome_responder(outcome: Any) -> Responder:
+    """
+    The responder for an outcome of `then_choose`, which is a responder, or otherwise a value to return.
+    """
+    if isinstance(outcome, Responder):
+        return outcome
+    return ResponderBasic(outcome)
+
+
+class ResponderChoose(Responder[Any]):
+    """
+    Chooses the outcome of each call from weighted outcomes, or a scheduled fault, with a seeded random number
+    generator, so that a sequence of calls always has the same sequence of outcomes.
+
+    Choosing an outcome takes a single draw per active fault, and a bisection of the cumulative weights.
+    """
+
+    def __init__(
+        self,
+        outcomes: list[tuple[float, Any]],
+        faults: list[Fault],
+        seed: int | str | bytes | None,
+        lock: AbstractContextManager | None = None,
+    ):
+        if not outcomes:
+            raise MockingError("At least one outcome must be given to choose from.")
+        total = 0.0
+        cumulative: list[float] = []
+        for weight, _ in outcomes:
+            if weight < 0:
+                raise MockingError("Outcome weights cannot be negative, but got: {}".format(weight))
+            total += weight
+            cumulative.append(total)
+        if total <= 0:
+            raise MockingError("Outcome weights must add up to more than 0.")
+        self._cumulative = [c / total for c in cumulative]
+        self._cumulative[-1] = 1.0
+        self.outcomes = [outcome_responder(outcome) for _, outcome in outcomes]
+        self.faults = faults
+        self._random = random.Random(seed)
+        self._calls = 0
+        self._lock = lock
+
+    def choose(self) -> Responder:
+        lock = self._lock
+        if lock is None:
+            return self._choose()
+        with lock:
+            return self._choose()
+
+    def _choose(self) -> Responder:
+        call = self._calls
+        self._calls = call + 1
+        draw = self._random.random
+        for fault in self.faults:
+            if fault.active(call) and (fault.probability >= 1.0 or draw() < fault.probability):
+                return fault.outcome
+        outcomes = self.outcomes
+        if len(outcomes) == 1:
+            return outcomes[0]
+        return outcomes[bisect_right(self._cumulative, draw())]
+
+    def response(self, *args, **kwargs) -> Any:
+        return self.choose().response(*args, **kwargs)
+
+    def all_outcomes(self) -> list[Responder]:
+        return self.outcomes + [fault.outcome for fault in self.faults]
+
+
+def iterable_factory[R](
+    source: Iterable[R] | Callable[[], Iterable[R]], loop: bool
+) -> Callable[[], Iterable[R]]:
+    """
+    Normalises the source of a `ResponderIter` to a factory of iterables.
+
+    Raises:
+        MockingError: If asked to loop over an iterator, which can only be iterated once.
+    """
+    if isinstance(source, Iterable):
+        iterable = source
+        if loop and iter(iterable) is iterable:
+            raise MockingError(
+                "Cannot loop over an iterator, as it can only be iterated once. Give a factory which makes it."
+            )
+        return lambda: iterable
+    if callable(source):
+        return source
+    raise MockingError("Expected an iterable or a factory of iterables, but got: {}".format(source))
+
+
 class ResponderDo[R](Responder[R]):
     def __init__(
         self, do_function: DoFunction[R], ordered_call: Callable[..., tuple[tuple[str, Any], ...]]
@@ -62,3 +343,17 @@ class ResponderDo[R](Responder[R]):
 
     def response(self, *args, **kwargs) -> R:
         return self._do_function(*args, **kwargs)
+
+
+class ResponderSynchronised[R](Responder[R]):
+    """
+    Serialises access to a stateful responder, so that its sequencing is atomic when called from many threads.
+    """
+
+    def __init__(self, responder: Responder[R], lock: AbstractContextManager):
+        self._responder = responder
+        self._lock = lock
+
+    def response(self, *args, **kwargs) -> R:
+        with self._lock:
+            return self._responder.response(*args, **kwargs)
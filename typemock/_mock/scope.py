@@ -0,0 +1,84 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+_active_scopes: ContextVar[tuple["CallScope", ...]] = ContextVar(
+    "typemock_active_scopes", default=()
+)
+
+
+class CallScope:
+    """
+    A recording of the interactions with mocks made within a context, such as one task or one request handler.
+
+    Calls are still recorded in the shared log of each mock as well. Scopes are tracked with a ContextVar, so
+    tasks started within a scope, by asyncio or trio, record into it too.
+    """
+
+    def __init__(self, name: str | None = None) -> None:
+        self.name = name
+        self._calls: dict[Any, list[Any]] = {}
+        self._gets: dict[Any, int] = {}
+        self._sets: dict[Any, list[Any]] = {}
+
+    def record_call(self, member_state: Any, call: Any) -> None:
+        self._calls.setdefault(member_state, []).append(call)
+
+    def record_get(self, member_state: Any) -> None:
+        self._gets[member_state] = self._gets.get(member_state, 0) + 1
+
+    def record_set(self, member_state: Any, value: Any) -> None:
+        self._sets.setdefault(member_state, []).append(value)
+
+    def calls_for(self, member_state: Any) -> list[Any]:
+        return self._calls.get(member_state, [])
+
+    def gets_for(self, member_state: Any) -> int:
+        return self._gets.get(member_state, 0)
+
+    def sets_for(self, member_state: Any) -> list[Any]:
+        return self._sets.get(member_state, [])
+
+    def __repr__(self) -> str:
+        return "CallScope(name={})".format(self.name)
+
+
+# Bound directly, as this is read on every interaction with a mock.
+active_scopes = _active_scopes.get
+
+
+def _current_scope() -> CallScope | None:
+    """
+    The innermost recording scope of the current context, or None if there is none.
+    """
+    scopes = _active_scopes.get()
+    return scopes[-1] if scopes else None
+
+
+@contextmanager
+def _recording_scope(name: str | None = None) -> Generator[CallScope, None, None]:
+    """
+    Records the interactions with mocks made within the context into a new scope.
+
+    Scopes nest, and an interaction is recorded in every scope that is active when it happens.
+
+    Examples:
+
+        async def handle(request_id: int):
+            with recording_scope() as scope:
+                await client.fetch(request_id)
+            verify(client, scope=scope).fetch(request_id)
+
+    Args:
+        name: Optional name to identify the scope by.
+
+    Yields:
+        The new scope.
+    """
+    scope = CallScope(name)
+    token = _active_scopes.set(_active_scopes.get() + (scope,))
+    try:
+        yield scope
+    finally:
+        _active_scopes.reset(token)
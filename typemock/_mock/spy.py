@@ -0,0 +1,152 @@
+import inspect
+import threading
+import weakref
+from collections.abc import Callable
+from inspect import Parameter
+from types import FunctionType
+from typing import Any
+
+from typemock._mock import observe
+from typemock._mock.methods import MethodResponseBuilder, MockMethodState
+
+type SpyFactory = Callable[..., Callable]
+
+# Delegation factories are generated once per method of each spied class, and shared by all spies of the class, for
+# as long as the method exists.
+_factories: "weakref.WeakKeyDictionary[FunctionType, SpyFactory | None]" = (
+    weakref.WeakKeyDictionary()
+)
+_factories_lock = threading.Lock()
+
+_template = """
+def _tm_make(_tm_state, _tm_real, _tm_builder{defaults}):
+    _tm_lookup = _tm_state.spy_lookup
+    _tm_respond = _tm_state.{respond}
+    _tm_observed = _tm_state.{observed}
+
+    {async_}def {name}({parameters}):
+        if _tm_state._open:
+            return _tm_builder(_tm_state, {builder_args})
+        _tm_key = {key}
+        if _tm_observe.enabled:
+            return {await_}_tm_observed(_tm_key, lambda: _tm_real({real_args}))
+        _tm_responder = _tm_lookup(_tm_key)
+        if _tm_responder is None:
+            return {await_}_tm_real({real_args})
+        return {await_}_tm_respond(_tm_responder, _tm_key)
+
+    return {name}
+"""
+
+
+def _generate_factory(func: FunctionType) -> SpyFactory | None:
+    """
+    Generates a factory of delegating functions with the same parameters as the spied method.
+
+    Python binds the args of each call itself, so building the key of a call is a single tuple expression, rather
+    than a call to `Signature.bind`. Methods with var args are left to the generic delegation.
+    """
+    parameters = list(inspect.signature(func).parameters.values())
+    if not parameters or any(
+        p.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD) for p in parameters
+    ):
+        return None
+    self_parameter, parameters = parameters[0], parameters[1:]
+    if self_parameter.kind == Parameter.KEYWORD_ONLY:
+        return None
+    defaults: list[Any] = []
+    declared = [self_parameter.name]
+    positional_only = self_parameter.kind == Parameter.POSITIONAL_ONLY
+    keyword_only = False
+    for p in parameters:
+        if positional_only and p.kind != Parameter.POSITIONAL_ONLY:
+            declared.append("/")
+            positional_only = False
+        if p.kind == Parameter.KEYWORD_ONLY and not keyword_only:
+            declared.append("*")
+            keyword_only = True
+        if p.default is Parameter.empty:
+            declared.append(p.name)
+        else:
+            declared.append("{}=_tm_d{}".format(p.name, len(defaults)))
+            defaults.append(p.default)
+    if positional_only:
+        declared.append("/")
+    passed = [
+        p.name if p.kind != Parameter.KEYWORD_ONLY else "{0}={0}".format(p.name) for p in parameters
+    ]
+    key_items = "".join("({!r}, {}), ".format(p.name, p.name) for p in parameters)
+    is_async = inspect.iscoroutinefunction(func)
+    source = _template.format(
+        defaults="".join(", _tm_d{}".format(i) for i in range(len(defaults))),
+        respond="spy_respond_async" if is_async else "spy_respond",
+        observed="observed_spy_response_async" if is_async else "observed_spy_response",
+        async_="async " if is_async else "",
+        await_="await " if is_async else "",
+        name=func.__name__,
+        parameters=", ".join(declared),
+        builder_args=", ".join([self_parameter.name] + passed),
+        key="({})".format(key_items),
+        real_args=", ".join(passed),
+    )
+    namespace: dict[str, Any] = {"_tm_observe": observe}
+    exec(compile(source, "<typemock spy of {}>".format(func.__qualname__), "exec"), namespace)
+    make = namespace["_tm_make"]
+    return lambda state, real, builder: make(state, real, builder, *defaults)
+
+
+def _spy_factory(func: FunctionType) -> SpyFactory | None:
+    try:
+        return _factories[func]
+    except KeyError:
+        pass
+    with _factories_lock:
+        try:
+            return _factories[func]
+        except KeyError:
+            factory = _generate_factory(func)
+            _factories[func] = factory
+            return factory
+
+
+def _generic_spy(state: MockMethodState, real_method: Callable) -> Callable:
+    if inspect.iscoroutinefunction(state.func):
+
+        async def async_spy(*args, **kwargs):
+            if state.is_open():
+                return MethodResponseBuilder(state, *args, **kwargs)
+            key = state.canonical_call(*args, **kwargs)
+            if observe.enabled:
+                return await state.observed_spy_response_async(
+                    key, lambda: real_method(*args[1:], **kwargs)
+                )
+            responder = state.spy_lookup(key)
+            if responder is None:
+                return await real_method(*args[1:], **kwargs)
+            return await state.spy_respond_async(responder, key)
+
+        return async_spy
+
+    def sync_spy(*args, **kwargs):
+        if state.is_open():
+            return MethodResponseBuilder(state, *args, **kwargs)
+        key = state.canonical_call(*args, **kwargs)
+        if observe.enabled:
+            return state.observed_spy_response(key, lambda: real_method(*args[1:], **kwargs))
+        responder = state.spy_lookup(key)
+        if responder is None:
+            return real_method(*args[1:], **kwargs)
+        return state.spy_respond(responder, key)
+
+    return sync_spy
+
+
+def spy_method(state: MockMethodState, real_method: Callable) -> Callable:
+    """
+    Makes a function to bind to a spy, which records each call, and responds with the specified behaviour if there
+    is any, or delegates to the real method otherwise.
+    """
+    factory = _spy_factory(state.func)
+    if factory is None:
+        return _generic_spy(state, real_method)
+    return factory(state, real_method, MethodResponseBuilder)
@@ -0,0 +1,199 @@
+import threading
+from time import perf_counter_ns
+from typing import Any
+
+from typemock._mock.responders import Responder
+
+# Values below this are counted exactly, values above fall into log-linear buckets which keep the top
+# four significant bits. This bounds the relative error of any reported value to 12.5%.
+_EXACT_LIMIT = 16
+_SUB_BUCKETS = 8
+
+
+def _bucket_index(value: int) -> int:
+    if value < _EXACT_LIMIT:
+        return value
+    shift = value.bit_length() - 4
+    return _EXACT_LIMIT + (shift - 1) * _SUB_BUCKETS + ((value >> shift) - _SUB_BUCKETS)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _EXACT_LIMIT:
+        return index
+    shift = (index - _EXACT_LIMIT) // _SUB_BUCKETS + 1
+    significand = (index - _EXACT_LIMIT) % _SUB_BUCKETS + _SUB_BUCKETS
+    return ((significand + 1) << shift) - 1
+
+
+class Histogram:
+    """
+    HDR style histogram of non-negative integer values.
+
+    Recording is a couple of integer operations and a dict update, and the memory used only grows with the
+    number of distinct buckets hit, not with the number of values recorded.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.min: int | None = None
+        self.max: int | None = None
+        self._buckets: dict[int, int] = {}
+
+    def record(self, value: int) -> None:
+        value = max(value, 0)
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        index = _bucket_index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """
+        The value at the given percentile (0-100), reported as the upper bound of its bucket.
+        """
+        if self.count == 0:
+            return 0
+        target = max(1, round(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= target:
+                return min(_bucket_upper_bound(index), self.max or 0)
+        return self.max or 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"Histogram(count={self.count}, min={self.min}, max={self.max}, mean={self.mean:.1f})"
+        )
+
+
+class MemberStats:
+    """
+    Counters for how a mocked method or attribute has been used.
+
+    Latencies are the time spent inside the responder, in nanoseconds. For `then_do` behaviour this is the time
+    spent in the do function.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.returned = 0
+        self.raised = 0
+        self.misses = 0
+        self.latency_ns = Histogram()
+        self.return_sizes = Histogram()
+        self._first_call_ns: int | None = None
+        self._last_call_ns: int | None = None
+
+    def record_call(self, now_ns: int) -> None:
+        self.calls += 1
+        if self._first_call_ns is None:
+            self._first_call_ns = now_ns
+        self._last_call_ns = now_ns
+
+    def record_miss(self) -> None:
+        self.misses += 1
+
+    def record_return(self, elapsed_ns: int, result: Any) -> None:
+        self.returned += 1
+        self.latency_ns.record(elapsed_ns)
+        try:
+            self.return_sizes.record(len(result))
+        except TypeError:
+            pass
+
+    def record_raise(self, elapsed_ns: int) -> None:
+        self.raised += 1
+        self.latency_ns.record(elapsed_ns)
+
+    @property
+    def throughput(self) -> float:
+        """
+        Calls per second between the first and last call.
+        """
+        if self._first_call_ns is None or self._last_call_ns is None or self.calls < 2:
+            return 0.0
+        elapsed = self._last_call_ns - self._first_call_ns
+        if elapsed <= 0:
+            return 0.0
+        return (self.calls - 1) * 1e9 / elapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "returned": self.returned,
+            "raised": self.raised,
+            "misses": self.misses,
+            "throughput": self.throughput,
+            "latency_ns": self.latency_ns.as_dict(),
+            "return_sizes": self.return_sizes.as_dict(),
+        }
+
+    def __repr__(self) -> str:
+        return f"MemberStats(name={self.name}, calls={self.calls}, returned={self.returned}, raised={self.raised}, misses={self.misses})"
+
+
+class SynchronisedMemberStats(MemberStats):
+    """
+    MemberStats for mocks which are called from many threads.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self._lock = threading.Lock()
+
+    def record_call(self, now_ns: int) -> None:
+        with self._lock:
+            super().record_call(now_ns)
+
+    def record_miss(self) -> None:
+        with self._lock:
+            super().record_miss()
+
+    def record_return(self, elapsed_ns: int, result: Any) -> None:
+        with self._lock:
+            super().record_return(elapsed_ns, result)
+
+    def record_raise(self, elapsed_ns: int) -> None:
+        with self._lock:
+            super().record_raise(elapsed_ns)
+
+
+def new_member_stats(name: str, instrument: bool, thread_safe: bool) -> MemberStats | None:
+    if not instrument:
+        return None
+    return SynchronisedMemberStats(name) if thread_safe else MemberStats(name)
+
+
+def instrumented_response(
+    stats: MemberStats, responder: Responder, args: tuple, kwargs: dict[str, Any]
+) -> Any:
+    start = perf_counter_ns()
+    try:
+        r = responder.response(*args, **kwargs)
+    except BaseException:
+        stats.record_raise(perf_counter_ns() - start)
+        raise
+    stats.record_return(perf_counter_ns() - start, r)
+    return r
@@ -0,0 +1,251 @@
+import operator
+import threading
+from collections.abc import Callable, Iterable
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from typemock._mock.recording import ShardedCounter
+from typemock.match import Matcher
+
+type StubKey = tuple[tuple[str, Any], ...]
+
+V = TypeVar("V")
+
+
+class _MatcherIndex(Generic[V]):
+    """
+    The keys containing matchers, indexed by the values one of their args can match, where there are few of them, such
+    as a concrete value or a `one_of` matcher, so that a lookup only tests the keys which could match it.
+
+    Keys with no such arg are tested for every lookup. Candidates are tested newest first, so that where several keys
+    match, the one specified last wins.
+    """
+
+    def __init__(self, entries: tuple[tuple[StubKey, V], ...]) -> None:
+        self._entries = entries
+        self._scanned: list[int] = []
+        self._by_arg: dict[int, dict[Any, list[int]]] = {}
+        self._all_by_arg: dict[int, list[int]] = {}
+        for order, (key, _) in enumerate(entries):
+            indexed = _index_values(key)
+            if indexed is None:
+                self._scanned.append(order)
+                continue
+            position, values = indexed
+            by_value = self._by_arg.setdefault(position, {})
+            for value in values:
+                by_value.setdefault(value, []).append(order)
+            self._all_by_arg.setdefault(position, []).append(order)
+
+    def lookup(self, key: StubKey) -> V | None:
+        entries = self._entries
+        if not self._by_arg:
+            for stub_key, stub_value in reversed(entries):
+                if stub_key == key:
+                    return stub_value
+            return None
+        candidates = list(self._scanned)
+        for position, by_value in self._by_arg.items():
+            try:
+                found = by_value.get(key[position][1])
+            except TypeError:
+                found = self._all_by_arg[position]
+            except IndexError:
+                continue
+            if found:
+                candidates.extend(found)
+        candidates.sort(reverse=True)
+        for order in candidates:
+            stub_key, stub_value = entries[order]
+            if stub_key == key:
+                return stub_value
+        return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _index_values(key: StubKey) -> tuple[int, frozenset | tuple[Any]] | None:
+    """
+    The arg of a key with the fewest values it can match, and those values, or None if every arg can match values
+    which cannot be listed.
+    """
+    best: tuple[int, frozenset | tuple[Any]] | None = None
+    for position, (_, value) in enumerate(key):
+        values: frozenset | tuple[Any] | None
+        if isinstance(value, Matcher):
+            values = value.index_values()
+        else:
+            try:
+                hash(value)
+                values = (value,)
+            except TypeError:
+                values = None
+        if values is not None and (best is None or len(values) < len(best[1])):
+            best = position, values
+    return best
+
+
+class _StubSnapshot(NamedTuple, Generic[V]):
+    hashed: dict[StubKey, V]
+    unhashable: tuple[tuple[StubKey, V], ...]
+    matchers: _MatcherIndex[V]
+
+
+class StubTable(Generic[V]):
+    """
+    The specified behaviours of a mocked method, keyed by the ordered call args they respond to.
+
+    Behaviour is written during setup and read on every call. Writes go to mutable tables under a lock, and
+    readers look up against an immutable snapshot of them which is published on the first read after a write.
+    Once setup is done, lookups never take a lock, so many threads can call the same mock without contending.
+
+    Values are usually responders, but may be any per key setting, such as a delay.
+
+    Concrete keys are looked up by hash, falling back to an equality scan for keys with unhashable values.
+    Keys containing matchers are tested newest first, so the last one specified wins, but only those which could match,
+    going by the values the matchers and concrete args of each key can match.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hashed: dict[StubKey, V] = {}
+        self._unhashable: list[tuple[StubKey, V]] = []
+        self._matchers: list[tuple[StubKey, V]] = []
+        self._snapshot: _StubSnapshot[V] | None = None
+        # Hits are counted per entry, by the identity of its value, which the table keeps alive.
+        self._hits: dict[int, ShardedCounter] = {}
+        self._misses: dict[Any, int] = {}
+
+    def put(self, key: StubKey, value: V, has_matchers: bool) -> None:
+        self.put_all(((key, value, has_matchers),))
+
+    def put_all(self, entries: Iterable[tuple[StubKey, V, bool]]) -> None:
+        """
+        Puts many entries, each of key, value and whether the key has matchers, under one lock.
+        """
+        with self._lock:
+            for key, value, has_matchers in entries:
+                # The value may have the identity of one since replaced and gone, whose hits do not count.
+                self._hits.pop(id(value), None)
+                if has_matchers:
+                    replaced = replace_entry(self._matchers, key, value, same_key)
+                else:
+                    try:
+                        replaced = self._hashed.get(key)
+                        self._hashed[key] = value
+                    except TypeError:
+                        replaced = replace_entry(self._unhashable, key, value)
+                if replaced is not None and replaced is not value:
+                    self._hits.pop(id(replaced), None)
+            self._snapshot = None
+
+    def _publish(self) -> _StubSnapshot[V]:
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None:
+                snapshot = _StubSnapshot(
+                    dict(self._hashed),
+                    tuple(self._unhashable),
+                    _MatcherIndex(tuple(self._matchers)),
+                )
+                self._snapshot = snapshot
+            return snapshot
+
+    def lookup(self, key: StubKey) -> tuple[V, bool] | None:
+        """
+        Returns:
+            The value for the key, and whether it was found through a matcher. None if there is no behaviour.
+        """
+        snapshot = self._snapshot or self._publish()
+        try:
+            value = snapshot.hashed.get(key)
+        except TypeError:
+            value = None
+        if value is not None:
+            return value, False
+        for stub_key, stub_value in snapshot.unhashable:
+            if stub_key == key:
+                return stub_value, False
+        value = snapshot.matchers.lookup(key)
+        if value is not None:
+            return value, True
+        return None
+
+    def __len__(self) -> int:
+        snapshot = self._snapshot or self._publish()
+        return len(snapshot.hashed) + len(snapshot.unhashable) + len(snapshot.matchers)
+
+    def count_hit(self, value: V) -> None:
+        """
+        Counts a lookup which found the value.
+        """
+        counter = self._hits.get(id(value))
+        if counter is None:
+            with self._lock:
+                counter = self._hits.setdefault(id(value), ShardedCounter())
+        counter.increment()
+
+    def count_miss(self, key: StubKey) -> None:
+        """
+        Counts a lookup which found nothing.
+        """
+        misses = self._misses
+        with self._lock:
+            try:
+                misses[key] = misses.get(key, 0) + 1
+            except TypeError:
+                misses[repr(key)] = misses.get(repr(key), 0) + 1
+
+    def usage(self) -> tuple[list[tuple[StubKey, int]], list[tuple[Any, int]]]:
+        """
+        The number of hits counted for each key, and the number of misses counted for each key which was looked up
+        but not found. Unhashable missed keys are given by their repr.
+        """
+        with self._lock:
+            hits = self._hits
+            entries = list(self._hashed.items()) + list(self._unhashable) + list(self._matchers)
+            return (
+                [(key, _hit_count(hits.get(id(value)))) for key, value in entries],
+                list(self._misses.items()),
+            )
+
+
+def _hit_count(counter: ShardedCounter | None) -> int:
+    return 0 if counter is None else counter.value
+
+
+def same_key(existing: StubKey, key: StubKey) -> bool:
+    """
+    Whether two keys with matchers are the same, comparing matchers with each other rather than by what they match.
+    """
+    for (name, value), (other_name, other_value) in zip(existing, key):
+        if name != other_name:
+            return False
+        if isinstance(value, Matcher):
+            if not (isinstance(other_value, Matcher) and value.same_as(other_value)):
+                return False
+        elif isinstance(other_value, Matcher) or value != other_value:
+            return False
+    return len(existing) == len(key)
+
+
+def replace_entry(
+    entries: list[tuple[StubKey, V]],
+    key: StubKey,
+    value: V,
+    same: Callable[[StubKey, StubKey], bool] = operator.eq,
+) -> V | None:
+    """
+    Adds an entry, in place of the one with the same key, if any.
+
+    Returns:
+        The value of the entry replaced, or None.
+    """
+    replaced = None
+    for i, (existing, existing_value) in enumerate(entries):
+        if same(existing, key):
+            replaced = existing_value
+            del entries[i]
+            break
+    entries.append((key, value))
+    return replaced
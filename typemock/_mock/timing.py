@@ -0,0 +1,91 @@
+import asyncio
+import selectors
+import sys
+from collections.abc import Awaitable, Callable
+
+type DelaySource = float | Callable[[], float]
+
+
+class Delay:
+    """
+    How long an async mocked call takes to respond, either a fixed number of seconds or drawn from a distribution.
+    """
+
+    def __init__(self, source: DelaySource):
+        self._source = source
+
+    def seconds(self) -> float:
+        source = self._source
+        seconds = source() if callable(source) else source
+        return max(0.0, seconds)
+
+
+def sleep(seconds: float) -> Awaitable[None]:
+    """
+    Sleeps with the sleep of the async library which is running, trio if detected, otherwise asyncio.
+
+    Both honour a virtual clock, trio's `MockClock`, or asyncio with the `virtual_time_loop`. Trio can only be
+    running if it has been imported, so it is not imported here.
+    """
+    trio = sys.modules.get("trio")
+    if trio is not None:
+        try:
+            trio.lowlevel.current_trio_token()
+        except RuntimeError:
+            pass
+        else:
+            return trio.sleep(seconds)
+    return asyncio.sleep(seconds)
+
+
+class _VirtualClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+
+class _VirtualTimeSelector(selectors.DefaultSelector):
+    """
+    Selector which, rather than block waiting for the next timer, jumps the virtual clock forward to it.
+    """
+
+    def __init__(self, clock: _VirtualClock):
+        super().__init__()
+        self._clock = clock
+
+    def select(self, timeout: float | None = None):
+        events = super().select(0)
+        if events or timeout == 0:
+            return events
+        if timeout is None:
+            # Nothing is scheduled, so wait for real I/O.
+            return super().select(None)
+        self._clock.now += timeout
+        return []
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    An asyncio event loop with a virtual clock, which jumps forward whenever every task is waiting on a timer.
+
+    Sleeps, timeouts and simulated mock latencies take no wall time, but complete in the order they would in real
+    time.
+    """
+
+    def __init__(self) -> None:
+        self._clock = _VirtualClock()
+        super().__init__(selector=_VirtualTimeSelector(self._clock))
+
+    def time(self) -> float:
+        return self._clock.now
+
+
+def _virtual_time_loop() -> asyncio.AbstractEventLoop:
+    """
+    Makes an asyncio event loop with a virtual clock, for use as a loop factory.
+
+    Examples:
+
+        asyncio.run(main(), loop_factory=virtual_time_loop)
+
+    """
+    return VirtualTimeEventLoop()
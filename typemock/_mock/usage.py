@@ -0,0 +1,210 @@
+import json
+import threading
+import weakref
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from typing import Any
+
+from typemock._messages import limited_repr
+from typemock._mock import observe
+from typemock._mock.stubs import StubTable
+
+
+def describe_call(key: Any) -> str:
+    """
+    Renders the args of a stub or call, such as `key='a', timeout=10`, within the size limits of messages.
+    """
+    if isinstance(key, str):
+        return key
+    return ", ".join(
+        "{}={}".format(name, limited_repr(repr(value) if isinstance(value, str) else value))
+        for name, value in key
+    )
+
+
+class StubUsageReport:
+    """
+    The number of times each stub was hit, and the calls which had no stub, per mocked class and method, summed
+    over every mock of the class.
+    """
+
+    def __init__(self) -> None:
+        self._methods: dict[tuple[str, str], tuple[dict[str, int], dict[str, int]]] = {}
+
+    def add(
+        self,
+        mock: str,
+        method: str,
+        stubs: Iterable[tuple[str, int]],
+        misses: Iterable[tuple[str, int]],
+    ) -> None:
+        stub_hits, miss_counts = self._methods.setdefault((mock, method), ({}, {}))
+        for stub, hits in stubs:
+            stub_hits[stub] = stub_hits.get(stub, 0) + hits
+        for call, count in misses:
+            miss_counts[call] = miss_counts.get(call, 0) + count
+
+    def merge(self, other: "StubUsageReport") -> None:
+        for (mock, method), (stub_hits, miss_counts) in other._methods.items():
+            self.add(mock, method, stub_hits.items(), miss_counts.items())
+
+    def unused(self) -> list[tuple[str, str, str]]:
+        """
+        The stubs which were never hit, as (mock, method, stub args).
+        """
+        return [
+            (mock, method, stub)
+            for (mock, method), (stub_hits, _) in sorted(self._methods.items())
+            for stub, hits in stub_hits.items()
+            if hits == 0
+        ]
+
+    def hottest(self, limit: int = 10) -> list[tuple[str, str, str, int]]:
+        """
+        The most hit stubs, as (mock, method, stub args, hits).
+        """
+        hit = [
+            (mock, method, stub, hits)
+            for (mock, method), (stub_hits, _) in self._methods.items()
+            for stub, hits in stub_hits.items()
+            if hits > 0
+        ]
+        return sorted(hit, key=lambda entry: entry[3], reverse=True)[:limit]
+
+    def misses(self) -> list[tuple[str, str, str, int]]:
+        """
+        The calls which had no stub, most frequent first, as (mock, method, call args, count).
+        """
+        missed = [
+            (mock, method, call, count)
+            for (mock, method), (_, miss_counts) in self._methods.items()
+            for call, count in miss_counts.items()
+        ]
+        return sorted(missed, key=lambda entry: entry[3], reverse=True)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "methods": [
+                {"mock": mock, "method": method, "stubs": stub_hits, "misses": miss_counts}
+                for (mock, method), (stub_hits, miss_counts) in sorted(self._methods.items())
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StubUsageReport":
+        report = cls()
+        for entry in data["methods"]:
+            report.add(
+                entry["mock"], entry["method"], entry["stubs"].items(), entry["misses"].items()
+            )
+        return report
+
+    def dumps(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def format(self, hottest: int = 10) -> str:
+        """
+        The report as text, listing every unused stub and miss, and the hottest stubs.
+        """
+        lines = []
+        unused = self.unused()
+        lines.append("Unused stubs ({}):".format(len(unused)))
+        lines.extend("  {}.{}({})".format(*entry) for entry in unused)
+        lines.append("Hottest stubs:")
+        lines.extend("  {3:>10,}  {0}.{1}({2})".format(*entry) for entry in self.hottest(hottest))
+        misses = self.misses()
+        lines.append("Misses ({}):".format(len(misses)))
+        lines.extend("  {3:>10,}  {0}.{1}({2})".format(*entry) for entry in misses)
+        return "\n".join(lines)
+
+
+_report = StubUsageReport()
+_finalizers: list[weakref.finalize] = []
+_counting = 0
+_lock = threading.Lock()
+
+
+def _collect(mock: str, method: str, stubs: StubTable) -> None:
+    stub_hits, misses = stubs.usage()
+    with _lock:
+        _report.add(
+            mock,
+            method,
+            ((describe_call(key), hits) for key, hits in stub_hits),
+            ((describe_call(key), count) for key, count in misses),
+        )
+
+
+def track(method_state: Any) -> None:
+    """
+    Counts the hits of the stubs of a method, and its misses, into the report, once the mock is gone, or when the
+    report is collected.
+    """
+    finalizer = weakref.finalize(
+        method_state, _collect, method_state.owner, method_state.name, method_state._stubs
+    )
+    with _lock:
+        _finalizers.append(finalizer)
+        if len(_finalizers) % 1024 == 0:
+            # The finalizers of mocks which are gone have already collected their usage.
+            _finalizers[:] = [f for f in _finalizers if f.alive]
+
+
+def start() -> None:
+    """
+    Starts counting the stub usage of the mocks made from now on, until a matching `stop`.
+    """
+    global _counting
+    with _lock:
+        _counting += 1
+        observe.usage = True
+        observe.refresh()
+
+
+def stop() -> None:
+    global _counting
+    with _lock:
+        _counting -= 1
+        observe.usage = _counting > 0
+        observe.refresh()
+
+
+def collect() -> StubUsageReport:
+    """
+    Counts the stub usage of every tracked mock into the report, and returns it, leaving a new report to count into.
+    """
+    global _report, _finalizers
+    with _lock:
+        finalizers, _finalizers = _finalizers, []
+    for finalizer in finalizers:
+        finalizer()
+    with _lock:
+        report, _report = _report, StubUsageReport()
+    return report
+
+
+@contextmanager
+def _stub_usage() -> Generator[StubUsageReport, None, None]:
+    """
+    Counts how many times each stub of the mocks made within the context is hit, and the calls with no stub.
+
+    On exit, the usage counted for every mock made since it was last collected is reported. This takes the usage
+    from any other count going on, such as that of the pytest plugin, so the two are best not used together.
+
+    Examples:
+
+        with stub_usage() as usage:
+            run_tests()
+
+        print(usage.format())
+
+    Yields:
+        The report, which is filled in on exit.
+    """
+    report = StubUsageReport()
+    start()
+    try:
+        yield report
+    finally:
+        stop()
+        report.merge(collect())
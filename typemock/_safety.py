@@ -1,6 +1,7 @@
 import inspect
 from typing import TypeVar
 
+from typemock._hints import hints_of
 from typemock._utils import Blank, attributes, methods, try_instantiate_class
 from typemock.api import MemberType, MissingHint, MissingTypeHintsError, TypeSafety
 
@@ -10,12 +11,13 @@ T = TypeVar("T")
 def _validate_method_annotations(
     clazz: type[T], type_safety: TypeSafety, missing: list[MissingHint]
 ) -> None:
+    class_hints = hints_of(clazz)
     for func_entry in methods(clazz):
         func = func_entry.func
         name = func_entry.name
         sig = inspect.signature(func_entry.func)
         if len(sig.parameters) > 0:
-            annotations = func.__annotations__
+            annotations = class_hints.method(func)
             for param_name in sig.parameters:
                 if param_name == "self":
                     continue
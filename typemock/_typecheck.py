@@ -0,0 +1,114 @@
+import types
+import typing
+from collections.abc import Callable
+from typing import Any, Literal, Union, get_args, get_origin
+
+from typemock._hints import unalias
+from typemock._utils import is_type
+from typemock.api import TypeCheckBackend
+
+type Checker = Callable[[Any], bool]
+
+_NoneType = type(None)
+
+# The types typeguard accepts in place of a hinted type, following the numeric tower and bytes shorthands of PEP 484.
+_promotions: dict[type, tuple[type, ...]] = {
+    float: (float, int),
+    complex: (complex, float, int),
+    bytes: (bytes, bytearray, memoryview),
+}
+
+
+def _anything(value: Any) -> bool:
+    return True
+
+
+def _is_none(value: Any) -> bool:
+    return value is None
+
+
+def typeguard_checker(hint: Any) -> Checker:
+    """
+    Checks values against the hint with typeguard.
+    """
+
+    def check(value: Any) -> bool:
+        return is_type(value, hint)
+
+    return check
+
+
+def _plain_classes(hint: Any) -> tuple[type, ...] | None:
+    """
+    The classes to check a hint with `isinstance`, if it is a plain class, or None.
+    """
+    hint = unalias(hint)
+    if hint is None or hint is _NoneType:
+        return (_NoneType,)
+    if not isinstance(hint, type) or isinstance(hint, types.GenericAlias):
+        return None
+    if getattr(hint, "_is_protocol", False) or typing.is_typeddict(hint):
+        return None
+    return _promotions.get(hint, (hint,))
+
+
+def compiled_checker(hint: Any) -> Checker:
+    """
+    Compiles a hint into a checker, with fast paths for the most common shapes of hint:
+
+    - `Any` and `object` accept everything.
+    - Plain classes are checked with `isinstance`.
+    - Unions of plain classes, including optionals, are checked with one `isinstance` of a tuple.
+    - Literals are checked by membership of a set.
+
+    Any other hint, such as a parameterised generic or a protocol, is checked with typeguard. Aliases made with the
+    `type` statement are checked as the hints they alias.
+    """
+    hint = unalias(hint)
+    if hint is Any or hint is object:
+        return _anything
+    if hint is None or hint is _NoneType:
+        return _is_none
+    classes = _plain_classes(hint)
+    if classes is not None:
+        return lambda value: isinstance(value, classes)
+    origin = get_origin(hint)
+    if origin is Union or origin is types.UnionType:
+        union_classes: list[type] = []
+        for member in get_args(hint):
+            if member is Any or member is object:
+                return _anything
+            member_classes = _plain_classes(member)
+            if member_classes is None:
+                return typeguard_checker(hint)
+            union_classes.extend(member_classes)
+        all_classes = tuple(union_classes)
+        return lambda value: isinstance(value, all_classes)
+    if origin is Literal:
+        try:
+            literals = frozenset((type(arg), arg) for arg in get_args(hint))
+        except TypeError:
+            return typeguard_checker(hint)
+
+        def check_literal(value: Any) -> bool:
+            try:
+                return (type(value), value) in literals
+            except TypeError:
+                return False
+
+        return check_literal
+    return typeguard_checker(hint)
+
+
+_backends: dict[TypeCheckBackend, Callable[[Any], Checker]] = {
+    TypeCheckBackend.TYPEGUARD: typeguard_checker,
+    TypeCheckBackend.COMPILED: compiled_checker,
+    TypeCheckBackend.NONE: lambda hint: _anything,
+}
+
+
+def checker_for(hint: Any, backend: TypeCheckBackend) -> Checker:
+    """
+    Compiles a checker of values against the hint, with the given backend.
+    """
+    return _backends[backend](hint)
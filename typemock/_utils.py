@@ -1,5 +1,6 @@
 import inspect
 import logging
+import sys
 import types
 import typing
 from types import FunctionType
@@ -7,6 +8,8 @@ from typing import Any, TypeVar
 
 from typeguard import TypeCheckError, check_type
 
+from typemock._hints import hints_of
+
 T = TypeVar("T")
 K = TypeVar("K")
 V = TypeVar("V")
@@ -16,6 +19,14 @@ class Blank:
     pass
 
 
+def gil_enabled() -> bool:
+    """
+    False when running on a free-threaded build of CPython with the GIL disabled.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
 def typemock_logger():
     return logging.getLogger("typemock")
 
@@ -141,8 +152,9 @@ def _type_hint_for_attribute_from_value(current_hint, value) -> Any:
 
 def attributes(cls: type, instance: Any = None) -> list[AttributeEntry]:
     entries: dict[str, AttributeEntry] = {}
-    annotations = getattr(cls, "__annotations__", {})
-    init_signature = inspect.getfullargspec(cls.__init__)
+    class_hints = hints_of(cls)
+    annotations = class_hints.attributes
+    init_annotations = class_hints.init
     class_attributes = getmembers(cls, lambda a: not (inspect.isroutine(a)))
     class_attributes = [
         a for a in class_attributes if not _is_magic(a[0]) and not _is_private(a[0])
@@ -150,7 +162,7 @@ def attributes(cls: type, instance: Any = None) -> list[AttributeEntry]:
     for attribute in class_attributes:
         name = attribute[0]
         value = attribute[1]
-        type_hint = annotations.get(name, init_signature.annotations.get(name, Blank))
+        type_hint = annotations.get(name, init_annotations.get(name, Blank))
         if type_hint is Blank:
             type_hint = _type_hint_for_attribute_from_value(type_hint, value)
         entries[name] = AttributeEntry(name=name, initial_value=value, type_hint=type_hint)
@@ -164,7 +176,7 @@ def attributes(cls: type, instance: Any = None) -> list[AttributeEntry]:
         if name in entries:
             pass
         else:
-            type_hint = init_signature.annotations.get(attribute[0], Blank)
+            type_hint = init_annotations.get(attribute[0], Blank)
             if type_hint is Blank:
                 type_hint = _type_hint_for_attribute_from_value(type_hint, value)
             entries[name] = AttributeEntry(name=name, initial_value=value, type_hint=type_hint)
@@ -1,8 +1,9 @@
-from typing import Callable, Generic, TypeVar, cast
+from typing import Generic, TypeVar, cast
 
+from typemock._messages import Deferred, limited_repr
 from typemock._mock import MockObject
 from typemock._mock.methods import MockMethodState
-from typemock._utils import bind
+from typemock._mock.scope import CallScope
 from typemock.api import VerifyError
 
 T = TypeVar("T")
@@ -15,10 +16,9 @@ No interactions with method '{method_name}' for arguments:
 
 {count} other interaction(s):
 
-[
-    {first_other}
-...
-]
+Nearest:
+
+{nearest}
 
 """
 
@@ -42,10 +42,9 @@ But there were {actual_interactions} interactions.
 
 And {other_count} other interaction(s):
 
-[
-    {first_other}
-...
-]
+Nearest:
+
+{nearest}
 
 """
 
@@ -65,10 +64,9 @@ No sets for attribute '{attribute_name}' with {expected_args}.
 
 {count} other interaction(s):
 
-[
-    {first_other}
-...
-]
+Nearest:
+
+{nearest}
 
 """
 
@@ -88,10 +86,9 @@ But there were {actual_interactions} `sets`.
 
 And {other_count} other `sets`(s):
 
-[
-    {first_other}
-...
-]
+Nearest:
+
+{nearest}
 
 """
 
@@ -106,76 +103,97 @@ No other `sets`.
 """
 
 
-def _verify_method(method_state: MockMethodState, exactly: int) -> Callable:
-    def method_mock(*args, **kwargs):
-        call_count = method_state.call_count_for(*args, **kwargs)
+class _MethodVerifier:
+    """
+    Verifies the calls to one method of a mock, when called with the expected args.
+    """
+
+    def __init__(self, method_state: MockMethodState, exactly: int, scope: CallScope | None):
+        self._method_state = method_state
+        self._exactly = exactly
+        self._scope = scope
+
+    def __call__(self, *args, **kwargs) -> None:
+        method_state = self._method_state
+        exactly = self._exactly
+        call_count = method_state.call_count_in(
+            method_state.recorded_calls(self._scope), None, *args, **kwargs
+        )
         if exactly == -1:
             if call_count.count < 1:
-                if len(call_count.other_calls) > 0:
+                if call_count.other_count > 0:
                     raise VerifyError(
-                        _error_no_interactions_with_others.format(
-                            method_name=method_state.name,
-                            expected_args=call_count.call,
-                            count=len(call_count.other_calls),
-                            first_other=call_count.other_calls[0],
-                        )
+                        _error_no_interactions_with_others,
+                        method_name=method_state.name,
+                        expected_args=call_count.call,
+                        count=call_count.other_count,
+                        nearest=Deferred(call_count.nearest_others),
                     )
                 else:
                     raise VerifyError(
-                        _error_no_interactions.format(
-                            method_name=method_state.name, expected_args=call_count.call
-                        )
+                        _error_no_interactions,
+                        method_name=method_state.name,
+                        expected_args=call_count.call,
                     )
         else:
             if call_count.count != exactly:
-                if len(call_count.other_calls) > 0:
+                if call_count.other_count > 0:
                     raise VerifyError(
-                        _error_incorrect_amount_of_interactions_others.format(
-                            method_name=method_state.name,
-                            expected_args=call_count.call,
-                            other_count=len(call_count.other_calls),
-                            first_other=call_count.other_calls[0],
-                            expected_count=exactly,
-                            actual_interactions=call_count.count,
-                        )
+                        _error_incorrect_amount_of_interactions_others,
+                        method_name=method_state.name,
+                        expected_args=call_count.call,
+                        other_count=call_count.other_count,
+                        nearest=Deferred(call_count.nearest_others),
+                        expected_count=exactly,
+                        actual_interactions=call_count.count,
                     )
                 else:
                     raise VerifyError(
-                        _error_incorrect_amount_of_interactions.format(
-                            method_name=method_state.name,
-                            expected_count=exactly,
-                            actual_interactions=call_count.count,
-                            expected_args=call_count.call,
-                        )
+                        _error_incorrect_amount_of_interactions,
+                        method_name=method_state.name,
+                        expected_count=exactly,
+                        actual_interactions=call_count.count,
+                        expected_args=call_count.call,
                     )
-
-    return method_mock
+        if self._scope is None:
+            method_state.mark_verified(call_count.call)
 
 
 class _VerifyObject(Generic[T]):
     _tmock_initialised = False
 
-    def __init__(self, mock: MockObject[T], exactly: int):
+    def __init__(self, mock: MockObject[T], exactly: int, scope: CallScope | None = None):
         self._mock = mock
         self._exactly = exactly
-        for method_state in mock._mock_method_states:
-            verify_method = _verify_method(method_state, exactly)
-            bind(self, verify_method, method_state.name)
+        self._scope = scope
+        self._method_verifiers: dict[str, _MethodVerifier] = {}
         self._tmock_initialised = True
 
     def __getattribute__(self, item: str):
         if object.__getattribute__(self, "_tmock_initialised"):
+            method_verifiers = object.__getattribute__(self, "_method_verifiers")
+            method_verifier = method_verifiers.get(item)
+            if method_verifier is not None:
+                return method_verifier
             mock = object.__getattribute__(self, "_mock")
             exactly = object.__getattribute__(self, "_exactly")
+            method_state = mock._mock_method_states_by_name.get(item)
+            if method_state is not None:
+                method_verifier = _MethodVerifier(
+                    method_state, exactly, object.__getattribute__(self, "_scope")
+                )
+                method_verifiers[item] = method_verifier
+                return method_verifier
             if item in mock._mock_attribute_states:
                 state = mock._mock_attribute_states[item]
-                get_calls = state.call_count_gets()
+                scope = object.__getattribute__(self, "_scope")
+                get_calls = state.call_count_gets(scope)
                 if exactly == -1:
                     if get_calls < 1:
-                        raise VerifyError(
-                            "\nThere were no gets of attribute: {}\n".format(state.name)
-                        )
+                        raise VerifyError("\nThere were no gets of attribute: {}\n", state.name)
                     else:
+                        if scope is None:
+                            state.mark_gets_verified()
                         return
                 else:
                     if get_calls != exactly:
@@ -193,6 +211,8 @@ class _VerifyObject(Generic[T]):
                             )
                         raise VerifyError(message)
                     else:
+                        if scope is None:
+                            state.mark_gets_verified()
                         return
         return object.__getattribute__(self, item)
 
@@ -202,51 +222,141 @@ class _VerifyObject(Generic[T]):
             exactly = self._exactly
             if key in mock._mock_attribute_states:
                 state = mock._mock_attribute_states[key]
-                called_set_record = state.called_set_record(item)
+                called_set_record = state.called_set_record(item, self._scope)
                 if exactly == -1:
                     if called_set_record.count < 1:
-                        if len(called_set_record.other_calls) > 0:
+                        if called_set_record.other_count > 0:
                             raise VerifyError(
-                                _error_no_sets_others.format(
-                                    attribute_name=state.name,
-                                    expected_args=called_set_record.call,
-                                    count=len(called_set_record.other_calls),
-                                    first_other=called_set_record.other_calls[0],
-                                )
+                                _error_no_sets_others,
+                                attribute_name=state.name,
+                                expected_args=called_set_record.call,
+                                count=called_set_record.other_count,
+                                nearest=Deferred(called_set_record.nearest_others),
                             )
                         else:
                             raise VerifyError(
-                                _error_no_sets.format(
-                                    attribute_name=state.name, expected_args=called_set_record.call
-                                )
+                                _error_no_sets,
+                                attribute_name=state.name,
+                                expected_args=called_set_record.call,
                             )
-
-                    else:
-                        return
                 else:
                     if called_set_record.count != exactly:
-                        if len(called_set_record.other_calls) > 0:
+                        if called_set_record.other_count > 0:
                             raise VerifyError(
-                                _error_incorrect_sets_others.format(
-                                    attribute_name=state.name,
-                                    expected_args=called_set_record.call,
-                                    expected_count=exactly,
-                                    other_count=len(called_set_record.other_calls),
-                                    first_other=called_set_record.other_calls[0],
-                                    actual_interactions=called_set_record.count,
-                                )
+                                _error_incorrect_sets_others,
+                                attribute_name=state.name,
+                                expected_args=called_set_record.call,
+                                expected_count=exactly,
+                                other_count=called_set_record.other_count,
+                                nearest=Deferred(called_set_record.nearest_others),
+                                actual_interactions=called_set_record.count,
                             )
                         else:
                             raise VerifyError(
-                                _error_no_sets.format(
-                                    attribute_name=state.name, expected_args=called_set_record.call
-                                )
+                                _error_no_sets,
+                                attribute_name=state.name,
+                                expected_args=called_set_record.call,
                             )
-                    else:
-                        return
+                if self._scope is None:
+                    state.mark_set_verified(called_set_record.call)
         else:
             object.__setattr__(self, key, item)
 
 
-def _verify(mock: T, exactly: int = -1) -> T:
-    return cast(T, _VerifyObject(cast(MockObject[T], mock), exactly=exactly))
+def _verify(mock: T, exactly: int = -1, scope: CallScope | None = None) -> T:
+    mock_object = cast(MockObject[T], mock)
+    if scope is not None:
+        return cast(T, _VerifyObject(mock_object, exactly=exactly, scope=scope))
+    # Verify objects build their members lazily and hold no per call state, so are reused for each mock.
+    verify_object = mock_object._verify_objects.get(exactly)
+    if verify_object is None:
+        verify_object = _VerifyObject(mock_object, exactly=exactly)
+        mock_object._verify_objects[exactly] = verify_object
+    return cast(T, verify_object)
+
+
+_error_more_interactions = """
+
+{count} unverified interaction(s) with mock of {mocked_thing}:
+
+{interactions}
+
+"""
+
+_error_any_interactions = """
+
+Expected no interactions with mock of {mocked_thing}, but there were:
+
+{interactions}
+
+"""
+
+
+def _unverified_interactions(mock_object: MockObject) -> list[str]:
+    interactions = []
+    for method_state in mock_object._mock_method_states:
+        for call, count in method_state.unverified_calls():
+            interactions.append(
+                "{} x method '{}' with args: {}".format(
+                    count, method_state.name, limited_repr(call)
+                )
+            )
+    for attribute_state in mock_object._mock_attribute_states.values():
+        gets = attribute_state.unverified_gets()
+        if gets > 0:
+            interactions.append("{} x get of attribute '{}'".format(gets, attribute_state.name))
+        for value, count in attribute_state.unverified_sets():
+            interactions.append(
+                "{} x set of attribute '{}' with: {}".format(
+                    count, attribute_state.name, limited_repr(value)
+                )
+            )
+    return interactions
+
+
+def _verify_no_more_interactions(mock: object) -> None:
+    """
+    Verifies that every interaction with the mock has been verified by an earlier `verify`.
+
+    Scoped verifications only cover the interactions of their scope, so do not count towards this.
+
+    Raises:
+        VerifyError: Listing each distinct interaction which was not verified.
+    """
+    mock_object = cast(MockObject, mock)
+    interactions = _unverified_interactions(mock_object)
+    if interactions:
+        raise VerifyError(
+            _error_more_interactions,
+            count=len(interactions),
+            mocked_thing=mock_object._mocked_class.__name__,
+            interactions="\n".join("    " + interaction for interaction in interactions),
+        )
+
+
+def _verify_zero_interactions(mock: object) -> None:
+    """
+    Verifies that there were no interactions with the mock at all, whether verified or not.
+
+    Raises:
+        VerifyError: Listing the members which were interacted with.
+    """
+    mock_object = cast(MockObject, mock)
+    interactions = []
+    for method_state in mock_object._mock_method_states:
+        count = len(method_state.recorded_calls())
+        if count > 0:
+            interactions.append("{} x method '{}'".format(count, method_state.name))
+    for attribute_state in mock_object._mock_attribute_states.values():
+        gets = attribute_state.call_count_gets()
+        if gets > 0:
+            interactions.append("{} x get of attribute '{}'".format(gets, attribute_state.name))
+        sets = len(attribute_state.recorded_sets())
+        if sets > 0:
+            interactions.append("{} x set of attribute '{}'".format(sets, attribute_state.name))
+    if interactions:
+        raise VerifyError(
+            _error_any_interactions,
+            mocked_thing=mock_object._mocked_class.__name__,
+            interactions="\n".join("    " + interaction for interaction in interactions),
+        )
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncIterable, Callable, Iterable, Sequence
 from enum import Enum
 from types import CoroutineType
 from typing import Any, TypeVar, overload
 
+from typemock._messages import render_message
+
 T = TypeVar("T")
 R = TypeVar("R")
 
@@ -54,6 +56,126 @@ class ResponseBuilder[R](ABC):
 
         """
 
+    @abstractmethod
+    def then_yield_from(
+        self, source: Iterable[R] | Callable[[], Iterable[R]], loop: bool = False
+    ) -> None:
+        """
+        Sets the behaviour of the mock to pull the response for each successive call lazily from an iterable.
+
+        Responses are type checked as they are served, rather than up front.
+
+        Args:
+            source:
+
+                An iterable, such as a generator, or a factory which makes one.
+
+            loop:
+
+                If False, an error will be raised when the responses are exhausted. If True, responses will start
+                from the first response again, from a new iterator made from the source. To loop over an iterator,
+                which can only be iterated once, such as a generator, give a factory which makes it.
+
+        """
+
+    @abstractmethod
+    def then_choose(
+        self,
+        outcomes: Sequence[tuple[float, Any]],
+        seed: int | str | bytes | None = None,
+        faults: Sequence[Any] = (),
+    ) -> None:
+        """
+        Sets the behaviour of the mock to choose the outcome of each call at random, by weight, to inject faults.
+
+        The choices are made with a random number generator seeded with `seed`, so a scenario which fails can be
+        replayed exactly, given the same sequence of calls.
+
+        Args:
+            outcomes:
+
+                Pairs of weight and outcome. An outcome is a value to return, or one of `outcome.returns`,
+                `outcome.raises` and, for async methods, `outcome.delayed`.
+
+            seed:
+
+                Seeds the random choices. If None, they are seeded from the system.
+
+            faults:
+
+                `outcome.Fault` schedules, which take precedence over the weighted outcomes for the calls they are
+                active for, such as failing 5% of calls after call 1000, or a burst of errors every 10k calls.
+
+        Examples:
+
+            when(my_mock.fetch(match.anything())).then_choose(
+                [(0.95, "result"), (0.05, outcome.raises(TimeoutError))],
+                seed=42,
+                faults=[outcome.Fault(outcome.raises(ConnectionError), every=10_000, length=20)],
+            )
+
+        """
+
+    @abstractmethod
+    def then_stream(
+        self,
+        source: Iterable[Any]
+        | AsyncIterable[Any]
+        | Callable[[], Iterable[Any] | AsyncIterable[Any]],
+        chunk_delay: float | Callable[[], float] | None = None,
+    ) -> None:
+        """
+        Sets the behaviour of a method which returns an iterator, such as a generator or async generator method, to
+        return a new stream of the items of the source for each call.
+
+        Items are pulled from the source lazily, and type checked against the item type of the method's return hint
+        as they are yielded, so a whole result need never be built.
+
+        Args:
+            source:
+
+                An iterable, an async iterable for async generator methods, or a factory which makes one for each
+                call. An iterator, such as a generator, can only be streamed once, by the first call.
+
+            chunk_delay:
+
+                For async generator methods, the seconds to wait before yielding each item, or a function which
+                draws the seconds for each item.
+
+        Examples:
+
+            when(my_mock.rows("table")).then_stream([row_1, row_2])
+
+            for row in my_mock.rows("table"):
+                ...
+
+        """
+
+    @abstractmethod
+    def then_delay(self, delay: float | Callable[[], float]) -> "ResponseBuilder[R]":
+        """
+        Sets the mock to take time to respond, for async methods. The response, or error, is given after the delay.
+
+        Delays are slept with the running async library, trio or asyncio, so they take virtual time rather than
+        wall time when run with a virtual clock, such as `trio.testing.MockClock(autojump_threshold=0)` or
+        `virtual_time_loop`.
+
+        Args:
+            delay:
+
+                Seconds, or a function which draws the seconds for each call, from a distribution.
+
+        Returns:
+
+            This builder, to specify the response with.
+
+        Examples:
+
+            when(await my_mock.fetch(1)).then_delay(0.2).then_return("result")
+            when(await my_mock.fetch(2)).then_delay(lambda: random.expovariate(5)).then_return("result")
+
+        """
+
     @abstractmethod
     def then_do(self, do_function: DoFunction) -> None:
         """
@@ -81,6 +203,21 @@ class TypeSafety(Enum):
     RELAXED = 3  # Enforce type safety where there are type hints.
 
 
+class TypeCheckBackend(Enum):
+    TYPEGUARD = 1  # Check every hint with typeguard.
+    COMPILED = (
+        2  # Compile each hint once, with fast paths for simple hints, and typeguard for the rest.
+    )
+    NONE = 3  # Do not check values against their hints.
+
+
+class CapturePolicy(Enum):
+    REF = 1  # Record references to the call args, as they were passed.
+    SHALLOW_COPY = 2  # Record a shallow copy of each arg, taken at call time.
+    DEEP_COPY = 3  # Record a deep copy of each arg, taken at call time.
+    DIGEST = 4  # Record the size and a content hash of str and bytes-like args, and references to the rest.
+
+
 class MemberType:
     ARG: str = "arg"
     ATTRIBUTE: str = "attribute"
@@ -111,7 +248,50 @@ class MissingTypeHintsError(Exception):
     pass
 
 
-class MockTypeSafetyError(Exception):
+class _LazyMessageError(Exception):
+    """
+    An error which keeps the values for its message, and only renders it, within size limits, when it is shown.
+
+    Args:
+        template: The message, with `str.format` placeholders for the values if there are any.
+        values: Values for positional placeholders.
+        named_values: Values for named placeholders.
+    """
+
+    def __init__(self, template: str = "", *values: Any, **named_values: Any):
+        super().__init__(template)
+        self.template = template
+        self.values = values
+        self.named_values = named_values
+
+    # Args set on the error after it was made, which replace the rendered message.
+    _set_args: tuple[Any, ...] | None = None
+
+    def __str__(self) -> str:
+        if self._set_args is not None:
+            return super().__str__()
+        return render_message(self.template, self.values, self.named_values)
+
+    def __repr__(self) -> str:
+        return "{}({})".format(type(self).__name__, ", ".join(repr(arg) for arg in self.args))
+
+    @property
+    def args(self) -> tuple[Any, ...]:  # type: ignore[override]
+        if self._set_args is not None:
+            return self._set_args
+        return (str(self),)
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        BaseException.args.__set__(self, value)
+        self._set_args = tuple(value)
+
+    def __reduce__(self):
+        # Values may not be picklable, so the message is rendered when sent to another process.
+        return self.__class__, (str(self),)
+
+
+class MockTypeSafetyError(_LazyMessageError):
     pass
 
 
@@ -119,7 +299,7 @@ class NoBehaviourSpecifiedError(Exception):
     pass
 
 
-class VerifyError(Exception):
+class VerifyError(_LazyMessageError):
     pass
 
 
@@ -0,0 +1,250 @@
+from collections.abc import Generator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from typemock.api import CapturePolicy, MockingError, TypeCheckBackend, TypeSafety
+
+__all__ = ["PROFILES", "MemberConfig", "MockConfig"]
+
+
+def _first(*settings: Any) -> Any:
+    for setting in settings:
+        if setting is not None:
+            return setting
+    return None
+
+
+class MemberConfig:
+    """
+    How calls to one member of a mock, a method or an attribute, are checked and recorded.
+
+    Settings left as None are taken from the config of the mock.
+
+    Args:
+        type_check: How args and returns are checked against their type hints. `TypeCheckBackend.NONE` skips checks.
+        capture: How the args of each call are recorded for verification.
+        thread_safe: If True, the member can be called concurrently from many threads.
+        instrument: If True, usage counters and latency histograms are kept.
+    """
+
+    def __init__(
+        self,
+        type_check: TypeCheckBackend | None = None,
+        capture: CapturePolicy | None = None,
+        thread_safe: bool | None = None,
+        instrument: bool | None = None,
+    ) -> None:
+        self.type_check = type_check
+        self.capture = capture
+        self.thread_safe = thread_safe
+        self.instrument = instrument
+
+    def over(self, base: "MemberConfig | MockConfig") -> "MemberConfig":
+        """
+        This config, with the settings it leaves as None taken from the base.
+        """
+        return MemberConfig(
+            type_check=_first(self.type_check, base.type_check),
+            capture=_first(self.capture, base.capture),
+            thread_safe=_first(self.thread_safe, base.thread_safe),
+            instrument=_first(self.instrument, base.instrument),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MemberConfig):
+            return NotImplemented
+        return vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return "MemberConfig(type_check={}, capture={}, thread_safe={}, instrument={})".format(
+            self.type_check, self.capture, self.thread_safe, self.instrument
+        )
+
+
+class MockConfig:
+    """
+    How a mock is checked and recorded, with overrides for individual members.
+
+    Settings left as None are taken from the default config in effect when the mock is made. Named profiles of
+    settings are kept in `PROFILES`.
+
+    Examples:
+
+        # Strict checks on save, but none on the hot get.
+        config = MockConfig(
+            type_check=TypeCheckBackend.TYPEGUARD,
+            members={"get": MemberConfig(type_check=TypeCheckBackend.NONE)},
+        )
+        repository = tmock(Repository, config=config)
+
+    Args:
+        type_safety: Which type hints the mocked class must have.
+        type_check:
+        capture:
+        thread_safe:
+        instrument:
+
+            As for `MemberConfig`, for every member which does not override them.
+
+        members: Overrides for individual methods and attributes, by name.
+    """
+
+    def __init__(
+        self,
+        type_safety: TypeSafety | None = None,
+        type_check: TypeCheckBackend | None = None,
+        capture: CapturePolicy | None = None,
+        thread_safe: bool | None = None,
+        instrument: bool | None = None,
+        members: Mapping[str, MemberConfig] | None = None,
+    ) -> None:
+        self.type_safety = type_safety
+        self.type_check = type_check
+        self.capture = capture
+        self.thread_safe = thread_safe
+        self.instrument = instrument
+        self.members: dict[str, MemberConfig] = dict(members or {})
+
+    def over(self, base: "MockConfig") -> "MockConfig":
+        """
+        This config, with the settings it leaves as None, and the members it does not override, taken from the base.
+        """
+        members = dict(base.members)
+        for name, member in self.members.items():
+            members[name] = member.over(members[name]) if name in members else member
+        return MockConfig(
+            type_safety=_first(self.type_safety, base.type_safety),
+            type_check=_first(self.type_check, base.type_check),
+            capture=_first(self.capture, base.capture),
+            thread_safe=_first(self.thread_safe, base.thread_safe),
+            instrument=_first(self.instrument, base.instrument),
+            members=members,
+        )
+
+    def member(self, name: str) -> MemberConfig:
+        """
+        The config of a member, with its overrides applied.
+        """
+        override = self.members.get(name)
+        if override is None:
+            return MemberConfig().over(self)
+        return override.over(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MockConfig):
+            return NotImplemented
+        return vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return (
+            "MockConfig(type_safety={}, type_check={}, capture={}, thread_safe={}, instrument={}, "
+            "members={})".format(
+                self.type_safety,
+                self.type_check,
+                self.capture,
+                self.thread_safe,
+                self.instrument,
+                self.members,
+            )
+        )
+
+
+# The settings of a mock when nothing else is configured. Thread safety is left to be decided by whether the GIL is
+# enabled.
+_BUILT_IN = MockConfig(
+    type_safety=TypeSafety.STRICT,
+    type_check=TypeCheckBackend.COMPILED,
+    capture=CapturePolicy.REF,
+    instrument=False,
+)
+
+PROFILES: dict[str, MockConfig] = {
+    # Every member must be hinted, and every hint is checked by typeguard.
+    "strict": MockConfig(
+        type_safety=TypeSafety.STRICT,
+        type_check=TypeCheckBackend.TYPEGUARD,
+    ),
+    # No type checks, and args recorded by reference, for the least overhead per call.
+    "fast": MockConfig(
+        type_safety=TypeSafety.RELAXED,
+        type_check=TypeCheckBackend.NONE,
+        capture=CapturePolicy.REF,
+        instrument=False,
+    ),
+    # Safe to call from many threads, with usage statistics, and str and bytes args recorded as digests to bound memory.
+    "load-test": MockConfig(
+        type_check=TypeCheckBackend.COMPILED,
+        capture=CapturePolicy.DIGEST,
+        thread_safe=True,
+        instrument=True,
+    ),
+}
+
+# The default config is tracked with a ContextVar, so that it applies to the thread or task which set it, and the
+# tasks it starts, without leaking into mocks made concurrently elsewhere.
+_default: ContextVar[MockConfig] = ContextVar("typemock_default_config", default=_BUILT_IN)
+
+
+def _as_config(config: "MockConfig | str") -> MockConfig:
+    if isinstance(config, MockConfig):
+        return config
+    try:
+        return PROFILES[config]
+    except KeyError:
+        raise MockingError(
+            "Unknown config profile '{}'. Profiles are: {}".format(config, sorted(PROFILES))
+        ) from None
+
+
+def _current_default() -> MockConfig:
+    return _default.get()
+
+
+@contextmanager
+def _default_config(config: "MockConfig | str") -> Generator[MockConfig, None, None]:
+    """
+    Makes a config, or named profile, the default for mocks made within the context, by the current thread or task,
+    and the tasks it starts. Other threads only see it if they run in a copy of the context, as with
+    `asyncio.to_thread` or `contextvars.copy_context().run`.
+
+    Settings it leaves as None are taken from the default in effect outside the context.
+
+    Examples:
+
+        with default_config("fast"):
+            run_load_test()
+
+    Args:
+        config: A config, or the name of a profile.
+
+    Yields:
+        The default config in effect within the context.
+    """
+    default = _as_config(config).over(_current_default())
+    token = _default.set(default)
+    try:
+        yield default
+    finally:
+        _default.reset(token)
+
+
+def _mock_config(config: "MockConfig | str | None", explicit: MockConfig) -> MockConfig:
+    """
+    The config of a new mock: the settings given explicitly, over the config or profile given, over the default.
+    """
+    resolved = _current_default()
+    if config is not None:
+        resolved = _as_config(config).over(resolved)
+    return explicit.over(resolved)
+
+
+def _configured_members(config: "MockConfig | str | None", explicit: MockConfig) -> set[str]:
+    """
+    The names of the members of a new mock given overrides by its config, or explicitly. Those of the default config,
+    which applies to mocks of any class, are not included.
+    """
+    names = set(explicit.members)
+    if config is not None:
+        names.update(_as_config(config).members)
+    return names
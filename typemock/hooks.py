@@ -0,0 +1,69 @@
+from collections.abc import Callable
+from typing import Any
+
+from typemock._mock.hooks import (
+    CALL,
+    MISS,
+    SETUP,
+    TYPE_ERROR,
+    CallEvent,
+    MissEvent,
+    MockEvent,
+    SetupEvent,
+    Subscription,
+    TypeErrorEvent,
+    subscribe,
+)
+from typemock._mock.hooks import flush as _flush
+
+__all__ = [
+    "CallEvent",
+    "MissEvent",
+    "MockEvent",
+    "SetupEvent",
+    "Subscription",
+    "TypeErrorEvent",
+    "flush",
+    "on_call",
+    "on_miss",
+    "on_setup",
+    "on_type_error",
+]
+
+
+def on_call(callback: Callable[[Any], Any], batch_size: int | None = None) -> Subscription:
+    """
+    Subscribes to every call to a method of a mock, and every get and set of an attribute, with a `CallEvent` once
+    it has returned or raised.
+
+    With a batch size, the callback is given lists of events rather than each event.
+    """
+    return subscribe(CALL, callback, batch_size)
+
+
+def on_miss(callback: Callable[[Any], Any], batch_size: int | None = None) -> Subscription:
+    """
+    Subscribes to calls with no behaviour specified, which raise a `NoBehaviourSpecifiedError`, with a `MissEvent`.
+    """
+    return subscribe(MISS, callback, batch_size)
+
+
+def on_type_error(callback: Callable[[Any], Any], batch_size: int | None = None) -> Subscription:
+    """
+    Subscribes to calls, gets and sets which break the type hints of a mock, with a `TypeErrorEvent`.
+    """
+    return subscribe(TYPE_ERROR, callback, batch_size)
+
+
+def on_setup(callback: Callable[[Any], Any], batch_size: int | None = None) -> Subscription:
+    """
+    Subscribes to behaviour being specified for a mock, with a `SetupEvent`.
+    """
+    return subscribe(SETUP, callback, batch_size)
+
+
+def flush() -> None:
+    """
+    Delivers the partly filled batches of every batched subscription.
+    """
+    _flush()
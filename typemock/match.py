@@ -1,6 +1,12 @@
+import re
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterable, Sized
+from typing import Any, Generic, TypeVar
+
+from typemock.api import MockingError
+
+T = TypeVar("T")
 
 
 class Matcher(ABC):
@@ -8,6 +14,47 @@ class Matcher(ABC):
     def matches(self, other: Any) -> bool:
         pass
 
+    def index_values(self) -> frozenset | None:
+        """
+        The values this matcher can match, if they are few and hashable, so that behaviour specified with it can be
+        indexed by them. None if the matcher can match values which cannot be listed.
+        """
+        return None
+
+    def same_as(self, other: "Matcher") -> bool:
+        """
+        Whether the other matcher is the same as this one, so that behaviour specified with it replaces this one's.
+        """
+        return type(self) is type(other) and self == other
+
+
+class PrecompiledMatcher(Matcher):
+    """
+    A matcher which does all of its preparation, such as compiling a pattern or building a set, when it is made, so
+    that matching is as cheap as possible.
+
+    Matchers are equal to the values they match. Two matchers are equal if they are of the same type, and were made
+    with the same arguments.
+    """
+
+    def __init__(self, *identity: Any) -> None:
+        self._identity = identity
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Matcher):
+            return isinstance(other, PrecompiledMatcher) and (
+                type(self) is type(other) and self._identity == other._identity
+            )
+        return self.matches(other)
+
+    def __hash__(self) -> int:
+        return hash(self.__class__)
+
+    def __repr__(self) -> str:
+        return "{}({})".format(self._name, ", ".join(repr(i) for i in self._identity))
+
+    _name = "matcher"
+
 
 class MatchAny(Matcher):
     def matches(self, other: Any) -> bool:
@@ -19,16 +66,26 @@ class MatchAny(Matcher):
     def __hash__(self) -> int:
         return hash(self.__class__)
 
+    def __repr__(self) -> str:
+        return "anything()"
+
 
 class InstanceMatcher(Matcher):
     def __init__(self, expected_type: type | Callable[[], type]) -> None:
         self.expected_type = expected_type
+        self._resolved_type: type | None = (
+            expected_type if isinstance(expected_type, type) else None
+        )
 
     def matches(self, other: Any) -> bool:
-        expected_type = (
-            self.expected_type if isinstance(self.expected_type, type) else self.expected_type()
-        )
-        return isinstance(other, expected_type)
+        resolved_type = self._resolved_type
+        if resolved_type is None:
+            # A callable is resolved once, on first use, as it may refer to a type which is defined later.
+            resolved_type = self._resolved_type = self.expected_type()
+        return isinstance(other, resolved_type)
+
+    def same_as(self, other: Matcher) -> bool:
+        return isinstance(other, InstanceMatcher) and self.expected_type == other.expected_type
 
     def __eq__(self, other: object) -> bool:
         return self.matches(other)
@@ -36,6 +93,11 @@ class InstanceMatcher(Matcher):
     def __hash__(self) -> int:
         return hash(self.__class__)
 
+    def __repr__(self) -> str:
+        return "instance_of({})".format(
+            getattr(self.expected_type, "__qualname__", self.expected_type)
+        )
+
 
 _MATCH_ANY = MatchAny()
 
@@ -52,3 +114,306 @@ def instance_of[T](expected_type: type[T]) -> T:
     Returns a matcher that will match any instance of the given type.
     """
     return InstanceMatcher(expected_type)  # type: ignore[return-value]
+
+
+class OneOfMatcher(PrecompiledMatcher):
+    _name = "one_of"
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        values = tuple(values)
+        super().__init__(values)
+        try:
+            self._set: frozenset | None = frozenset(values)
+        except TypeError:
+            self._set = None
+        self._values = values
+
+    def matches(self, other: Any) -> bool:
+        value_set = self._set
+        if value_set is not None:
+            try:
+                return other in value_set
+            except TypeError:
+                pass
+        return other in self._values
+
+    def index_values(self) -> frozenset | None:
+        return self._set
+
+
+class BetweenMatcher(PrecompiledMatcher):
+    _name = "between"
+
+    def __init__(self, low: Any, high: Any) -> None:
+        super().__init__(low, high)
+        self._low = low
+        self._high = high
+
+    def matches(self, other: Any) -> bool:
+        try:
+            return self._low <= other <= self._high
+        except TypeError:
+            return False
+
+
+class RegexMatcher(PrecompiledMatcher):
+    _name = "regex"
+
+    def __init__(self, pattern: str | re.Pattern, flags: int = 0) -> None:
+        super().__init__(pattern, flags)
+        self._search = re.compile(pattern, flags).search
+
+    def matches(self, other: Any) -> bool:
+        return isinstance(other, str) and self._search(other) is not None
+
+
+class PrefixMatcher(PrecompiledMatcher):
+    _name = "has_prefix"
+
+    def __init__(self, prefix: str | bytes) -> None:
+        super().__init__(prefix)
+        self._prefix: Any = prefix
+        self._type = type(prefix)
+
+    def matches(self, other: Any) -> bool:
+        return isinstance(other, self._type) and other.startswith(self._prefix)
+
+
+class LenBetweenMatcher(PrecompiledMatcher):
+    _name = "len_between"
+
+    def __init__(self, low: int, high: int) -> None:
+        super().__init__(low, high)
+        self._low = low
+        self._high = high
+
+    def matches(self, other: Any) -> bool:
+        return isinstance(other, Sized) and self._low <= len(other) <= self._high
+
+
+class PredicateMatcher(PrecompiledMatcher):
+    _name = "lambda_"
+
+    def __init__(self, predicate: Callable[[Any], bool]) -> None:
+        super().__init__(predicate)
+        self._predicate = predicate
+
+    def matches(self, other: Any) -> bool:
+        return bool(self._predicate(other))
+
+
+def _as_matcher(value: Any) -> Matcher:
+    if isinstance(value, Matcher):
+        return value
+    return OneOfMatcher((value,))
+
+
+class AllOfMatcher(PrecompiledMatcher):
+    _name = "all_of"
+
+    def __init__(self, matchers: Iterable[Any]) -> None:
+        matchers = tuple(_as_matcher(m) for m in matchers)
+        super().__init__(*matchers)
+        self._matches = tuple(m.matches for m in matchers)
+        self._index_values: frozenset | None = None
+        for matcher in matchers:
+            values = matcher.index_values()
+            if values is not None and (
+                self._index_values is None or len(values) < len(self._index_values)
+            ):
+                self._index_values = values
+
+    def matches(self, other: Any) -> bool:
+        for matches in self._matches:
+            if not matches(other):
+                return False
+        return True
+
+    def index_values(self) -> frozenset | None:
+        return self._index_values
+
+
+class AnyOfMatcher(PrecompiledMatcher):
+    _name = "any_of"
+
+    def __init__(self, matchers: Iterable[Any]) -> None:
+        matchers = tuple(_as_matcher(m) for m in matchers)
+        super().__init__(*matchers)
+        self._matches = tuple(m.matches for m in matchers)
+        values: frozenset | None = frozenset()
+        for matcher in matchers:
+            matcher_values = matcher.index_values()
+            if matcher_values is None:
+                values = None
+                break
+            values = values | matcher_values
+        self._index_values = values
+
+    def matches(self, other: Any) -> bool:
+        for matches in self._matches:
+            if matches(other):
+                return True
+        return False
+
+    def index_values(self) -> frozenset | None:
+        return self._index_values
+
+
+def one_of[T](values: Iterable[T]) -> T:
+    """
+    Returns a matcher that will match any of the given values.
+
+    Behaviour specified with it is indexed by the values, so looking it up does not need to test every matcher.
+    """
+    return OneOfMatcher(values)  # type: ignore[return-value]
+
+
+def between[T](low: T, high: T) -> T:
+    """
+    Returns a matcher that will match any value from low to high, inclusive.
+    """
+    return BetweenMatcher(low, high)  # type: ignore[return-value]
+
+
+def regex(pattern: str | re.Pattern, flags: int = 0) -> str:
+    """
+    Returns a matcher that will match any string which the pattern is found in. Anchor the pattern to match whole
+    strings.
+    """
+    return RegexMatcher(pattern, flags)  # type: ignore[return-value]
+
+
+def has_prefix[T: (str, bytes)](prefix: T) -> T:
+    """
+    Returns a matcher that will match any string, or bytes, which starts with the prefix.
+    """
+    return PrefixMatcher(prefix)  # type: ignore[return-value]
+
+
+def len_between(low: int, high: int) -> Any:
+    """
+    Returns a matcher that will match any value with a length from low to high, inclusive.
+    """
+    return LenBetweenMatcher(low, high)
+
+
+def lambda_[T](predicate: Callable[[T], bool]) -> T:
+    """
+    Returns a matcher that will match any value the predicate is true for.
+    """
+    return PredicateMatcher(predicate)  # type: ignore[return-value]
+
+
+def all_of[T](*matchers: T) -> T:
+    """
+    Returns a matcher that will match values which all of the given matchers match. Values are matched by equality.
+    """
+    return AllOfMatcher(matchers)  # type: ignore[return-value]
+
+
+def any_of[T](*matchers: T) -> T:
+    """
+    Returns a matcher that will match values which any of the given matchers match. Values are matched by equality.
+    """
+    return AnyOfMatcher(matchers)  # type: ignore[return-value]
+
+
+class Captor(Matcher, Generic[T]):
+    """
+    A matcher which captures the args it matches, in calls which match as a whole, either to behaviour specified with
+    it in `when`, or to a verification with it.
+
+    By default, every captured arg is kept. To bound what is kept in long running scenarios, keep only the `first` or
+    `last` given number of them.
+
+    Examples:
+
+        sql = match.captor[str](last=10)
+
+        with tmock(Database) as db:
+            when(db.execute(sql)).then_return(None)
+
+        run_scenario(db)
+
+        assert sql.value.startswith("INSERT")
+
+    """
+
+    def __init__(
+        self, matching: Any = None, first: int | None = None, last: int | None = None
+    ) -> None:
+        if first is not None and last is not None:
+            raise MockingError("A captor can keep the first or last args it captures, not both.")
+        for capacity in (first, last):
+            if capacity is not None and capacity < 1:
+                raise MockingError(
+                    "A captor must keep at least 1 arg, but was given: {}".format(capacity)
+                )
+        self._matcher = None if matching is None else _as_matcher(matching)
+        self._first = first
+        self._values: list[T] | deque[T] = deque(maxlen=last) if last is not None else []
+
+    def matches(self, other: Any) -> bool:
+        matcher = self._matcher
+        return matcher is None or matcher.matches(other)
+
+    def capture(self, value: T) -> None:
+        first = self._first
+        if first is not None and len(self._values) >= first:
+            return
+        self._values.append(value)
+
+    @property
+    def values(self) -> list[T]:
+        """
+        The captured args, in the order they were captured.
+        """
+        return list(self._values)
+
+    @property
+    def value(self) -> T:
+        """
+        The last captured arg.
+        """
+        if not self._values:
+            raise MockingError("Nothing has been captured.")
+        return self._values[-1]
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Matcher):
+            return self is other
+        return self.matches(other)
+
+    def __hash__(self) -> int:
+        return id(self)
+
+    def same_as(self, other: Matcher) -> bool:
+        return self is other
+
+    def __repr__(self) -> str:
+        return "captor({})".format("" if self._matcher is None else repr(self._matcher))
+
+
+captor = Captor
+
+
+def has_captors(call: tuple[tuple[str, Any], ...]) -> bool:
+    for _, value in call:
+        if isinstance(value, Captor):
+            return True
+    return False
+
+
+def capture_args(expected: tuple[tuple[str, Any], ...], call: tuple[tuple[str, Any], ...]) -> None:
+    """
+    Captures the args of a call, which matched the expected call, into the captors of the expected call.
+    """
+    for (_, expected_value), (_, value) in zip(expected, call):
+        if isinstance(expected_value, Captor):
+            expected_value.capture(value)
@@ -0,0 +1,38 @@
+from collections.abc import Callable
+from typing import Any
+
+from typemock._mock.responders import (
+    Fault,
+    Responder,
+    ResponderBasic,
+    ResponderDelayed,
+    ResponderRaise,
+    ResponderRaiseNew,
+    outcome_responder,
+)
+from typemock._mock.timing import Delay, DelaySource
+
+__all__ = ["Fault", "delayed", "raises", "returns"]
+
+
+def returns(value: Any) -> Responder:
+    """
+    An outcome which returns the value. Plain values given as outcomes are returned too.
+    """
+    return ResponderBasic(value)
+
+
+def raises(error: Exception | Callable[[], BaseException]) -> Responder:
+    """
+    An outcome which raises an error. Given an exception class, or other factory, a new error is raised each time.
+    """
+    if isinstance(error, Exception):
+        return ResponderRaise(error)
+    return ResponderRaiseNew(error)
+
+
+def delayed(delay: DelaySource, outcome: Any) -> Responder:
+    """
+    An outcome of an async method, which is given once the delay, in seconds or drawn from a distribution, has passed.
+    """
+    return ResponderDelayed(Delay(delay), outcome_responder(outcome))
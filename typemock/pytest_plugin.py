@@ -0,0 +1,121 @@
+"""
+A pytest plugin which reports, after a test run, the stubs of typemock mocks which were never hit, the most hit stubs
+and the calls with no stub, per mocked class and method.
+
+Enable it with:
+
+    pytest --typemock-stub-report
+
+    pytest --typemock-stub-report=stub-usage.json  # Also writes the report as JSON.
+
+With pytest-xdist, each worker writes the usage it counted to a file in a local directory, and the controller
+merges them into one report once the workers are done.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from typemock._mock import usage
+from typemock._mock.usage import StubUsageReport
+
+_USAGE_DIR = ".typemock_stub_usage"
+_DEFAULT = "-"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("typemock")
+    group.addoption(
+        "--typemock-stub-report",
+        action="store",
+        nargs="?",
+        const=_DEFAULT,
+        default=None,
+        metavar="PATH",
+        help="Report unused stubs, the hottest stubs and misses of typemock mocks, optionally also as JSON to PATH.",
+    )
+    group.addoption(
+        "--typemock-stub-report-top",
+        action="store",
+        type=int,
+        default=10,
+        help="How many of the hottest stubs to report.",
+    )
+
+
+def _enabled(config: pytest.Config) -> bool:
+    return config.getoption("typemock_stub_report") is not None
+
+
+def _worker_id(config: pytest.Config) -> str | None:
+    workerinput: dict[str, Any] | None = getattr(config, "workerinput", None)
+    return None if workerinput is None else workerinput["workerid"]
+
+
+def _usage_dir(config: pytest.Config) -> Path:
+    return Path(config.rootpath) / _USAGE_DIR
+
+
+def write_worker_usage(directory: Path, worker_id: str, report: StubUsageReport) -> Path:
+    """
+    Writes the usage counted by a worker into the directory shared by the workers of a run.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "{}.json".format(worker_id)
+    partial_path = path.with_suffix(".partial")
+    partial_path.write_text(report.dumps())
+    os.replace(partial_path, path)
+    return path
+
+
+def merge_worker_usage(directory: Path, report: StubUsageReport) -> StubUsageReport:
+    """
+    Merges the usage written by every worker of a run into the report.
+    """
+    for path in sorted(directory.glob("*.json")):
+        report.merge(StubUsageReport.from_dict(json.loads(path.read_text())))
+    return report
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not _enabled(config):
+        return
+    if _worker_id(config) is None:
+        shutil.rmtree(_usage_dir(config), ignore_errors=True)
+    usage.start()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    config = session.config
+    if not _enabled(config):
+        return
+    usage.stop()
+    report = usage.collect()
+    worker_id = _worker_id(config)
+    if worker_id is not None:
+        write_worker_usage(_usage_dir(config), worker_id, report)
+        return
+    directory = _usage_dir(config)
+    if directory.exists():
+        merge_worker_usage(directory, report)
+        shutil.rmtree(directory, ignore_errors=True)
+    config.stash[_report_key] = report
+    path: str = config.option.typemock_stub_report
+    if path != _DEFAULT:
+        Path(path).write_text(report.dumps() + "\n")
+
+
+_report_key = pytest.StashKey[StubUsageReport]()
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    report = config.stash.get(_report_key, None)
+    if report is None:
+        return
+    hottest: int = config.option.typemock_stub_report_top
+    terminalreporter.write_sep("=", "typemock stub usage")
+    terminalreporter.write_line(report.format(hottest))